@@ -0,0 +1,89 @@
+"""
+Microbenchmarks of model parsing on synthetic API responses.
+
+Times each construction path for OrderModel, RewardModel, InvoiceModel and ProductModel
+and measures the memory retained per parsed object::
+
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --scale 0.1 --repeat 3
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pydantic import TypeAdapter
+
+import fixtures
+from tremendous import InvoiceModel, OrderModel, ProductModel, RewardModel
+
+
+def cases(scale: float):
+    def n(count: int) -> int:
+        return max(1, int(count * scale))
+
+    return [
+        ("orders page", OrderModel, fixtures.items(fixtures.orders_response(n(1000), rewards_per_order=1))),
+        ("rewards page", RewardModel, fixtures.items(fixtures.rewards_response(n(1000), products_per_reward=1))),
+        ("product catalog", ProductModel, fixtures.items(fixtures.products_response(n(2000)))),
+        ("invoice, 10k rewards", InvoiceModel, [fixtures.items(fixtures.invoice_response(orders=n(100), rewards=n(10_000)))]),
+    ]
+
+def paths(model_cls, items: List[dict]):
+    raw_items = [json.dumps(item).encode() for item in items]
+    raw_page = json.dumps(items).encode()
+    adapter = TypeAdapter(List[model_cls])
+    return [
+        ("model_cls(**data)", lambda: [model_cls(**item) for item in items]),
+        ("model_validate", lambda: [model_cls.model_validate(item) for item in items]),
+        ("model_validate_json", lambda: [model_cls.model_validate_json(raw) for raw in raw_items]),
+        ("TypeAdapter.validate_json (page)", lambda: adapter.validate_json(raw_page)),
+        ("json.loads + model_cls(**data)", lambda: [model_cls(**item) for item in json.loads(raw_page)]),
+        ("model_construct (no validation)", lambda: [model_cls.model_construct(**item) for item in items]),
+    ]
+
+def best_time(fn: Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def retained_bytes(fn: Callable) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier applied to every fixture size")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per path; the best is reported")
+    args = parser.parse_args()
+
+    print(f"{'case':<22} {'path':<34} {'objects':>8} {'total ms':>10} {'us/object':>10} {'KiB/object':>11}")
+    for name, model_cls, items in cases(args.scale):
+        for path, fn in paths(model_cls, items):
+            seconds = best_time(fn, args.repeat)
+            memory = retained_bytes(fn)
+            count = len(items)
+            print(
+                f"{name:<22} {path:<34} {count:>8} {seconds * 1000:>10.2f} "
+                f"{seconds / count * 1e6:>10.1f} {memory / count / 1024:>11.2f}"
+            )
+
+if __name__ == "__main__":
+    main()
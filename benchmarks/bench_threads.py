@@ -0,0 +1,119 @@
+"""
+Stress benchmark of one client shared by many threads, against a local HTTP server.
+
+Compares a single ``requests.Session`` shared by every thread (the client's behaviour when
+a session is passed in) with the client's default per-thread sessions over one shared
+connection pool. Reports throughput, latency percentiles and how many connections the
+server had to accept::
+
+    python benchmarks/bench_threads.py
+    python benchmarks/bench_threads.py --threads 64 --requests 200 --delay 0.002
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+import fixtures
+from tremendous import TremendousClient
+
+
+def serve(delay: float, port, ready) -> None:
+    body = json.dumps({"reward": fixtures.rewards_response(1)["rewards"][0]}).encode()
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            connections.add(self.client_address)
+            payload = body
+            if self.path == "/connections":
+                payload = json.dumps(len(connections)).encode()
+            elif delay:
+                time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port.value = server.server_port
+    ready.set()
+    server.serve_forever()
+
+def run(client: TremendousClient, threads: int, requests_per_thread: int) -> List[float]:
+    latencies: List[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker() -> None:
+        mine = []
+        barrier.wait()
+        for index in range(requests_per_thread):
+            started = time.perf_counter()
+            client.Rewards.get(f"RWD{index:06d}")
+            mine.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(mine)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return latencies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=64, help="threads sharing the client")
+    parser.add_argument("--requests", type=int, default=100, help="requests sent by each thread")
+    parser.add_argument("--delay", type=float, default=0.001, help="server-side delay per request, in seconds")
+    args = parser.parse_args()
+
+    print(f"{'mode':<26} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'connections':>12}")
+    for mode in ("shared session", "per-thread sessions"):
+        # The server runs in its own process so that it does not compete for the GIL
+        port, ready = multiprocessing.Value("i", 0), multiprocessing.Event()
+        server = multiprocessing.Process(target=serve, args=(args.delay, port, ready), daemon=True)
+        server.start()
+        ready.wait()
+        client = TremendousClient(
+            api_key="bench",
+            session=requests.Session() if mode == "shared session" else None,
+            pool_maxsize=args.threads,
+        )
+        client.base_url = f"http://127.0.0.1:{port.value}/v2"
+        started = time.perf_counter()
+        latencies = sorted(run(client, args.threads, args.requests))
+        elapsed = time.perf_counter() - started
+        connections = requests.get(f"http://127.0.0.1:{port.value}/connections").json() - 1
+        server.terminate()
+        print(
+            f"{mode:<26} {len(latencies) / elapsed:>9.0f} {latencies[len(latencies) // 2] * 1000:>8.2f} "
+            f"{latencies[int(len(latencies) * 0.99)] * 1000:>8.2f} {latencies[-1] * 1000:>8.2f} {connections:>12}"
+        )
+        stats = client.stats()
+        assert stats.requests == len(latencies), (stats.requests, len(latencies))
+
+if __name__ == "__main__":
+    main()
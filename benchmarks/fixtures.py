@@ -0,0 +1,116 @@
+"""
+Synthetic Tremendous API responses at configurable scale.
+
+Every generator is seeded, so the same arguments always produce the same payload.
+"""
+
+import random
+import string
+from typing import Dict, List
+
+PRODUCT_CATEGORIES = ["merchant_card", "visa_card", "ach", "charity", "paypal"]
+DELIVERY_STATUSES = ["SUCCEEDED", "PENDING", "FAILED", "SCHEDULED"]
+ORDER_STATUSES = ["EXECUTED", "PENDING APPROVAL", "CANCELED", "FAILED"]
+COUNTRIES = ["US", "CA", "GB", "DE", "FR", "AU", "MX", "PR"]
+
+
+def _id(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_uppercase + string.digits, k=12))
+
+def _timestamp(rng: random.Random) -> str:
+    return f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z"
+
+def product(rng: random.Random) -> Dict:
+    return {
+        "id": _id(rng),
+        "name": f"Gift Card {rng.randint(1, 9999)}",
+        "description": "Redeemable online and in stores. " * rng.randint(1, 8),
+        "category": rng.choice(PRODUCT_CATEGORIES),
+        "subcategory": "food_and_drink",
+        "disclosure": "Terms and conditions apply. " * rng.randint(1, 20),
+        "skus": [{"min": 5.0, "max": float(rng.choice([100, 250, 500, 2000]))}],
+        "currency_codes": ["USD"],
+        "countries": [{"abbr": country} for country in rng.sample(COUNTRIES, rng.randint(1, len(COUNTRIES)))],
+        "images": [
+            {"src": f"https://cdn.example.com/{_id(rng)}.png", "type": "card", "content_type": "image/png"},
+            {"src": f"https://cdn.example.com/{_id(rng)}.png", "type": "logo", "content_type": "image/png"},
+        ],
+        "usage_instructions": "Present the code at checkout.",
+        "documents": {"privacy_policy_url": "https://example.com/privacy"},
+    }
+
+def reward(rng: random.Random, order_id: str = None, products: int = 1) -> Dict:
+    return {
+        "id": _id(rng),
+        "order_id": order_id or _id(rng),
+        "created_at": _timestamp(rng),
+        "campaign_id": _id(rng),
+        "value": {"denomination": float(rng.choice([5, 10, 25, 50, 100])), "currency_code": "USD"},
+        "delivery": {"method": "EMAIL", "status": rng.choice(DELIVERY_STATUSES)},
+        "recipient": {"name": "Jane Doe", "email": f"user{rng.randint(1, 10**6)}@example.com", "phone": "+15555550100"},
+        "products": [product(rng) for _ in range(products)],
+    }
+
+def order(rng: random.Random, rewards: int = 1, reward_products: int = 0) -> Dict:
+    order_id = _id(rng)
+    embedded = [reward(rng, order_id, reward_products) for _ in range(rewards)]
+    subtotal = sum(item["value"]["denomination"] for item in embedded)
+    return {
+        "id": order_id,
+        "external_id": _id(rng),
+        "campaign_id": _id(rng),
+        "created_at": _timestamp(rng),
+        "status": rng.choice(ORDER_STATUSES),
+        "channel": "API",
+        "payment": {"subtotal": subtotal, "total": subtotal, "fees": 0.0, "discount": 0.0, "refund": None},
+        "invoice_id": None,
+        "rewards": embedded,
+    }
+
+def invoice(rng: random.Random, orders: int = 10, rewards: int = 100) -> Dict:
+    return {
+        "id": _id(rng),
+        "po_number": str(rng.randint(1000, 9999)),
+        "amount": float(rng.randint(1000, 10**6)),
+        "international": False,
+        "status": "PAID",
+        "orders": [order(rng, rewards=1) for _ in range(orders)],
+        "rewards": [reward(rng, products=0) for _ in range(rewards)],
+        "created_at": _timestamp(rng),
+        "paid_at": _timestamp(rng),
+    }
+
+def products_response(count: int = 2000, seed: int = 0) -> Dict:
+    """
+    A ``GET /products`` response with ``count`` products.
+    """
+    rng = random.Random(seed)
+    return {"products": [product(rng) for _ in range(count)]}
+
+def orders_response(count: int = 100, rewards_per_order: int = 1, seed: int = 0) -> Dict:
+    """
+    A ``GET /orders`` response with ``count`` orders.
+    """
+    rng = random.Random(seed)
+    return {"orders": [order(rng, rewards=rewards_per_order) for _ in range(count)], "total_count": count}
+
+def rewards_response(count: int = 100, products_per_reward: int = 1, seed: int = 0) -> Dict:
+    """
+    A ``GET /rewards`` response with ``count`` rewards.
+    """
+    rng = random.Random(seed)
+    return {"rewards": [reward(rng, products=products_per_reward) for _ in range(count)], "total_count": count}
+
+def invoice_response(orders: int = 100, rewards: int = 10_000, seed: int = 0) -> Dict:
+    """
+    A ``GET /invoices/{id}`` response embedding ``orders`` orders and ``rewards`` rewards.
+    """
+    rng = random.Random(seed)
+    return {"invoice": invoice(rng, orders=orders, rewards=rewards)}
+
+def items(response: Dict) -> List[Dict]:
+    """
+    The resource list (or single resource) inside a response.
+    """
+    (value,) = [value for key, value in response.items() if key != "total_count"]
+    return value
@@ -6,9 +6,21 @@ __version__ = "0.1.0"
 __author__ = "Kyle Kopelke"
 
 from .client import TremendousClient 
+from .metrics import ClientStatsModel
+from .exceptions import (
+    TremendousError,
+    InvalidRequestError,
+    AuthenticationError,
+    InsufficientFundsError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    CircuitOpenError
+)
+from .circuit_breaker import CircuitBreaker
 from .products import Products, ProductModel
 from .rewards import Rewards, RewardModel
-from .orders import Orders, OrderModel
+from .orders import Orders, OrderModel, OrderSpecValidator, OrderSpecError, CompiledOrderModel, OrderPacker
 from .campaigns import Campaigns, CampaignModel
 from .funding_sources import FundingSources, FundingSourceModel
 from .invoices import Invoices, InvoiceModel
@@ -18,5 +30,18 @@ from .organizations import Organizations, OrganizationModel
 from .members import Members, MemberModel
 from .roles import Roles, RoleModel
 from .fields import Fields, FieldModel
-from .webhooks import Webhooks, WebhookModel    
-from .forex import Forex, ForexModel
\ No newline at end of file
+from .webhooks import Webhooks, WebhookModel, EventJournal, JournalConsumer, WebhookLoadGenerator
+from .forex import Forex, ForexModel
+from .pagination import paginate, PageSizeController, TimeWindowWalker
+from .forecasting import BalanceForecaster, ForecastModel
+from .reconciliation import ReconciliationIndex, ReconciliationReportModel
+from .rate_limit import TokenBucket, PriorityScheduler
+from .pool import ClientPool
+from .jobs import OrderQueue, OrderScheduler
+from .pipeline import ParsePipeline
+from .cache import ModelCache, ResourceCache, ResponseCache
+from .analytics import CampaignAggregator, CampaignStatsModel
+from .ledger import RewardLedger, DuplicateModel
+from .sync import ConfigSync, SnapshotDiffModel, SyncActionModel
+from .transport import RecordingTransport, ReplayTransport, HedgingTransport
+from .catalog import CatalogWatcher, CatalogChangeModel
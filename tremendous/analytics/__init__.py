@@ -0,0 +1,5 @@
+from .campaigns import (
+    CampaignAggregator,
+    CampaignStatsModel,
+    DenominationSketch
+)
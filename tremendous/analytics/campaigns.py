@@ -0,0 +1,285 @@
+import json
+import math
+from pydantic import BaseModel
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+from tremendous.orders.order import OrderModel
+from tremendous.pagination import paginate
+from tremendous.rewards.reward import RewardModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+# Delivery statuses a reward never leaves
+FINAL_DELIVERY_STATUSES = {"SUCCEEDED"}
+
+class DenominationSketch(BaseModel):
+    """
+    Mergeable quantile sketch over reward denominations.
+
+    Values are counted in logarithmic buckets, so any quantile is answered within
+    ``relative_accuracy`` of the true value using a few dozen counters regardless of how
+    many rewards were seen.
+    """
+    relative_accuracy: float = 0.01
+    counts: Dict[int, int] = {}
+    zeros: int = 0
+    count: int = 0
+
+    @property
+    def _gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        bucket = math.ceil(math.log(value, self._gamma))
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        The approximate ``q`` quantile (0 to 1) of the values added so far.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if rank < seen:
+                return 2 * self._gamma ** bucket / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.counts) / (self._gamma + 1)
+
+class CampaignStatsModel(BaseModel):
+    """
+    Running aggregates of one campaign.
+
+    Attributes:
+        campaign_id (str): The campaign.
+        orders (int): Number of orders.
+        rewards (int): Number of rewards.
+        spend (float): Sum of reward denominations.
+        paid (float): Sum of order payment totals, including fees.
+        delivery_status (Dict[str, int]): Rewards per ``DeliveryModel.status``, as of the last status seen for each.
+        delivery_method (Dict[str, int]): Rewards per ``DeliveryModel.method``.
+        products (Dict[str, int]): Rewards per product ID.
+        denominations (DenominationSketch): Distribution of reward denominations.
+    """
+    campaign_id: str
+    orders: int = 0
+    rewards: int = 0
+    spend: float = 0.0
+    paid: float = 0.0
+    delivery_status: Dict[str, int] = {}
+    delivery_method: Dict[str, int] = {}
+    products: Dict[str, int] = {}
+    denominations: DenominationSketch = DenominationSketch()
+
+    @property
+    def failure_rate(self) -> float:
+        return self.delivery_status.get("FAILED", 0) / self.rewards if self.rewards else 0.0
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        The approximate ``p``-th percentile (0 to 100) of reward denominations.
+        """
+        return self.denominations.quantile(p / 100)
+
+class CampaignAggregator:
+    """
+    Incrementally maintained per-campaign spend, delivery and product-mix aggregates.
+
+    Orders are streamed once and folded into running aggregates. The aggregator remembers
+    the newest ``created_at`` it has seen, so ``update`` on a saved state only pulls orders
+    created since the previous run instead of re-scanning the whole history. The watermark
+    belongs to the ``campaign_id`` filter of the first update, so later updates must use the
+    same filter.
+
+    The last delivery status of every reward that can still change is kept, so a reward
+    seen again, e.g. through ``update_rewards`` with rewards refreshed from the API or a
+    webhook, moves between ``delivery_status`` counters instead of being counted twice.
+    Rewards are forgotten once delivered, which keeps the saved state small.
+
+    Args:
+        client (TremendousClient): The client used to list orders.
+        page_size (int, optional): Page size used when listing orders.
+
+    ```python
+    aggregator = CampaignAggregator.load(tremendous, "campaigns.json")
+    aggregator.update()
+    aggregator.save("campaigns.json")
+    for stats in aggregator.stats.values():
+        print(stats.campaign_id, stats.spend, stats.failure_rate, stats.percentile(95))
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", page_size: int = 100):
+        self.client = client
+        self.page_size = page_size
+        self.stats: Dict[str, CampaignStatsModel] = {}
+        self.watermark: Optional[str] = None
+        self._at_watermark: set = set()
+        # The ``campaign_id`` filter the watermark was reached with
+        self.campaign_id: Optional[str] = None
+        # Reward ID -> [campaign ID, last delivery status], for rewards not in a final status
+        self._reward_status: Dict[str, List[str]] = {}
+
+    def _set_status(self, stats: CampaignStatsModel, reward_id: str, status: str) -> None:
+        previous = self._reward_status.get(reward_id)
+        if previous is not None:
+            if previous[1] == status:
+                return
+            stats.delivery_status[previous[1]] -= 1
+            if not stats.delivery_status[previous[1]]:
+                del stats.delivery_status[previous[1]]
+        stats.delivery_status[status] = stats.delivery_status.get(status, 0) + 1
+        if status in FINAL_DELIVERY_STATUSES:
+            self._reward_status.pop(reward_id, None)
+        else:
+            self._reward_status[reward_id] = [stats.campaign_id, status]
+
+    def add_order(self, order: OrderModel) -> None:
+        """
+        Fold one order and its rewards into the aggregates.
+
+        Rewards already aggregated only have their delivery status updated.
+        """
+        campaign_id = order.campaign_id or ""
+        stats = self.stats.get(campaign_id)
+        if stats is None:
+            stats = self.stats[campaign_id] = CampaignStatsModel(campaign_id=campaign_id)
+        rewards = order.rewards or []
+        # An order seen again only brings status changes of its rewards
+        if not rewards or any(reward.id not in self._reward_status for reward in rewards):
+            stats.orders += 1
+            if order.payment and order.payment.total is not None:
+                stats.paid += order.payment.total
+        for reward in rewards:
+            if reward.id in self._reward_status:
+                self._set_status(stats, reward.id, reward.delivery.status)
+                continue
+            stats.rewards += 1
+            stats.spend += reward.value.denomination
+            stats.denominations.add(reward.value.denomination)
+            self._set_status(stats, reward.id, reward.delivery.status)
+            stats.delivery_method[reward.delivery.method] = stats.delivery_method.get(reward.delivery.method, 0) + 1
+            for product in reward.products:
+                stats.products[product.id] = stats.products.get(product.id, 0) + 1
+
+    def update_rewards(self, rewards: Iterable[RewardModel]) -> int:
+        """
+        Apply the current delivery status of rewards already aggregated.
+
+        Rewards that were never aggregated are ignored; they are counted with their order.
+
+        Returns:
+            int: The number of rewards whose status changed.
+        """
+        changed = 0
+        for reward in rewards:
+            previous = self._reward_status.get(reward.id)
+            if previous is None or previous[1] == reward.delivery.status:
+                continue
+            self._set_status(self.stats[previous[0]], reward.id, reward.delivery.status)
+            changed += 1
+        return changed
+
+    def add_orders(self, orders: Iterable[OrderModel]) -> int:
+        """
+        Fold orders into the aggregates, skipping any already counted.
+
+        Returns:
+            int: The number of orders added.
+        """
+        previous, at_previous = self.watermark, self._at_watermark
+        watermark, at_watermark = previous, set(at_previous)
+        added = 0
+        # Listings are newest first, so the watermark only moves once the stream is consumed
+        for order in orders:
+            if order.created_at is not None and previous is not None:
+                if order.created_at < previous:
+                    continue
+                if order.created_at == previous and order.id in at_previous:
+                    continue
+            self.add_order(order)
+            added += 1
+            if order.created_at is not None:
+                if watermark is None or order.created_at > watermark:
+                    watermark, at_watermark = order.created_at, set()
+                if order.created_at == watermark:
+                    at_watermark.add(order.id)
+        self.watermark, self._at_watermark = watermark, at_watermark
+        return added
+
+    def update(self, campaign_id: Optional[str] = None, created_at_lte: Optional[str] = None) -> int:
+        """
+        Pull and aggregate orders created since the last update.
+
+        Args:
+            campaign_id (str, optional): Only aggregate this campaign.
+            created_at_lte (str, optional): Only aggregate orders created at or before this time.
+
+        Returns:
+            int: The number of orders added.
+
+        Raises:
+            ValueError: If ``campaign_id`` differs from the filter of earlier updates, whose
+                watermark would skip (or recount) the orders of other campaigns.
+        """
+        if self.watermark is not None and campaign_id != self.campaign_id:
+            raise ValueError(
+                f"aggregator was updated with campaign_id={self.campaign_id!r}; use a separate aggregator per filter"
+            )
+        self.campaign_id = campaign_id
+        orders = paginate(
+            self.client.Orders.list,
+            page_size=self.page_size,
+            campaign_id=campaign_id,
+            created_at_gte=self.watermark,
+            created_at_lte=created_at_lte,
+        )
+        return self.add_orders(orders)
+
+    def state(self) -> Dict:
+        return {
+            "watermark": self.watermark,
+            "at_watermark": sorted(self._at_watermark),
+            "campaign_id": self.campaign_id,
+            "reward_status": self._reward_status,
+            "stats": {campaign_id: stats.model_dump() for campaign_id, stats in self.stats.items()},
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.state(), file)
+
+    @classmethod
+    def from_state(cls, client: "TremendousClient", state: Dict, page_size: int = 100) -> "CampaignAggregator":
+        aggregator = cls(client, page_size=page_size)
+        aggregator.watermark = state.get("watermark")
+        aggregator._at_watermark = set(state.get("at_watermark", []))
+        aggregator.campaign_id = state.get("campaign_id")
+        aggregator._reward_status = dict(state.get("reward_status", {}))
+        aggregator.stats = {
+            campaign_id: CampaignStatsModel.model_validate(stats)
+            for campaign_id, stats in state.get("stats", {}).items()
+        }
+        return aggregator
+
+    @classmethod
+    def load(cls, client: "TremendousClient", path: str, page_size: int = 100) -> "CampaignAggregator":
+        """
+        Restore a saved aggregator, or start a new one if ``path`` does not exist.
+        """
+        try:
+            with open(path) as file:
+                state = json.load(file)
+        except FileNotFoundError:
+            return cls(client, page_size=page_size)
+        return cls.from_state(client, state, page_size=page_size)
+
+    def campaigns(self) -> List[str]:
+        return sorted(self.stats)
@@ -0,0 +1,8 @@
+from .cache import (
+    ModelCache,
+    ResourceCache
+)
+from .http_cache import (
+    ResponseCache,
+    TERMINAL_STATES
+)
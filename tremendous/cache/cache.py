@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import OrderedDict
+from pydantic import BaseModel
+from typing import Callable, Dict, Hashable, Optional, Tuple, TYPE_CHECKING
+
+from tremendous.campaigns.campaigns import CampaignModel
+from tremendous.orders.order import OrderModel
+from tremendous.rewards.reward import RewardModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+    from tremendous.webhooks.journal import JournalConsumer
+
+ORDERS = "orders"
+REWARDS = "rewards"
+CAMPAIGNS = "campaigns"
+
+# Event types whose outcome is known from the event itself: (resource type, field updates)
+IN_PLACE_UPDATES = {
+    "REWARDS.DELIVERY.SUCCEEDED": (REWARDS, {"delivery": {"status": "SUCCEEDED"}}),
+    "REWARDS.DELIVERY.FAILED": (REWARDS, {"delivery": {"status": "FAILED"}}),
+    "ORDERS.FAILED": (ORDERS, {"status": "FAILED"}),
+}
+
+class ModelCache:
+    """
+    Thread-safe, size-bounded LRU cache of models with a fallback TTL.
+
+    Args:
+        ttl (float, optional): Seconds an entry stays valid without a change notification.
+            None keeps entries until they are invalidated or evicted.
+        max_entries (int, optional): Maximum number of entries kept.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: int = 100_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[BaseModel, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Keys being loaded by ``get_or_load``: loads in flight and writes since they started
+        self._loading: Dict[Hashable, int] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[BaseModel]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[1] is not None and entry[1] < time.monotonic()):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _changed(self, key: Hashable) -> None:
+        if key in self._loading:
+            self._generations[key] += 1
+
+    def _put(self, key: Hashable, model: BaseModel, ttl: Optional[float]) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (model, time.monotonic() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key: Hashable, model: BaseModel, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._changed(key)
+            self._put(key, model, ttl)
+
+    def peek(self, key: Hashable) -> Optional[BaseModel]:
+        """
+        The cached model regardless of expiry, without touching statistics.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry else None
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            self._changed(key)
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], BaseModel]) -> BaseModel:
+        """
+        The cached model, or the result of ``loader`` which is then cached.
+
+        The loaded model is only cached if the key was not invalidated or written while
+        it loaded, so a response fetched before a change notification never overwrites it.
+        """
+        model = self.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            self._loading[key] = self._loading.get(key, 0) + 1
+            generation = self._generations.setdefault(key, 0)
+        try:
+            model = loader()
+            with self._lock:
+                if self._generations[key] == generation:
+                    self._changed(key)
+                    self._put(key, model, None)
+        finally:
+            with self._lock:
+                self._loading[key] -= 1
+                if not self._loading[key]:
+                    del self._loading[key]
+                    del self._generations[key]
+        return model
+
+def _merge(model: BaseModel, updates: Dict) -> BaseModel:
+    values = {}
+    for field, value in updates.items():
+        current = getattr(model, field, None)
+        values[field] = _merge(current, value) if isinstance(value, dict) and isinstance(current, BaseModel) else value
+    return model.model_copy(update=values)
+
+class ResourceCache:
+    """
+    In-memory cache of orders, rewards and campaigns kept fresh by webhook events.
+
+    Reads go through the cache and only reach the API on a miss. Incoming webhook events
+    (the types returned by ``Webhooks.list_events``) either update the cached model in place
+    when the event carries the new state, such as ``REWARDS.DELIVERY.SUCCEEDED``, or
+    invalidate it (and the order embedding a changed reward) so the next read refetches it.
+    The TTL is only a fallback for missed notifications.
+
+    Args:
+        client (TremendousClient): The client used on cache misses.
+        ttl (float, optional): Fallback lifetime of entries, in seconds.
+        max_entries (int, optional): Maximum number of cached models.
+
+    ```python
+    cache = ResourceCache(tremendous, ttl=3600)
+    reward = cache.reward("REWARD_ID")
+
+    # In the webhook receiver, or from a journal consumer
+    cache.handle_event(event)
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", ttl: Optional[float] = 3600.0, max_entries: int = 100_000):
+        self.client = client
+        self.cache = ModelCache(ttl=ttl, max_entries=max_entries)
+        # Reward ID -> ID of the order embedding it, for rewards that are only cached inside an order
+        self._reward_orders: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _index(self, order: OrderModel) -> OrderModel:
+        with self._lock:
+            for reward in order.rewards or []:
+                self._reward_orders[reward.id] = order.id
+                self._reward_orders.move_to_end(reward.id)
+            while len(self._reward_orders) > self.cache.max_entries:
+                self._reward_orders.popitem(last=False)
+        return order
+
+    def reward(self, id: str) -> RewardModel:
+        return self.cache.get_or_load((REWARDS, id), lambda: self.client.Rewards.get(id))
+
+    def order(self, id: str) -> OrderModel:
+        return self.cache.get_or_load((ORDERS, id), lambda: self._index(self.client.Orders.get(id)))
+
+    def campaign(self, id: str) -> CampaignModel:
+        return self.cache.get_or_load((CAMPAIGNS, id), lambda: self.client.Campaigns.get(id))
+
+    def put(self, model: BaseModel) -> None:
+        """
+        Cache a model obtained elsewhere, e.g. from a list call.
+        """
+        if isinstance(model, OrderModel):
+            self.cache.put((ORDERS, model.id), self._index(model))
+            for reward in model.rewards or []:
+                self.cache.put((REWARDS, reward.id), reward)
+        elif isinstance(model, RewardModel):
+            self.cache.put((REWARDS, model.id), model)
+        elif isinstance(model, CampaignModel):
+            self.cache.put((CAMPAIGNS, model.id), model)
+        else:
+            raise TypeError(f"cannot cache {type(model).__name__}")
+
+    def handle_event(self, event: Dict) -> Optional[str]:
+        """
+        Apply a webhook event to the cache.
+
+        Args:
+            event (Dict): The decoded webhook request body.
+
+        Returns:
+            str: ``"updated"``, ``"invalidated"``, or None when the event concerns no cached resource type.
+        """
+        name = event.get("event") or ""
+        resource = (event.get("payload") or {}).get("resource") or {}
+        resource_id = resource.get("id")
+        resource_type = (resource.get("type") or name.split(".")[0]).lower()
+        if resource_id is None or resource_type not in (ORDERS, REWARDS, CAMPAIGNS):
+            return None
+        key = (resource_type, resource_id)
+        cached = self.cache.peek(key)
+
+        if resource_type == REWARDS:
+            # The embedding order is stale too, even when the reward itself is not cached
+            with self._lock:
+                order_id = self._reward_orders.get(resource_id)
+            order_id = order_id or (cached.order_id if cached is not None else None)
+            if order_id is not None:
+                self.cache.invalidate((ORDERS, order_id))
+
+        update = IN_PLACE_UPDATES.get(name)
+        if update is not None and cached is not None and update[0] == resource_type:
+            self.cache.put(key, _merge(cached, update[1]))
+            return "updated"
+        self.cache.invalidate(key)
+        return "invalidated"
+
+    def consume(self, consumer: "JournalConsumer", max_events: int = 1000) -> int:
+        """
+        Apply every pending event of a journal consumer and commit it.
+
+        Returns:
+            int: The number of events applied.
+        """
+        applied = 0
+        while True:
+            events = consumer.poll(max_events)
+            if not events:
+                break
+            for _, event in events:
+                self.handle_event(event)
+            applied += len(events)
+        consumer.commit()
+        return applied
@@ -0,0 +1,161 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from pydantic import BaseModel
+from typing import Callable, Dict, Hashable, Optional, Type
+
+import requests
+
+from tremendous.invoices.invoices import InvoiceModel
+from tremendous.orders.order import OrderModel
+from tremendous.rewards.reward import RewardModel
+from tremendous.topups.topup import TopupModel
+
+def _reward_is_final(reward: RewardModel) -> bool:
+    return reward.delivery.status == "SUCCEEDED"
+
+def _order_is_final(order: OrderModel) -> bool:
+    if order.status in ("CANCELED", "FAILED"):
+        return True
+    return order.status == "EXECUTED" and bool(order.rewards) and all(_reward_is_final(reward) for reward in order.rewards)
+
+# Models in these states never change again, so they are served without revalidation
+TERMINAL_STATES: Dict[Type[BaseModel], Callable[[BaseModel], bool]] = {
+    RewardModel: _reward_is_final,
+    OrderModel: _order_is_final,
+    InvoiceModel: lambda invoice: invoice.status in ("PAID", "DELETED"),
+    TopupModel: lambda topup: bool(topup.rejected_at or topup.reversed_at),
+}
+
+class _Entry:
+
+    def __init__(self, url: str, response: requests.Response):
+        self.url = url
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.models: Dict[Hashable, BaseModel] = {}
+        self.terminal = False
+
+class ResponseCache:
+    """
+    HTTP cache for single-resource GETs with conditional revalidation.
+
+    Successful GET responses are kept together with the models parsed from them. When a
+    response carried an ``ETag`` or ``Last-Modified`` validator, the next request for the
+    same URL is sent as a conditional GET; a ``304 Not Modified`` answer returns the
+    previously parsed model without decoding or validating anything. Resources in a
+    terminal state (a delivered reward, a paid invoice, see ``TERMINAL_STATES``) are
+    served from the cache without any request at all. Successful writes under a cached
+    URL (e.g. ``POST /rewards/{id}/cancel``) evict it.
+
+    Entries are keyed by API key as well as URL, so one cache can be shared by clients of
+    different organizations. Cached models are shared between callers and must not be mutated.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached responses.
+        terminal_states (Dict, optional): Model class to predicate telling whether a parsed
+            model will never change. Defaults to ``TERMINAL_STATES``.
+
+    ```python
+    tremendous = TremendousClient(api_key="<your-api-key>", http_cache=ResponseCache())
+    tremendous.Rewards.get("REWARD_ID")  # downloaded and parsed
+    tremendous.Rewards.get("REWARD_ID")  # served from the cache once delivered
+    ```
+    """
+
+    def __init__(self, max_entries: int = 10_000, terminal_states: Optional[Dict] = None):
+        self.max_entries = max_entries
+        self.terminal_states = TERMINAL_STATES if terminal_states is None else terminal_states
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_url: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(api_key: str, url: str, params: Optional[Dict]) -> Hashable:
+        params = tuple(sorted((name, str(value)) for name, value in (params or {}).items() if value is not None))
+        return (hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16], url, params)
+
+    def _served(self, entry: _Entry) -> requests.Response:
+        response = copy.copy(entry.response)
+        response.cache_entry = entry
+        return response
+
+    def lookup(self, key: Hashable, headers: Dict) -> Optional[requests.Response]:
+        """
+        The cached response if it can be served without a request; otherwise adds the
+        conditional headers for revalidation to ``headers``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.terminal:
+                self.hits += 1
+                return self._served(entry)
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return None
+
+    def store(self, key: Hashable, url: str, response: requests.Response) -> requests.Response:
+        """
+        Record a fresh response, or resolve a ``304 Not Modified`` to the cached one.
+        """
+        with self._lock:
+            if response.status_code == 304 and key in self._entries:
+                self.revalidated += 1
+                return self._served(self._entries[key])
+            if not response.ok:
+                return response
+            entry = _Entry(url, response)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._by_url.setdefault(url, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, old = self._entries.popitem(last=False)
+                self._by_url.get(old.url, set()).discard(old_key)
+        response.cache_entry = entry
+        return response
+
+    def invalidate_url(self, url: str) -> None:
+        """
+        Evict every cached response for ``url`` and for the resources it is nested under.
+        """
+        with self._lock:
+            parts = url.split("/")
+            for end in range(len(parts), 3, -1):
+                for key in self._by_url.pop("/".join(parts[:end]), ()):
+                    self._entries.pop(key, None)
+
+    def parse(self, response: requests.Response, model_cls: Type[BaseModel], list_key: Optional[str]) -> BaseModel:
+        """
+        The model in a response, parsed at most once per cached response.
+        """
+        entry: Optional[_Entry] = getattr(response, "cache_entry", None)
+        model_key = (model_cls, list_key)
+        if entry is not None and model_key in entry.models:
+            return entry.models[model_key]
+        data = response.json()
+        model = model_cls(**(data[list_key] if list_key else data))
+        if entry is not None:
+            entry.models[model_key] = model
+            predicate = self.terminal_states.get(model_cls)
+            if predicate is not None and predicate(model):
+                entry.terminal = True
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_url.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
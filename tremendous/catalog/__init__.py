@@ -0,0 +1,4 @@
+from .watcher import (
+    CatalogWatcher,
+    CatalogChangeModel
+)
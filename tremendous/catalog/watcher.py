@@ -0,0 +1,225 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from tremendous.products.product import ProductModel
+from tremendous.sync import canonical_hash
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_ADDED = "product_added"
+PRODUCT_REMOVED = "product_removed"
+PRODUCT_CHANGED = "product_changed"
+SKU_RANGE_NARROWED = "sku_range_narrowed"
+SKU_RANGE_WIDENED = "sku_range_widened"
+COUNTRY_DROPPED = "country_dropped"
+COUNTRY_ADDED = "country_added"
+CURRENCY_DROPPED = "currency_dropped"
+CURRENCY_ADDED = "currency_added"
+
+class CatalogChangeModel(BaseModel):
+    """
+    One change in a product catalog.
+
+    Attributes:
+        kind (str): What changed, e.g. ``"product_removed"`` or ``"sku_range_narrowed"``.
+        catalog (str): The catalog, as ``"<country>/<currency>"``.
+        product_id (str): The product that changed.
+        before (Any): The previous value (SKU range, country, currency), if any.
+        after (Any): The new value, if any.
+        product (ProductModel): The product as now listed; None when it was removed.
+    """
+    kind: str
+    catalog: str
+    product_id: str
+    before: Any = None
+    after: Any = None
+    product: Optional[ProductModel] = None
+
+def _summary(product: ProductModel) -> Dict:
+    data = product.model_dump(mode="json", exclude_none=True)
+    # Listed in no particular order, which must not read as a change
+    data["skus"] = sorted(data["skus"], key=canonical_hash)
+    data["countries"] = sorted(data["countries"], key=lambda country: country["abbr"])
+    data["currency_codes"] = sorted(data["currency_codes"])
+    lows = [sku.min for sku in product.skus if sku.min is not None]
+    highs = [sku.max for sku in product.skus if sku.max is not None]
+    return {
+        "hash": canonical_hash(data),
+        "range": [min(lows) if lows else None, max(highs) if highs else None],
+        "countries": sorted(country.abbr for country in product.countries),
+        "currencies": sorted(product.currency_codes),
+    }
+
+def _range_changes(catalog: str, product: ProductModel, before: List, after: List) -> List[CatalogChangeModel]:
+    (old_low, old_high), (new_low, new_high) = before, after
+    narrowed = (new_low is not None and (old_low is None or new_low > old_low)) or \
+        (new_high is not None and (old_high is None or new_high < old_high))
+    widened = (old_low is not None and (new_low is None or new_low < old_low)) or \
+        (old_high is not None and (new_high is None or new_high > old_high))
+    changes = []
+    for kind, happened in ((SKU_RANGE_NARROWED, narrowed), (SKU_RANGE_WIDENED, widened)):
+        if happened:
+            changes.append(CatalogChangeModel(
+                kind=kind, catalog=catalog, product_id=product.id, before=before, after=after, product=product,
+            ))
+    return changes
+
+def _set_changes(catalog: str, product: ProductModel, field: str, before: List[str], after: List[str]) -> List[CatalogChangeModel]:
+    dropped, added = (COUNTRY_DROPPED, COUNTRY_ADDED) if field == "countries" else (CURRENCY_DROPPED, CURRENCY_ADDED)
+    changes = [
+        CatalogChangeModel(kind=dropped, catalog=catalog, product_id=product.id, before=value, product=product)
+        for value in sorted(set(before) - set(after))
+    ]
+    changes.extend(
+        CatalogChangeModel(kind=added, catalog=catalog, product_id=product.id, after=value, product=product)
+        for value in sorted(set(after) - set(before))
+    )
+    return changes
+
+class CatalogWatcher:
+    """
+    Polls product catalogs and reports what changed since the last poll.
+
+    Each configured country/currency catalog is listed with ``Products.list``. Only a
+    compact summary of every product is kept between polls: the hash of its canonical JSON,
+    its overall SKU range, and its countries and currencies. Products are compared by ID
+    and hash, so unchanged products cost one dictionary lookup, and changed ones are
+    broken down into events such as a narrowed SKU range or a dropped country. A product
+    whose other fields changed is reported as ``product_changed``.
+
+    Subscribers are called with the changes of every poll that found any, so caches built
+    from the catalog can update only the affected products. The new summaries are only
+    kept once every subscriber has returned, so changes a subscriber failed on are
+    reported again by the next poll. With ``path``, the summaries are saved after every
+    poll, so changes that happened while the process was down are reported by the first
+    poll after a restart; without it, the first poll only records the baseline.
+
+    Args:
+        client (TremendousClient): The client used to list products.
+        catalogs (List[Tuple[str, str]], optional): ``(country, currency)`` pairs to watch.
+        path (str, optional): JSON file the summaries are kept in.
+
+    ```python
+    watcher = CatalogWatcher(tremendous, catalogs=[("US", "USD"), ("GB", "GBP")], path="catalog.json")
+    watcher.subscribe(validator.apply_catalog_changes)
+    watcher.run(interval=3600)
+    ```
+    """
+
+    def __init__(
+            self,
+            client: "TremendousClient",
+            catalogs: Optional[List[Tuple[str, str]]] = None,
+            path: Optional[str] = None):
+        self.client = client
+        self.catalogs = catalogs or [("US", "USD")]
+        self.path = path
+        self.summaries: Dict[str, Dict[str, Dict]] = self._load()
+        self.errors = 0
+        self._subscribers: List[Callable[[List[CatalogChangeModel]], None]] = []
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.summaries, file, sort_keys=True, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+    def subscribe(self, callback: Callable[[List[CatalogChangeModel]], None]) -> None:
+        """
+        Call ``callback`` with the changes of every poll that found any.
+        """
+        self._subscribers.append(callback)
+
+    def diff(self, catalog: str, products: List[ProductModel]) -> List[CatalogChangeModel]:
+        """
+        Compare a freshly listed catalog with its stored summaries, and store the new ones.
+        """
+        current, changes = self._compare(catalog, products)
+        with self._lock:
+            self.summaries[catalog] = current
+        return changes
+
+    def _compare(
+            self,
+            catalog: str,
+            products: List[ProductModel]) -> Tuple[Dict[str, Dict], List[CatalogChangeModel]]:
+        previous = self.summaries.get(catalog)
+        current = {product.id: _summary(product) for product in products}
+        if previous is None:
+            return current, []
+        changes = []
+        for product in products:
+            old = previous.get(product.id)
+            new = current[product.id]
+            if old is None:
+                changes.append(CatalogChangeModel(kind=PRODUCT_ADDED, catalog=catalog, product_id=product.id, product=product))
+                continue
+            if old["hash"] == new["hash"]:
+                continue
+            details = _range_changes(catalog, product, old["range"], new["range"])
+            details += _set_changes(catalog, product, "countries", old["countries"], new["countries"])
+            details += _set_changes(catalog, product, "currencies", old["currencies"], new["currencies"])
+            changes.extend(details or [
+                CatalogChangeModel(kind=PRODUCT_CHANGED, catalog=catalog, product_id=product.id, product=product)
+            ])
+        changes.extend(
+            CatalogChangeModel(kind=PRODUCT_REMOVED, catalog=catalog, product_id=product_id)
+            for product_id in previous
+            if product_id not in current
+        )
+        return current, changes
+
+    def poll(self) -> List[CatalogChangeModel]:
+        """
+        List every catalog concurrently, and report and publish the changes.
+        """
+        def fetch(pair: Tuple[str, str]) -> List[ProductModel]:
+            return self.client.Products.list(country=pair[0], currency=pair[1])
+
+        with ThreadPoolExecutor(max_workers=min(8, len(self.catalogs))) as executor:
+            listed = list(executor.map(fetch, self.catalogs))
+        summaries, changes = {}, []
+        for (country, currency), products in zip(self.catalogs, listed):
+            catalog = f"{country}/{currency}"
+            summaries[catalog], found = self._compare(catalog, products)
+            changes.extend(found)
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+        with self._lock:
+            self.summaries.update(summaries)
+        self._save()
+        return changes
+
+    def run(self, interval: float = 3600.0, stop: Optional[threading.Event] = None) -> None:
+        """
+        Poll every ``interval`` seconds until ``stop`` is set.
+
+        A failed poll (an API error, or a subscriber raising) is logged and counted in
+        ``errors``, and the next poll runs on schedule and reports its changes again.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                self.errors += 1
+                logger.exception("catalog poll failed")
+            stop.wait(interval)
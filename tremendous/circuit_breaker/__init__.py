@@ -0,0 +1,4 @@
+from .circuit_breaker import (
+    CircuitBreaker,
+    endpoint_key
+)
@@ -0,0 +1,121 @@
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from tremendous.exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+ID_SEGMENT = re.compile(r"^(?=.*\d)[A-Za-z0-9_-]{6,}$")
+
+def endpoint_key(method: str, path: str) -> str:
+    """
+    Group requests by endpoint, e.g. ``GET /rewards/ABC123XYZ`` becomes ``GET /rewards/{id}``.
+    """
+    segments = ["{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("?")[0].split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+class _Circuit:
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker that fails fast while the API is degraded.
+
+    After ``failure_threshold`` consecutive failures (5xx responses, timeouts, connection
+    errors) an endpoint's circuit opens and requests to it raise ``CircuitOpenError``
+    immediately instead of reaching the API. After ``reset_timeout`` seconds the circuit is
+    half-open: up to ``half_open_probes`` requests are let through, and the first success
+    closes it again while a failure reopens it.
+
+    Args:
+        failure_threshold (int, optional): Consecutive failures that open a circuit.
+        reset_timeout (float, optional): Seconds a circuit stays open before probing.
+        half_open_probes (int, optional): Concurrent probe requests allowed while half-open.
+
+    ```python
+    tremendous = TremendousClient(api_key="<your-api-key>", circuit_breaker=CircuitBreaker())
+    ```
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_probes: int = 1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before(self, endpoint: str) -> None:
+        """
+        Admit a request to ``endpoint``.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe slot taken.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise CircuitOpenError(endpoint, remaining)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenError(endpoint, self.reset_timeout)
+            circuit.probes += 1
+
+    def success(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None:
+                circuit.state = CLOSED
+                circuit.failures = 0
+                circuit.probes = 0
+
+    def failure(self, endpoint: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+
+    def release(self, endpoint: str) -> None:
+        """
+        Give back the probe slot of an admitted request that never reached the API.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.probes:
+                circuit.probes -= 1
+
+    def state(self, endpoint: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() >= circuit.opened_at + self.reset_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def states(self) -> Dict[str, str]:
+        return {endpoint: self.state(endpoint) for endpoint in list(self._circuits)}
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
@@ -1,4 +1,14 @@
+import json
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from tremendous.exceptions import error_from_response
+from tremendous.circuit_breaker.circuit_breaker import endpoint_key
+from tremendous.compression.compression import ACCEPT_ENCODING, compress_body, read_body
+from tremendous.metrics import ClientMetrics, ClientStatsModel
 
 class TremendousClient:
     """
@@ -11,6 +21,33 @@ class TremendousClient:
         api_key (str): Your Tremendous API key. Get this from your Tremendous dashboard.
         sandbox (bool, optional): Whether to use the sandbox environment. 
                                  Defaults to False (production).
+        session (requests.Session, optional): An existing session to send requests through,
+                                 e.g. one shared by several clients. Defaults to a new session.
+        rate_limiter (TokenBucket, optional): Limits the request rate of this client. A lane of a
+                                 shared PriorityScheduler (``scheduler.limiter("batch")``) also works.
+        http_cache (ResponseCache, optional): Caches single-resource GETs and revalidates them
+                                 with conditional requests.
+        circuit_breaker (CircuitBreaker, optional): Fails fast on endpoints the API keeps failing.
+        transport (requests.adapters.HTTPAdapter, optional): Sends the requests to the API, e.g. a
+                                 RecordingTransport or ReplayTransport. Mounted on the session for the base URL.
+        pool_maxsize (int, optional): Connections kept open to the API, shared by all threads.
+                                 Size it to the number of threads using the client.
+        adapter (requests.adapters.HTTPAdapter, optional): Connection pool to send through, e.g. one
+                                 shared by several clients. Defaults to a new pool of ``pool_maxsize``.
+        compression (bool, optional): Negotiate compressed responses (brotli when a brotli package
+                                 is installed, else gzip), decompress them while they stream in and
+                                 report compression ratio and time in ``stats``.
+        compress_requests_over (int, optional): Gzip request bodies of at least this many bytes.
+                                 Only for endpoints that accept ``Content-Encoding: gzip``.
+    
+    Concurrency:
+        One client can be shared by any number of threads. Unless a ``session`` is given,
+        every thread gets its own ``requests.Session``; all of them send through one
+        connection pool, so threads neither share session state nor hold connections
+        the others could use. The rate limiter, HTTP cache, circuit breaker and
+        ``stats`` are thread-safe. A ``session`` passed in is used by every thread,
+        as before. Configuration attributes (``headers``, ``base_url``) must not be
+        changed while requests are running.
     
     Attributes:
         api_key (str): The API key used for authentication.
@@ -24,13 +61,35 @@ class TremendousClient:
         >>> products = client.products.list()
     """
 
-    def __init__(self, api_key: str, sandbox: bool = False):
+    def __init__(
+        self,
+        api_key: str,
+        sandbox: bool = False,
+        session: requests.Session | None = None,
+        rate_limiter=None,
+        http_cache=None,
+        circuit_breaker=None,
+        transport=None,
+        pool_maxsize: int = 64,
+        adapter: HTTPAdapter | None = None,
+        compression: bool = False,
+        compress_requests_over: int | None = None,
+    ):
         """
         Initialize the TremendousClient.
         
         Args:
             api_key (str): Your Tremendous API key.
             sandbox (bool, optional): Whether to use sandbox environment. Defaults to False.
+            session (requests.Session, optional): Session to send requests through. Defaults to a new session.
+            rate_limiter (TokenBucket, optional): Limits the request rate of this client.
+            http_cache (ResponseCache, optional): Caches single-resource GETs.
+            circuit_breaker (CircuitBreaker, optional): Fails fast on degraded endpoints.
+            transport (HTTPAdapter, optional): Sends the requests to the API.
+            pool_maxsize (int, optional): Connections kept open to the API, shared by all threads.
+            adapter (HTTPAdapter, optional): Connection pool to send through. Defaults to a new one.
+            compression (bool, optional): Negotiate and measure compressed responses.
+            compress_requests_over (int, optional): Gzip request bodies of at least this many bytes.
         """
         self.api_key = api_key
         # Use correct base URLs; do not include resource paths
@@ -39,11 +98,25 @@ class TremendousClient:
             if not sandbox
             else "https://testflight.tremendous.com/api/v2"
         )
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-        })
+        }
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.circuit_breaker = circuit_breaker
+        self.transport = transport
+        if hasattr(transport, "size_for"):
+            transport.size_for(pool_maxsize)
+        self.compression = compression
+        self.compress_requests_over = compress_requests_over
+        self.metrics = ClientMetrics()
+        self._adapter = adapter if adapter is not None else HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self._local = threading.local()
+        self._shared_session = session
+        # Shared sessions keep their own headers; authentication is sent per request
+        if session is not None and transport is not None:
+            session.mount(self.base_url, transport)
 
         from tremendous.products import Products
         from tremendous.rewards import Rewards
@@ -74,26 +147,137 @@ class TremendousClient:
         self.Fields = Fields(self)
         self.Webhooks = Webhooks(self)
         self.Forex = Forex(self)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The session of the calling thread, or the session passed to the client.
+        """
+        if self._shared_session is not None:
+            return self._shared_session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            if self.transport is not None:
+                session.mount(self.base_url, self.transport)
+            self._local.session = session
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._shared_session = session
+
+    def stats(self) -> ClientStatsModel:
+        """
+        Request counts, errors, bytes and time spent, summed over all threads.
+        """
+        return self.metrics.snapshot()
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
         Make a request to the Tremendous API.
         
         This is an internal method used by other API methods to make HTTP requests.
         It handles URL construction, authentication, and error handling.
+        Non-2xx responses raise a subclass of ``TremendousError`` matching the status code.
         
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE, etc.).
             url (str): The endpoint URL (relative to base_url).
+            cacheable (bool, optional): Whether a GET may be served by the HTTP cache.
             **kwargs: Additional arguments passed to requests.Session.request().
         
         """
         url = f"{self.base_url}{url}"
-        response = self.session.request(method, url, **kwargs)
+        cacheable = kwargs.pop("cacheable", False)
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        cache_key = None
+        if self.http_cache is not None and cacheable and method == "GET":
+            cache_key = self.http_cache.key(self.api_key, url, kwargs.get("params"))
+            cached = self.http_cache.lookup(cache_key, kwargs["headers"])
+            if cached is not None:
+                return cached
+        endpoint = None
+        if self.circuit_breaker is not None:
+            endpoint = endpoint_key(method, url[len(self.base_url):])
+        response = self._send(method, url, endpoint, kwargs)
+        if cache_key is not None:
+            response = self.http_cache.store(cache_key, url, response)
+            if response.status_code == 304:
+                # The cached copy was evicted while revalidating
+                kwargs["headers"].pop("If-None-Match", None)
+                kwargs["headers"].pop("If-Modified-Since", None)
+                response = self.http_cache.store(cache_key, url, self._send(method, url, endpoint, kwargs))
+        elif method != "GET" and self.http_cache is not None and response.ok:
+            self.http_cache.invalidate_url(url)
         if not response.ok:
-            print(response.json())
-            raise requests.HTTPError(response.json())
+            raise error_from_response(response)
         return response
 
+    def _send(self, method: str, url: str, endpoint: str | None, kwargs: dict) -> requests.Response:
+        """
+        Send one request through the circuit breaker, rate limiter and metrics.
+
+        Every request admitted by the circuit breaker records an outcome, or gives its
+        probe slot back when it fails before reaching the API.
+        """
+        if endpoint is not None:
+            self.circuit_breaker.before(endpoint)
+        reached = failed = False
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if method != "GET":
+                self._encode_body(kwargs)
+            if self.compression:
+                kwargs["headers"]["Accept-Encoding"] = ACCEPT_ENCODING
+                kwargs["stream"] = True
+            started = time.perf_counter()
+            wire_size, decompress_seconds = None, 0.0
+            reached = failed = True
+            try:
+                response = self.session.request(method, url, **kwargs)
+                # Transports that answer from memory, like ReplayTransport, leave no stream to read
+                if self.compression and response.raw is not None:
+                    wire_size, decompress_seconds = read_body(response)
+            except Exception:
+                self.metrics.record_failure(time.perf_counter() - started)
+                raise
+            self.metrics.record(
+                response.status_code,
+                time.perf_counter() - started,
+                len(response.content),
+                wire_size,
+                decompress_seconds,
+            )
+            failed = response.status_code >= 500
+            return response
+        finally:
+            if endpoint is not None:
+                if not reached:
+                    self.circuit_breaker.release(endpoint)
+                elif failed:
+                    self.circuit_breaker.failure(endpoint)
+                else:
+                    self.circuit_breaker.success(endpoint)
+
+    def _encode_body(self, kwargs: dict) -> None:
+        if kwargs.get("json") is not None:
+            kwargs["data"] = json.dumps(kwargs.pop("json")).encode("utf-8")
+        body = kwargs.get("data")
+        if not isinstance(body, bytes):
+            return
+        if self.compress_requests_over is None or len(body) < self.compress_requests_over:
+            self.metrics.record_sent(len(body), len(body))
+            return
+        compressed, seconds = compress_body(body)
+        self.metrics.record_sent(len(body), len(compressed), seconds)
+        kwargs["data"] = compressed
+        kwargs["headers"]["Content-Encoding"] = "gzip"
+
     def _fetch(
         self,
         path: str,
@@ -111,7 +295,9 @@ class TremendousClient:
             params: The parameters to pass to the API endpoint.
             method: The HTTP method to use for the request.
         """
-        response = self._request(method, path, params=params)
+        response = self._request(method, path, params=params, cacheable=True)
+        if self.http_cache is not None:
+            return self.http_cache.parse(response, model_cls, list_key)
         data = response.json()
         return model_cls(**data[list_key])
 
@@ -146,14 +332,19 @@ class TremendousClient:
         params: dict | None = None,
         method: str = "POST",
         list_key: str | None = None,
+        data: bytes | None = None,
     ):
         """
         Create a resource in the API.
 
         Uses a JSON request body and can optionally extract a nested key
-        from the response before initializing the model.
+        from the response before initializing the model. A pre-encoded JSON
+        body can be passed as ``data`` instead of ``params``.
         """
-        response = self._request(method, path, json=params)
+        if data is not None:
+            response = self._request(method, path, data=data)
+        else:
+            response = self._request(method, path, json=params)
         data = response.json()
         if model_cls:
             if list_key:
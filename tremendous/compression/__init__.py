@@ -0,0 +1,6 @@
+from .compression import (
+    ACCEPT_ENCODING,
+    compress_body,
+    decompressor,
+    read_body
+)
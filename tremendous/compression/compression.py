@@ -0,0 +1,110 @@
+import gzip
+import time
+import zlib
+from typing import Optional, Tuple
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# Preferred first; brotli is only offered when a brotli package is installed
+ACCEPT_ENCODING = "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+CHUNK_SIZE = 64 * 1024
+
+class _Deflate:
+    """
+    Accepts both zlib-wrapped and raw deflate streams, as servers send either.
+    """
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj()
+        self._first = True
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._first and data:
+            self._first = False
+            try:
+                return self._decompressor.decompress(data)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+class _Brotli:
+
+    def __init__(self):
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        if hasattr(self._decompressor, "process"):
+            return self._decompressor.process(data)
+        return self._decompressor.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+def decompressor(encoding: Optional[str]):
+    """
+    An incremental decompressor for a ``Content-Encoding``, or None for identity.
+    """
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _Deflate()
+    if encoding == "br" and brotli is not None:
+        return _Brotli()
+    return None
+
+def read_body(response: requests.Response) -> Tuple[int, float]:
+    """
+    Read a streamed response, decompressing it chunk by chunk as it arrives.
+
+    The decoded body becomes ``response.content`` as usual, so ``response.json()`` works
+    unchanged.
+
+    Returns:
+        Tuple[int, float]: Bytes received on the wire and seconds spent decompressing.
+    """
+    codec = decompressor(response.headers.get("Content-Encoding"))
+    body = bytearray()
+    wire = 0
+    seconds = 0.0
+    try:
+        for chunk in response.raw.stream(CHUNK_SIZE, decode_content=codec is None):
+            wire += len(chunk)
+            if codec is None:
+                body += chunk
+                continue
+            started = time.perf_counter()
+            body += codec.decompress(chunk)
+            seconds += time.perf_counter() - started
+        if codec is not None:
+            started = time.perf_counter()
+            body += codec.flush()
+            seconds += time.perf_counter() - started
+    finally:
+        response.raw.release_conn()
+    response._content = bytes(body)
+    response._content_consumed = True
+    return wire, seconds
+
+def compress_body(body: bytes, level: int = 6) -> Tuple[bytes, float]:
+    """
+    Gzip a request body.
+
+    Returns:
+        Tuple[bytes, float]: The compressed body and the seconds spent compressing it.
+    """
+    started = time.perf_counter()
+    compressed = gzip.compress(body, compresslevel=level)
+    return compressed, time.perf_counter() - started
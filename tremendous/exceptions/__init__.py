@@ -0,0 +1,11 @@
+from .exceptions import (
+    TremendousError,
+    InvalidRequestError,
+    AuthenticationError,
+    InsufficientFundsError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    CircuitOpenError,
+    error_from_response
+)
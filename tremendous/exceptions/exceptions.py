@@ -0,0 +1,119 @@
+from typing import Any, Dict, Optional
+
+import requests
+
+
+class TremendousError(requests.HTTPError):
+    """
+    Base class of errors returned by the Tremendous API.
+
+    Subclasses ``requests.HTTPError``, so existing ``except requests.HTTPError`` handlers
+    keep working.
+
+    Attributes:
+        status_code (int): The HTTP status code, if a response was received.
+        message (str): The error message returned by the API.
+        payload (Dict): Structured error details (e.g. the offending parameters), if any.
+        body (Any): The decoded response body, or its text when it is not JSON.
+    """
+
+    def __init__(
+            self,
+            message: str,
+            status_code: Optional[int] = None,
+            payload: Optional[Dict] = None,
+            body: Any = None,
+            response: Optional[requests.Response] = None):
+        super().__init__(message, response=response)
+        self.message = message
+        self.status_code = status_code
+        self.payload = payload or {}
+        self.body = body
+
+    def __str__(self) -> str:
+        return f"{self.status_code}: {self.message}" if self.status_code else self.message
+
+class InvalidRequestError(TremendousError):
+    """
+    The request parameters or body failed validation (400, 422).
+    """
+
+class AuthenticationError(TremendousError):
+    """
+    The API key is missing, invalid or lacks permission (401, 403).
+    """
+
+class InsufficientFundsError(TremendousError):
+    """
+    The account balance cannot cover the request (402).
+    """
+
+class NotFoundError(TremendousError):
+    """
+    No resource exists for the given ID (404).
+    """
+
+class RateLimitError(TremendousError):
+    """
+    The rate limit was exceeded (429).
+
+    Attributes:
+        retry_after (float): Seconds to wait before retrying, when the API said so.
+    """
+
+    def __init__(self, *args, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+class ServerError(TremendousError):
+    """
+    The API failed to handle the request (5xx).
+    """
+
+class CircuitOpenError(TremendousError):
+    """
+    Raised without sending the request while an endpoint's circuit breaker is open.
+
+    Attributes:
+        endpoint (str): The endpoint whose circuit is open.
+        retry_after (float): Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"circuit open for {endpoint}; retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+STATUS_ERRORS = {
+    400: InvalidRequestError,
+    401: AuthenticationError,
+    402: InsufficientFundsError,
+    403: AuthenticationError,
+    404: NotFoundError,
+    422: InvalidRequestError,
+    429: RateLimitError,
+}
+
+def error_from_response(response: requests.Response) -> TremendousError:
+    """
+    Build the typed error for a non-2xx response, decoding its body once.
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        body = response.text
+    errors = body.get("errors") if isinstance(body, dict) else None
+    if isinstance(errors, dict):
+        message, payload = errors.get("message") or response.reason, errors.get("payload")
+    else:
+        message, payload = (body if isinstance(body, str) and body else response.reason) or "", None
+    status = response.status_code
+    error_cls = STATUS_ERRORS.get(status, ServerError if status >= 500 else TremendousError)
+    kwargs = dict(status_code=status, payload=payload, body=body, response=response)
+    if error_cls is RateLimitError:
+        retry_after = response.headers.get("Retry-After")
+        try:
+            kwargs["retry_after"] = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            kwargs["retry_after"] = None
+    return error_cls(message, **kwargs)
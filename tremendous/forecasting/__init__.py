@@ -0,0 +1,5 @@
+from .forecast import (
+    BalanceForecaster,
+    ForecastModel,
+    BalancePointModel
+)
@@ -0,0 +1,218 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel
+from typing import Dict, List, Optional, TYPE_CHECKING
+from tremendous.balance_transactions.balance_transaction import BalanceTransactionModel
+from tremendous.pagination import paginate
+from tremendous.topups.topup import TopupModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+SETTLED_TOPUP_FIELDS = ("fully_credited_at", "rejected_at", "reversed_at")
+
+class BalancePointModel(BaseModel):
+    created_at: Optional[str] = None
+    balance: Optional[float] = None
+
+class ForecastModel(BaseModel):
+    """
+    Projection of the account balance against a queued batch of orders.
+
+    Attributes:
+        current_balance (float): Balance after the most recent balance transaction.
+        pending_topups (float): Sum of topups that have not been credited, rejected or reversed yet.
+        required (float): Total value of the queued order specs.
+        projected_balance (float): Balance left after the batch, including pending topups.
+        shortfall (float): Amount missing to complete the batch (0 when the balance suffices).
+        exhausted_at (int): Index of the first order spec the balance cannot cover, if any.
+        series (List[float]): Projected balance after each order spec.
+    """
+    current_balance: float
+    pending_topups: float = 0.0
+    required: float = 0.0
+    projected_balance: float
+    shortfall: float = 0.0
+    exhausted_at: Optional[int] = None
+    series: List[float] = []
+
+class BalanceForecaster:
+    """
+    Keeps a running balance series and projects it against batches of orders.
+
+    The transaction history is downloaded once and then extended incrementally from the
+    newest ``created_at`` seen, so repeated forecasts before each payout run only fetch
+    what changed since the last call.
+
+    Args:
+        client (TremendousClient): The client used to reach the API.
+        page_size (int, optional): Page size used when listing balance transactions.
+        topup_lookback_days (int, optional): How far back to look for topups that are still pending.
+
+    ```python
+    forecaster = BalanceForecaster(tremendous)
+    forecast = forecaster.project(order_specs)
+    if forecast.shortfall:
+        forecaster.preflight(order_specs, funding_source_id="FUNDING_SOURCE_ID")
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", page_size: int = 100, topup_lookback_days: int = 30):
+        self.client = client
+        self.page_size = page_size
+        self.topup_lookback_days = topup_lookback_days
+        self.transactions: List[BalanceTransactionModel] = []
+        self._cursor: Optional[str] = None
+        self._seen_at_cursor: set = set()
+
+    @staticmethod
+    def _transaction_key(transaction: BalanceTransactionModel) -> tuple:
+        order_id = transaction.order.id if transaction.order else None
+        return (transaction.created_at, transaction.action, transaction.amount, transaction.balance, order_id)
+
+    def refresh(self) -> List[BalanceTransactionModel]:
+        """
+        Fetch balance transactions created since the last refresh.
+
+        Returns:
+            List[BalanceTransactionModel]: The newly seen transactions, oldest first.
+        """
+        fetched = paginate(
+            self.client.BalanceTransactions.list,
+            page_size=self.page_size,
+            created_at_gte=self._cursor,
+        )
+        new = []
+        for transaction in fetched:
+            key = self._transaction_key(transaction)
+            # created_at[gte] re-returns transactions sharing the cursor timestamp
+            if transaction.created_at == self._cursor and key in self._seen_at_cursor:
+                continue
+            new.append(transaction)
+        new.sort(key=lambda transaction: transaction.created_at or "")
+        for transaction in new:
+            if transaction.created_at != self._cursor:
+                self._cursor = transaction.created_at
+                self._seen_at_cursor = set()
+            self._seen_at_cursor.add(self._transaction_key(transaction))
+        self.transactions.extend(new)
+        return new
+
+    @property
+    def balance(self) -> float:
+        """
+        The balance after the most recent known transaction.
+        """
+        for transaction in reversed(self.transactions):
+            if transaction.balance is not None:
+                return transaction.balance
+        return 0.0
+
+    def series(self) -> List[BalancePointModel]:
+        """
+        The running balance series, oldest first.
+        """
+        return [
+            BalancePointModel(created_at=transaction.created_at, balance=transaction.balance)
+            for transaction in self.transactions
+        ]
+
+    def pending_topups(self) -> List[TopupModel]:
+        """
+        Retrieve topups that have been requested but not settled yet.
+
+        Topups are listed newest first, so listing stops at the first topup older than
+        ``topup_lookback_days``.
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.topup_lookback_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        pending = []
+        for topup in paginate(self.client.Topups.list):
+            if topup.created_at and topup.created_at < cutoff:
+                break
+            if not any(getattr(topup, field) for field in SETTLED_TOPUP_FIELDS):
+                pending.append(topup)
+        return pending
+
+    @staticmethod
+    def order_cost(spec: Dict, fee_rate: float = 0.0) -> float:
+        """
+        The amount an order spec will draw from the balance.
+
+        Args:
+            spec (Dict): Keyword arguments as passed to ``Orders.create``.
+            fee_rate (float, optional): Fee charged on top of the reward value, as a fraction.
+        """
+        return float(spec["value"]["denomination"]) * (1 + fee_rate)
+
+    def project(self, specs: List[Dict], fee_rate: float = 0.0, include_pending: bool = True, refresh: bool = True) -> ForecastModel:
+        """
+        Project the balance against a batch of order specs.
+
+        Args:
+            specs (List[Dict]): Order specs, each as keyword arguments for ``Orders.create``.
+            fee_rate (float, optional): Fee charged on top of each reward value, as a fraction.
+            include_pending (bool, optional): Whether pending topups count towards the balance.
+            refresh (bool, optional): Whether to fetch new balance transactions first.
+
+        Returns:
+            ForecastModel: The projection.
+        """
+        if refresh:
+            self.refresh()
+        current = self.balance
+        pending = sum(topup.amount or 0.0 for topup in self.pending_topups()) if include_pending else 0.0
+        running = current + pending
+        series = []
+        exhausted_at = None
+        for index, spec in enumerate(specs):
+            running -= self.order_cost(spec, fee_rate)
+            series.append(running)
+            if running < 0 and exhausted_at is None:
+                exhausted_at = index
+        return ForecastModel(
+            current_balance=current,
+            pending_topups=pending,
+            required=current + pending - running,
+            projected_balance=running,
+            shortfall=max(0.0, -running),
+            exhausted_at=exhausted_at,
+            series=series,
+        )
+
+    @staticmethod
+    def batch_idempotency_key(specs: List[Dict]) -> str:
+        """
+        A stable idempotency key for a batch, so re-running the same batch never tops up twice.
+        """
+        canonical = json.dumps(specs, sort_keys=True, separators=(",", ":"), default=str)
+        return "forecast-" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+    def preflight(
+            self,
+            specs: List[Dict],
+            funding_source_id: str,
+            buffer: float = 0.0,
+            fee_rate: float = 0.0,
+            idempotency_key: Optional[str] = None) -> Optional[TopupModel]:
+        """
+        Top up the balance before a batch runs dry.
+
+        Args:
+            specs (List[Dict]): Order specs, each as keyword arguments for ``Orders.create``.
+            funding_source_id (str): The funding source to draw the topup from.
+            buffer (float, optional): Extra amount to add on top of the shortfall.
+            fee_rate (float, optional): Fee charged on top of each reward value, as a fraction.
+            idempotency_key (str, optional): Defaults to a key derived from the batch contents.
+
+        Returns:
+            TopupModel: The created topup, or None when the balance already covers the batch.
+        """
+        forecast = self.project(specs, fee_rate=fee_rate)
+        if forecast.shortfall <= 0:
+            return None
+        return self.client.Topups.create(
+            amount=round(forecast.shortfall + buffer, 2),
+            idempotency_key=idempotency_key or self.batch_idempotency_key(specs),
+            funding_source_id=funding_source_id,
+        )
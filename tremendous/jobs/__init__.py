@@ -0,0 +1,8 @@
+from .order_queue import (
+    OrderQueue,
+    QueuedOrderModel
+)
+from .scheduler import (
+    OrderScheduler,
+    SchedulerStatsModel
+)
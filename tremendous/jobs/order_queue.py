@@ -0,0 +1,265 @@
+import json
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pydantic import BaseModel
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
+
+import requests
+
+from tremendous.exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    InsufficientFundsError,
+    InvalidRequestError,
+    RateLimitError,
+    ServerError,
+)
+from tremendous.orders.spec import CompiledOrderModel, build_order_payload
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+UNKNOWN = "unknown"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    external_id TEXT NOT NULL UNIQUE,
+    body BLOB NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    order_id TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_state ON orders (state, id);
+"""
+
+class QueuedOrderModel(BaseModel):
+    external_id: str
+    state: str
+    attempts: int = 0
+    order_id: Optional[str] = None
+    error: Optional[str] = None
+
+class OrderQueue:
+    """
+    Durable, crash-safe queue for bulk order submission.
+
+    Every order spec is recorded in a SQLite database (in WAL mode) together with its
+    ``external_id``, attempt state and the ID of the created order. An item is marked
+    in flight *before* its request is sent, so after a crash only those items are
+    ambiguous; they are resolved with ``Orders.list(external_id=...)`` before anything is
+    sent again. A 5xx response is just as ambiguous (the order may have been created before
+    the error), so such items are resolved the same way before they are retried. Finished
+    items are never re-sent.
+
+    Args:
+        client (TremendousClient): The client used to create orders.
+        path (str): Path of the SQLite database file.
+        max_attempts (int, optional): Attempts per order before it is marked failed.
+
+    ```python
+    queue = OrderQueue(tremendous, "payout-2026-10.db")
+    queue.enqueue(order_specs)
+    queue.run(workers=8)
+    print(queue.stats())
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", path: str, max_attempts: int = 3):
+        self.client = client
+        self.path = path
+        self.max_attempts = max_attempts
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._paused_until = 0.0
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "OrderQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def enqueue(self, specs: Iterable[Union[Dict, CompiledOrderModel]]) -> int:
+        """
+        Record order specs in the queue.
+
+        Specs already in the queue (by ``external_id``) are ignored, so enqueueing the same
+        batch twice is safe.
+
+        Args:
+            specs (Iterable[Union[Dict, CompiledOrderModel]]): ``Orders.create`` keyword
+                arguments or specs compiled by ``OrderSpecValidator``. Each needs an ``external_id``.
+
+        Returns:
+            int: The number of newly queued orders.
+        """
+        rows = []
+        now = time.time()
+        for spec in specs:
+            if isinstance(spec, CompiledOrderModel):
+                external_id, body = spec.external_id, spec.body
+            else:
+                external_id = spec.get("external_id")
+                body = json.dumps(build_order_payload(**spec), separators=(",", ":")).encode("utf-8")
+            if not external_id:
+                raise ValueError("queued orders need an external_id to be resumable")
+            rows.append((external_id, body, PENDING, now))
+        before = self.db.total_changes
+        self.db.execute("BEGIN")
+        self.db.executemany(
+            "INSERT OR IGNORE INTO orders (external_id, body, state, updated_at) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self.db.execute("COMMIT")
+        return self.db.total_changes - before
+
+    def _set(self, row_id: int, state: str, order_id: Optional[str] = None, error: Optional[str] = None) -> None:
+        self.db.execute(
+            "UPDATE orders SET state = ?, order_id = COALESCE(?, order_id), error = ?, updated_at = ? WHERE id = ?",
+            (state, order_id, error, time.time(), row_id),
+        )
+
+    def resolve_ambiguous(self) -> int:
+        """
+        Settle orders whose outcome is unknown (in flight during a crash, or a lost response).
+
+        Each one is looked up by ``external_id``; found orders are marked done, the rest go
+        back to pending (or failed, once they are out of attempts).
+
+        Returns:
+            int: The number of orders that turned out to have been created.
+        """
+        rows = self.db.execute(
+            "SELECT id, external_id, attempts, error FROM orders WHERE state IN (?, ?)", (IN_FLIGHT, UNKNOWN)
+        ).fetchall()
+        found = 0
+        for row_id, external_id, attempts, error in rows:
+            existing = self.client.Orders.list(external_id=external_id, limit=1)
+            if existing:
+                self._set(row_id, DONE, order_id=existing[0].id)
+                found += 1
+            else:
+                self._set(row_id, PENDING if attempts < self.max_attempts else FAILED, error=error)
+        return found
+
+    @staticmethod
+    def _only(external_ids: Optional[List[str]]) -> Tuple[str, tuple]:
+        if external_ids is None:
+            return "", ()
+        return f" AND external_id IN ({', '.join('?' * len(external_ids))})", tuple(external_ids)
+
+    def _claim(self, limit: int, external_ids: Optional[List[str]] = None) -> List[tuple]:
+        only, params = self._only(external_ids)
+        self.db.execute("BEGIN IMMEDIATE")
+        rows = self.db.execute(
+            f"SELECT id, external_id, body FROM orders WHERE state = ?{only} ORDER BY id LIMIT ?",
+            (PENDING, *params, limit),
+        ).fetchall()
+        now = time.time()
+        self.db.executemany(
+            "UPDATE orders SET state = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+            [(IN_FLIGHT, now, row_id) for row_id, _, _ in rows],
+        )
+        self.db.execute("COMMIT")
+        return rows
+
+    def _send(self, external_id: str, body: bytes, limiter=None):
+        if limiter is not None:
+            limiter.acquire()
+        return self.client.Orders.submit(CompiledOrderModel(external_id=external_id, payload={}, body=body))
+
+    def _record(self, row_id: int, future) -> None:
+        error = future.exception()
+        if error is None:
+            self._set(row_id, DONE, order_id=future.result().id)
+        elif isinstance(error, (CircuitOpenError, RateLimitError)):
+            # Not processed by the API: retry later without spending an attempt
+            self.db.execute("UPDATE orders SET attempts = attempts - 1 WHERE id = ?", (row_id,))
+            self._set(row_id, PENDING, error=str(error))
+            self._paused_until = max(self._paused_until, time.monotonic() + (error.retry_after or 1.0))
+        elif isinstance(error, (InvalidRequestError, AuthenticationError, InsufficientFundsError)):
+            self._set(row_id, FAILED, error=str(error))
+        elif isinstance(error, ServerError):
+            # The order may have been created before the error: look it up before retrying
+            self._set(row_id, UNKNOWN, error=str(error))
+        elif isinstance(error, requests.HTTPError):
+            attempts = self.db.execute("SELECT attempts FROM orders WHERE id = ?", (row_id,)).fetchone()[0]
+            self._set(row_id, PENDING if attempts < self.max_attempts else FAILED, error=str(error))
+        else:
+            # No response: the order may or may not have been created
+            self._set(row_id, UNKNOWN, error=str(error))
+
+    def run(
+            self,
+            workers: int = 8,
+            external_ids: Optional[Iterable[str]] = None,
+            limiter=None) -> Dict[str, int]:
+        """
+        Submit every unfinished order with bounded concurrency.
+
+        Ambiguous orders are resolved first, so a restart after a crash only sends what
+        never reached the API.
+
+        Args:
+            workers (int, optional): Maximum number of concurrent requests.
+            external_ids (Iterable[str], optional): Only submit these orders.
+            limiter (TokenBucket, optional): Paces the order requests, one token each.
+
+        Returns:
+            Dict[str, int]: The number of orders in each state afterwards.
+        """
+        external_ids = list(external_ids) if external_ids is not None else None
+        while True:
+            self.resolve_ambiguous()
+            in_flight = {}
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    if self._paused_until > time.monotonic() and not in_flight:
+                        time.sleep(max(0.0, self._paused_until - time.monotonic()))
+                    if len(in_flight) < workers and self._paused_until <= time.monotonic():
+                        for row_id, external_id, body in self._claim(workers - len(in_flight), external_ids):
+                            in_flight[executor.submit(self._send, external_id, body, limiter)] = row_id
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._record(in_flight.pop(future), future)
+            only, params = self._only(external_ids)
+            if not self.db.execute(f"SELECT 1 FROM orders WHERE state = ?{only} LIMIT 1", (UNKNOWN, *params)).fetchone():
+                return self.stats()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        The number of queued orders in each state.
+        """
+        return dict(self.db.execute("SELECT state, COUNT(*) FROM orders GROUP BY state").fetchall())
+
+    def items(self, state: Optional[str] = None) -> Iterator[QueuedOrderModel]:
+        """
+        Iterate over queued orders, optionally only those in ``state``.
+        """
+        query = "SELECT external_id, state, attempts, order_id, error FROM orders"
+        params = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        for external_id, row_state, attempts, order_id, error in self.db.execute(query + " ORDER BY id", params):
+            yield QueuedOrderModel(
+                external_id=external_id,
+                state=row_state,
+                attempts=attempts,
+                order_id=order_id,
+                error=error,
+            )
@@ -0,0 +1,283 @@
+import hashlib
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Dict, Iterable, List, Optional, Union
+
+from tremendous.jobs.order_queue import OrderQueue
+from tremendous.orders.spec import CompiledOrderModel, build_order_payload
+from tremendous.rate_limit import TokenBucket
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled (
+    id INTEGER PRIMARY KEY,
+    external_id TEXT NOT NULL UNIQUE,
+    body BLOB NOT NULL,
+    release_at REAL NOT NULL,
+    released_at REAL
+);
+CREATE INDEX IF NOT EXISTS scheduled_pending ON scheduled (released_at, release_at);
+"""
+
+class SchedulerStatsModel(BaseModel):
+    """
+    Queue depth and release lag of an ``OrderScheduler``.
+
+    Attributes:
+        pending (int): Orders waiting for their release time.
+        due (int): Pending orders whose release time has passed.
+        released (int): Orders released since the scheduler was created.
+        next_release_in (float): Seconds until the next release time, if any order is pending.
+        max_lag (float): Longest delay between an order's release time and its release, in seconds.
+        mean_lag (float): Mean release delay, in seconds.
+        p95_lag (float): 95th percentile release delay of recent releases, in seconds.
+    """
+    pending: int = 0
+    due: int = 0
+    released: int = 0
+    next_release_in: Optional[float] = None
+    max_lag: float = 0.0
+    mean_lag: float = 0.0
+    p95_lag: float = 0.0
+
+def _timestamp(release_at: Union[float, datetime, str]) -> float:
+    if isinstance(release_at, datetime):
+        return release_at.timestamp()
+    if isinstance(release_at, str):
+        return datetime.fromisoformat(release_at.replace("Z", "+00:00")).timestamp()
+    return float(release_at)
+
+class OrderScheduler:
+    """
+    Holds order specs until their release time, then creates them in rate-limited batches.
+
+    Unlike ``deliver_at``, which only delays delivery of an order that is created (and
+    funded) right away, a scheduled order is not created until its release time. Specs are
+    stored in the ``OrderQueue`` database (through a connection of the scheduler's own, so
+    its transactions never interleave with the queue's), so pending orders survive
+    restarts, and released orders go through the queue's crash-safe submission.
+
+    Pending orders are kept in a heap ordered by release time. Each release takes at most
+    ``batch_size`` due orders and submits only those, at most ``rate`` order requests per
+    second (other items of the queue are left to its own ``run``). Giving
+    ``spread`` when scheduling staggers each order's release time by a stable offset
+    derived from its ``external_id``, so orders scheduled for the same instant (e.g. the top
+    of the hour) ramp up instead of arriving at once.
+
+    Args:
+        queue (OrderQueue): The queue that released orders are submitted through.
+        rate (float, optional): Order requests sent per second.
+        batch_size (int, optional): Maximum orders released at once.
+        workers (int, optional): Concurrent requests while submitting a batch.
+
+    ```python
+    queue = OrderQueue(tremendous, "bonuses.db")
+    scheduler = OrderScheduler(queue, rate=20)
+    scheduler.schedule(order_specs, release_at="2026-11-01T09:00:00+00:00", spread=600)
+    scheduler.run()
+    ```
+    """
+
+    def __init__(self, queue: OrderQueue, rate: float = 10.0, batch_size: int = 100, workers: int = 8):
+        self.queue = queue
+        self.db = sqlite3.connect(queue.path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.batch_size = batch_size
+        self.workers = workers
+        self.limiter = TokenBucket(rate, capacity=batch_size)
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._heap: List[tuple] = []
+        self._load_heap()
+        self._wakeup = threading.Event()
+        self._released = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+        self._recent_lags: List[float] = []
+
+    def _load_heap(self) -> None:
+        self._heap = self.db.execute(
+            "SELECT release_at, id FROM scheduled WHERE released_at IS NULL"
+        ).fetchall()
+        heapq.heapify(self._heap)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def schedule(
+            self,
+            specs: Iterable[Union[Dict, CompiledOrderModel]],
+            release_at: Union[float, datetime, str],
+            spread: float = 0.0) -> int:
+        """
+        Hold order specs until ``release_at``.
+
+        Specs already scheduled (by ``external_id``) are ignored.
+
+        Args:
+            specs (Iterable[Union[Dict, CompiledOrderModel]]): ``Orders.create`` keyword
+                arguments or specs compiled by ``OrderSpecValidator``. Each needs an ``external_id``.
+            release_at (Union[float, datetime, str]): Release time, as a Unix timestamp, a
+                timezone-aware datetime or an ISO 8601 string.
+            spread (float, optional): Stagger releases over this many seconds after ``release_at``.
+
+        Returns:
+            int: The number of newly scheduled orders.
+        """
+        release_at = _timestamp(release_at)
+        rows = []
+        for spec in specs:
+            if isinstance(spec, CompiledOrderModel):
+                external_id, body = spec.external_id, spec.body
+            else:
+                external_id = spec.get("external_id")
+                body = json.dumps(build_order_payload(**spec), separators=(",", ":")).encode("utf-8")
+            if not external_id:
+                raise ValueError("scheduled orders need an external_id to be resumable")
+            offset = 0.0
+            if spread:
+                digest = hashlib.blake2b(external_id.encode("utf-8"), digest_size=8).digest()
+                offset = int.from_bytes(digest, "little") / 2 ** 64 * spread
+            rows.append((external_id, body, release_at + offset))
+        with self._lock:
+            self.db.execute("BEGIN")
+            added = []
+            for row in rows:
+                cursor = self.db.execute(
+                    "INSERT OR IGNORE INTO scheduled (external_id, body, release_at) VALUES (?, ?, ?)", row
+                )
+                if cursor.rowcount:
+                    added.append((row[2], cursor.lastrowid))
+            self.db.execute("COMMIT")
+            for item in added:
+                heapq.heappush(self._heap, item)
+        self._wakeup.set()
+        return len(added)
+
+    def cancel(self, external_id: str) -> bool:
+        """
+        Drop a pending order before its release.
+
+        Returns:
+            bool: Whether the order was pending.
+        """
+        with self._lock:
+            row = self.db.execute(
+                "SELECT id FROM scheduled WHERE external_id = ? AND released_at IS NULL", (external_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            self.db.execute("DELETE FROM scheduled WHERE id = ?", (row[0],))
+            # The heap entry is skipped when it comes due
+        return True
+
+    def _take_due(self, now: float) -> List[tuple]:
+        with self._lock:
+            due = []
+            while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+                due.append(heapq.heappop(self._heap))
+            if not due:
+                return []
+            rows = []
+            for release_at, row_id in due:
+                row = self.db.execute(
+                    "SELECT external_id, body FROM scheduled WHERE id = ? AND released_at IS NULL", (row_id,)
+                ).fetchone()
+                if row is not None:
+                    rows.append((row_id, release_at, row[0], row[1]))
+            return rows
+
+    def release_due(self) -> int:
+        """
+        Release one batch of due orders and submit them.
+
+        Returns:
+            int: The number of orders released.
+        """
+        rows = self._take_due(time.time())
+        if not rows:
+            return 0
+        released_at = time.time()
+        try:
+            self.queue.enqueue(
+                CompiledOrderModel(external_id=external_id, payload={}, body=body)
+                for _, _, external_id, body in rows
+            )
+            with self._lock:
+                self.db.execute("BEGIN")
+                self.db.executemany(
+                    "UPDATE scheduled SET released_at = ? WHERE id = ?",
+                    [(released_at, row_id) for row_id, _, _, _ in rows],
+                )
+                self.db.execute("COMMIT")
+        except BaseException:
+            with self._lock:
+                if self.db.in_transaction:
+                    self.db.execute("ROLLBACK")
+                # The batch was taken off the heap; put back whatever was not released
+                self._load_heap()
+            raise
+        with self._lock:
+            for _, release_at, _, _ in rows:
+                lag = max(0.0, released_at - release_at)
+                self._released += 1
+                self._total_lag += lag
+                self._max_lag = max(self._max_lag, lag)
+                self._recent_lags.append(lag)
+            del self._recent_lags[:-1000]
+        # Only this batch is sent, one limiter token per order request
+        self.queue.run(
+            workers=self.workers,
+            external_ids=[external_id for _, _, external_id, _ in rows],
+            limiter=self.limiter,
+        )
+        return len(rows)
+
+    def run(self, stop: Optional[threading.Event] = None, idle: float = 60.0) -> None:
+        """
+        Release orders as they come due.
+
+        Without ``stop``, returns once no order is pending; otherwise keeps waiting for newly
+        scheduled orders until ``stop`` is set.
+
+        Args:
+            stop (threading.Event, optional): Set to stop the scheduler.
+            idle (float, optional): Longest sleep between checks, in seconds.
+        """
+        while stop is None or not stop.is_set():
+            if self.release_due():
+                continue
+            with self._lock:
+                next_release = self._heap[0][0] if self._heap else None
+            if next_release is None and stop is None:
+                return
+            delay = idle if next_release is None else min(idle, max(0.0, next_release - time.time()))
+            self._wakeup.clear()
+            # Wake up for newly scheduled orders, and at least every second to notice ``stop``
+            self._wakeup.wait(delay if stop is None else min(delay, 1.0))
+
+    def stats(self) -> SchedulerStatsModel:
+        """
+        Current queue depth and release lag.
+        """
+        now = time.time()
+        with self._lock:
+            pending, due, next_release = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(release_at <= ?), 0), MIN(release_at) "
+                "FROM scheduled WHERE released_at IS NULL",
+                (now,),
+            ).fetchone()
+            recent = sorted(self._recent_lags)
+            return SchedulerStatsModel(
+                pending=pending,
+                due=due,
+                released=self._released,
+                next_release_in=None if next_release is None else max(0.0, next_release - now),
+                max_lag=self._max_lag,
+                mean_lag=self._total_lag / self._released if self._released else 0.0,
+                p95_lag=recent[int(len(recent) * 0.95)] if recent else 0.0,
+            )
@@ -0,0 +1,5 @@
+from .ledger import (
+    BloomFilter,
+    DuplicateModel,
+    RewardLedger
+)
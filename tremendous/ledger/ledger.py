@@ -0,0 +1,264 @@
+import hashlib
+import math
+import threading
+from pydantic import BaseModel
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from tremendous.exceptions import CircuitOpenError, TremendousError
+from tremendous.orders.order import OrderModel
+from tremendous.pagination import paginate
+from tremendous.rewards.reward import RewardModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+# The API's currency for values given without a currency_code
+DEFAULT_CURRENCY = "USD"
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Args:
+        capacity (int): Expected number of items.
+        error_rate (float, optional): Target false positive rate at ``capacity`` items.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class DuplicateModel(BaseModel):
+    """
+    A probable duplicate of an order spec.
+
+    Attributes:
+        reason (str): ``"external_id"`` when the external ID was already used, ``"recipient"``
+            when the same recipient already got the same value in the same campaign.
+        key (str): The ledger key that matched.
+        order_id (str): The existing order, when known.
+        reward_id (str): The existing reward, when known.
+    """
+    reason: str
+    key: str
+    order_id: Optional[str] = None
+    reward_id: Optional[str] = None
+
+class RewardLedger:
+    """
+    Local index of paid rewards used to catch double payouts before submission.
+
+    Every known reward is indexed by its order's ``external_id`` and by
+    (recipient email or phone, campaign, value), so checking an order spec is a
+    constant-time dictionary lookup instead of an ``Orders.list(external_id=...)`` call.
+    Lookups go through a Bloom filter first, whose misses are definitive. For very large
+    histories the exact index can be dropped (``exact=False``) to keep only the filters,
+    about 2.4 bytes per reward; a hit then means a probable duplicate.
+
+    Args:
+        exact (bool, optional): Keep the exact index (with order/reward IDs) behind the Bloom filters.
+        capacity (int, optional): Expected number of rewards, sizing the Bloom filters.
+        error_rate (float, optional): False positive rate of the Bloom filters.
+
+    ```python
+    ledger = RewardLedger.build(tremendous)
+    for spec in order_specs:
+        duplicates = ledger.check(spec)
+        if duplicates:
+            print("skipping", spec["external_id"], duplicates)
+            continue
+        ledger.create(tremendous, **spec)
+    ```
+    """
+
+    def __init__(self, exact: bool = True, capacity: int = 1_000_000, error_rate: float = 0.0001):
+        self.exact = exact
+        self._lock = threading.RLock()
+        self._filters = {
+            "external_id": BloomFilter(capacity, error_rate),
+            "recipient": BloomFilter(capacity, error_rate),
+        }
+        self._index: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = {
+            "external_id": {},
+            "recipient": {},
+        }
+        # Specs of requests in flight; kept out of the filters until their outcome is known
+        self._reserved: Dict[str, Dict[str, int]] = {"external_id": {}, "recipient": {}}
+        self.size = 0
+
+    @staticmethod
+    def recipient_key(recipient: Dict, campaign_id: Optional[str], value: Dict) -> Optional[str]:
+        """
+        The (recipient, campaign, value) key, or None when the recipient has no email or phone.
+
+        Specs, rewards returned by the API and lookups all go through this normalization, so
+        a spec without a ``currency_code`` matches the USD reward it creates.
+        """
+        contact = (recipient.get("email") or "").strip().lower() or (recipient.get("phone") or "").strip()
+        if not contact:
+            return None
+        denomination = float(value.get("denomination") or 0)
+        return f"{contact}|{campaign_id or ''}|{denomination:.2f}|{(value.get('currency_code') or DEFAULT_CURRENCY).upper()}"
+
+    def _add(self, external_id: Optional[str], recipient_key: Optional[str], order_id: Optional[str], reward_id: Optional[str]) -> None:
+        with self._lock:
+            for reason, key in (("external_id", external_id), ("recipient", recipient_key)):
+                if not key:
+                    continue
+                self._filters[reason].add(key)
+                if self.exact:
+                    self._index[reason][key] = (order_id, reward_id)
+            self.size += 1
+
+    def add_reward(self, reward: RewardModel, external_id: Optional[str] = None, campaign_id: Optional[str] = None) -> None:
+        recipient_key = self.recipient_key(
+            reward.recipient.model_dump(),
+            reward.campaign_id or campaign_id,
+            reward.value.model_dump(),
+        )
+        self._add(external_id, recipient_key, reward.order_id, reward.id)
+
+    def add_order(self, order: OrderModel) -> None:
+        """
+        Record an order and its rewards, e.g. the result of ``Orders.create``.
+        """
+        if not order.rewards:
+            self._add(order.external_id, None, order.id, None)
+        for reward in order.rewards or []:
+            self.add_reward(reward, external_id=order.external_id, campaign_id=order.campaign_id)
+
+    def add_spec(self, spec: Dict, order_id: Optional[str] = None) -> None:
+        """
+        Record an order spec, e.g. when it is queued or submitted before its order is known.
+        """
+        keys = dict(self._spec_keys(spec))
+        self._add(keys.get("external_id"), keys.get("recipient"), order_id, None)
+
+    def check(self, spec: Dict) -> List[DuplicateModel]:
+        """
+        Look up probable duplicates of an order spec (``Orders.create`` keyword arguments).
+
+        Returns:
+            List[DuplicateModel]: Empty when the spec matches nothing in the ledger.
+        """
+        duplicates = []
+        with self._lock:
+            for reason, key in self._spec_keys(spec):
+                if key in self._reserved[reason]:
+                    duplicates.append(DuplicateModel(reason=reason, key=key))
+                    continue
+                # A Bloom filter miss is definitive, so most specs never touch the exact index
+                if key not in self._filters[reason]:
+                    continue
+                if not self.exact:
+                    duplicates.append(DuplicateModel(reason=reason, key=key))
+                    continue
+                match = self._index[reason].get(key)
+                if match is not None:
+                    duplicates.append(DuplicateModel(reason=reason, key=key, order_id=match[0], reward_id=match[1]))
+        return duplicates
+
+    def _spec_keys(self, spec: Dict) -> List[Tuple[str, str]]:
+        keys = (
+            ("external_id", spec.get("external_id")),
+            ("recipient", self.recipient_key(spec.get("recipient") or {}, spec.get("campaign_id"), spec.get("value") or {})),
+        )
+        return [(reason, key) for reason, key in keys if key]
+
+    def _reserve(self, keys: List[Tuple[str, str]], count: int) -> None:
+        for reason, key in keys:
+            remaining = self._reserved[reason].get(key, 0) + count
+            if remaining:
+                self._reserved[reason][key] = remaining
+            else:
+                del self._reserved[reason][key]
+
+    def create(self, client: "TremendousClient", **spec) -> OrderModel:
+        """
+        ``Orders.create`` guarded by the ledger.
+
+        The spec is reserved before the request is sent, so a concurrent worker retrying the
+        same payout is caught even while this request is in flight. If the API rejects the
+        order (a 4xx) or it is never sent (open circuit), the reservation is released and the
+        spec can be fixed and resubmitted. After a timeout or a 5xx the order may still have
+        been placed, so the spec stays recorded.
+
+        Raises:
+            ValueError: If the spec is a probable duplicate.
+        """
+        keys = self._spec_keys(spec)
+        with self._lock:
+            duplicates = self.check(spec)
+            if duplicates:
+                raise ValueError(f"probable duplicate payout: {', '.join(d.reason + ' ' + d.key for d in duplicates)}")
+            self._reserve(keys, 1)
+        try:
+            order = client.Orders.create(**spec)
+        except Exception as error:
+            rejected = isinstance(error, CircuitOpenError) or (
+                isinstance(error, TremendousError) and error.status_code is not None and error.status_code < 500
+            )
+            with self._lock:
+                self._reserve(keys, -1)
+                if not rejected:
+                    self.add_spec(spec)
+            raise
+        with self._lock:
+            self._reserve(keys, -1)
+            self.add_order(order)
+        return order
+
+    @classmethod
+    def build(
+            cls,
+            client: "TremendousClient",
+            created_at_gte: Optional[str] = None,
+            page_size: int = 100,
+            exact: bool = True,
+            capacity: int = 1_000_000) -> "RewardLedger":
+        """
+        Build a ledger from the order history (rewards are embedded in their orders).
+
+        Args:
+            client (TremendousClient): The client used to list orders.
+            created_at_gte (str, optional): Only index orders created at or after this time.
+            page_size (int, optional): Page size used when listing orders.
+            exact (bool, optional): Keep the exact index behind the Bloom filters.
+            capacity (int, optional): Expected number of rewards, sizing the Bloom filters.
+        """
+        ledger = cls(exact=exact, capacity=capacity)
+        ledger.add_orders(paginate(client.Orders.list, page_size=page_size, created_at_gte=created_at_gte))
+        return ledger
+
+    def add_orders(self, orders: Iterable[OrderModel]) -> "RewardLedger":
+        """
+        Record orders, e.g. a page of ``Orders.list``.
+        """
+        for order in orders:
+            self.add_order(order)
+        return self
+
+    def add_rewards(self, rewards: Iterable[RewardModel]) -> "RewardLedger":
+        """
+        Record rewards, e.g. a page of ``Rewards.list``. Rewards carry no external ID, so only
+        the recipient key is indexed.
+        """
+        for reward in rewards:
+            self.add_reward(reward)
+        return self
@@ -0,0 +1,4 @@
+from .metrics import (
+    ClientMetrics,
+    ClientStatsModel
+)
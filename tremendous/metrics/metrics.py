@@ -0,0 +1,130 @@
+import threading
+import weakref
+from pydantic import BaseModel
+from typing import List, Optional
+
+class ClientStatsModel(BaseModel):
+    """
+    Request statistics of a client.
+
+    Attributes:
+        requests (int): Requests that got a response.
+        errors (int): Responses with a 4xx or 5xx status.
+        transport_errors (int): Requests that failed without a response (timeouts, connection errors).
+        bytes_received (int): Response body bytes after decoding.
+        bytes_received_on_wire (int): Response body bytes as received, before decompression.
+            Only measured with ``compression`` enabled; otherwise equal to ``bytes_received``.
+        decompress_seconds (float): Time spent decompressing response bodies.
+        bytes_sent (int): Request body bytes before compression.
+        bytes_sent_on_wire (int): Request body bytes as sent.
+        compress_seconds (float): Time spent compressing request bodies.
+        request_seconds (float): Time spent waiting for responses, summed over all requests.
+        threads (int): Threads that have sent requests through the client.
+    """
+    requests: int = 0
+    errors: int = 0
+    transport_errors: int = 0
+    bytes_received: int = 0
+    bytes_received_on_wire: int = 0
+    decompress_seconds: float = 0.0
+    bytes_sent: int = 0
+    bytes_sent_on_wire: int = 0
+    compress_seconds: float = 0.0
+    request_seconds: float = 0.0
+    threads: int = 0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.request_seconds / self.requests if self.requests else 0.0
+
+    @property
+    def response_compression_ratio(self) -> float:
+        """
+        Decoded over received response bytes; 4.0 means responses shrank to a quarter on the wire.
+        """
+        return self.bytes_received / self.bytes_received_on_wire if self.bytes_received_on_wire else 1.0
+
+    @property
+    def request_compression_ratio(self) -> float:
+        return self.bytes_sent / self.bytes_sent_on_wire if self.bytes_sent_on_wire else 1.0
+
+class _Counters:
+
+    __slots__ = (
+        "requests", "errors", "transport_errors", "bytes_received", "bytes_received_on_wire",
+        "decompress_seconds", "bytes_sent", "bytes_sent_on_wire", "compress_seconds", "request_seconds",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+class ClientMetrics:
+    """
+    Request counters that threads update without taking a lock.
+
+    Every thread writes only to its own counters; ``snapshot`` adds them up. A snapshot
+    taken while requests are running may miss the requests finishing at that moment.
+    When a thread is gone, its counters are folded into a running total, so clients used
+    from short-lived threads do not keep one set of counters per thread ever seen.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._counters: List[_Counters] = []
+        self._retired = _Counters()
+        self._retired_threads = 0
+        self._lock = threading.Lock()
+
+    def _mine(self) -> _Counters:
+        counters = getattr(self._local, "counters", None)
+        if counters is None:
+            counters = self._local.counters = _Counters()
+            # list.append is atomic; the lock is only taken when a thread is gone
+            self._counters.append(counters)
+            weakref.finalize(threading.current_thread(), self._retire, counters)
+        return counters
+
+    def _retire(self, counters: _Counters) -> None:
+        with self._lock:
+            for name in _Counters.__slots__:
+                setattr(self._retired, name, getattr(self._retired, name) + getattr(counters, name))
+            self._retired_threads += 1
+            self._counters.remove(counters)
+
+    def record(
+            self,
+            status_code: int,
+            seconds: float,
+            size: int,
+            wire_size: Optional[int] = None,
+            decompress_seconds: float = 0.0) -> None:
+        counters = self._mine()
+        counters.requests += 1
+        counters.request_seconds += seconds
+        counters.bytes_received += size
+        counters.bytes_received_on_wire += size if wire_size is None else wire_size
+        counters.decompress_seconds += decompress_seconds
+        if status_code >= 400:
+            counters.errors += 1
+
+    def record_sent(self, size: int, wire_size: int, compress_seconds: float = 0.0) -> None:
+        counters = self._mine()
+        counters.bytes_sent += size
+        counters.bytes_sent_on_wire += wire_size
+        counters.compress_seconds += compress_seconds
+
+    def record_failure(self, seconds: float) -> None:
+        counters = self._mine()
+        counters.transport_errors += 1
+        counters.request_seconds += seconds
+
+    def snapshot(self) -> ClientStatsModel:
+        stats = ClientStatsModel()
+        with self._lock:
+            counters = [self._retired, *self._counters]
+            stats.threads = len(self._counters) + self._retired_threads
+            for item in counters:
+                for name in _Counters.__slots__:
+                    setattr(stats, name, getattr(stats, name) + getattr(item, name))
+        return stats
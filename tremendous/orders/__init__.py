@@ -1,4 +1,15 @@
 from .order import (
     Orders, 
     OrderModel
-)
\ No newline at end of file
+)
+from .spec import (
+    OrderSpecValidator,
+    OrderSpecError,
+    CompiledOrderModel,
+    build_order_payload
+)
+from .packer import (
+    OrderPacker,
+    PackedOrderModel,
+    PackedRewardModel
+)
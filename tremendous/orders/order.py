@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import List, Dict, TYPE_CHECKING, Optional
 from tremendous.rewards.reward import RewardModel
+from tremendous.orders.spec import build_order_payload, CompiledOrderModel
 
 if TYPE_CHECKING:
     from tremendous.client import Tremendous
@@ -120,23 +121,36 @@ class Orders:
         return self.client._create(
             path="/orders",
             model_cls=OrderModel,
-            params={
-                "external_id": external_id,
-                "payment": {
-                    "funding_source_id": payment_funding_source_id
-                },
-                "reward": {
-                    "campaign_id": campaign_id,
-                    "products": products,
-                    "recipient": recipient,
-                    "value": value,
-                    "deliver_at": deliver_at,
-                    "custom_fields": [custom_fields],
-                    "language": language,
-                    "delivery": delivery_method,
-                    "meta_data": meta_data
-                },
-            },
+            params=build_order_payload(
+                payment_funding_source_id=payment_funding_source_id,
+                recipient=recipient,
+                value=value,
+                campaign_id=campaign_id,
+                products=products,
+                external_id=external_id,
+                deliver_at=deliver_at,
+                custom_fields=custom_fields,
+                language=language,
+                delivery_method=delivery_method,
+                meta_data=meta_data
+            ),
+            list_key="order"
+        )
+
+    def submit(self, compiled: CompiledOrderModel) -> OrderModel:
+        """
+        Create an order from a spec pre-compiled by ``OrderSpecValidator``.
+
+        The request body was validated and encoded once at compile time and is sent as is.
+
+        Args:
+            compiled (CompiledOrderModel): The compiled order spec.
+        """
+
+        return self.client._create(
+            path="/orders",
+            model_cls=OrderModel,
+            data=compiled.body,
             list_key="order"
         )
 
@@ -0,0 +1,190 @@
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from tremendous.orders.order import OrderModel
+from tremendous.orders.spec import build_order_payload
+from tremendous.rewards.reward import RewardModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+class PackedOrderModel(BaseModel):
+    """
+    Several order specs packed into one multi-reward order.
+
+    Attributes:
+        external_id (str): External ID of the packed order, derived from its specs.
+        indexes (List[int]): Positions of the packed specs in the input, in reward order.
+        body (bytes): The ``POST /orders`` request body.
+    """
+    external_id: str
+    indexes: List[int]
+    body: bytes
+
+class PackedRewardModel(BaseModel):
+    """
+    The outcome of one input spec.
+
+    Attributes:
+        index (int): Position of the spec in the input.
+        external_id (str): The spec's own ``external_id``, if it had one.
+        order_external_id (str): External ID of the packed order the spec was sent in.
+        order_id (str): The created order.
+        reward (RewardModel): The reward created for the spec.
+        error (str): The error message, if the packed order failed.
+    """
+    index: int
+    external_id: Optional[str] = None
+    order_external_id: Optional[str] = None
+    order_id: Optional[str] = None
+    reward: Optional[RewardModel] = None
+    error: Optional[str] = None
+
+def _contact(recipient: Dict) -> str:
+    return ((recipient or {}).get("email") or (recipient or {}).get("phone") or "").strip().lower()
+
+def _reward_key(contact: str, denomination) -> Tuple[str, str]:
+    return (contact, f"{float(denomination or 0):.2f}")
+
+class OrderPacker:
+    """
+    Packs compatible reward specs into multi-reward orders to cut requests per payout.
+
+    Specs (``Orders.create`` keyword arguments) that share a funding source, campaign,
+    delivery method and language are grouped into orders of up to ``max_rewards`` rewards,
+    so N recipients take about N / ``max_rewards`` requests instead of N. Within a group,
+    specs are ordered by their own ``external_id`` (or, without one, by a hash of their
+    payload) before they are chunked, and each packed order gets an ``external_id`` derived
+    from its specs. Resubmitting the same set of specs, in any order, therefore packs them
+    identically and is idempotent. Adding or removing specs moves the chunk boundaries of
+    their group, so only resubmit a batch unchanged. The rewards of every created order
+    are mapped back to the input specs, in request order and checked by recipient and
+    value.
+
+    The per-spec ``external_id`` is not sent (external IDs belong to orders); it is kept
+    in the results instead.
+
+    Args:
+        client (TremendousClient): The client used to create orders.
+        max_rewards (int, optional): Maximum rewards per order.
+        workers (int, optional): Concurrent order requests.
+
+    ```python
+    packer = OrderPacker(tremendous, max_rewards=100)
+    for result in packer.submit(order_specs):
+        if result.error:
+            print("failed", result.external_id, result.error)
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", max_rewards: int = 100, workers: int = 8):
+        if max_rewards < 1:
+            raise ValueError("max_rewards must be positive")
+        self.client = client
+        self.max_rewards = max_rewards
+        self.workers = workers
+
+    @staticmethod
+    def group_key(spec: Dict) -> str:
+        """
+        Specs with the same key can share an order.
+        """
+        return json.dumps([
+            spec.get("payment_funding_source_id"),
+            spec.get("campaign_id"),
+            spec.get("delivery_method"),
+            spec.get("language", "en"),
+        ], sort_keys=True, default=str)
+
+    def pack(self, specs: List[Dict]) -> List[PackedOrderModel]:
+        """
+        Group specs into multi-reward orders without sending anything.
+        """
+        groups: Dict[str, List[int]] = defaultdict(list)
+        payloads: Dict[int, Dict] = {}
+        identities: Dict[int, str] = {}
+        for index, spec in enumerate(specs):
+            groups[self.group_key(spec)].append(index)
+            payloads[index] = build_order_payload(**spec)
+            identities[index] = spec.get("external_id") or hashlib.blake2b(
+                json.dumps(payloads[index], sort_keys=True).encode("utf-8"), digest_size=16,
+            ).hexdigest()
+        packed = []
+        for key in sorted(groups):
+            # Chunks must not depend on input order, or a resubmitted batch gets new external IDs
+            indexes = sorted(groups[key], key=lambda index: (identities[index], index))
+            for start in range(0, len(indexes), self.max_rewards):
+                chunk = indexes[start:start + self.max_rewards]
+                digest = hashlib.blake2b(digest_size=12)
+                for index in chunk:
+                    digest.update(identities[index].encode("utf-8"))
+                    digest.update(b"\0")
+                external_id = f"pack-{digest.hexdigest()}"
+                body = {"external_id": external_id, "payment": payloads[chunk[0]]["payment"]}
+                if len(chunk) == 1:
+                    body["reward"] = payloads[chunk[0]]["reward"]
+                else:
+                    body["rewards"] = [payloads[index]["reward"] for index in chunk]
+                packed.append(PackedOrderModel(
+                    external_id=external_id,
+                    indexes=chunk,
+                    body=json.dumps(body, separators=(",", ":")).encode("utf-8"),
+                ))
+        return packed
+
+    def _match(self, specs: List[Dict], packed: PackedOrderModel, order: OrderModel) -> List[Optional[RewardModel]]:
+        rewards = order.rewards or []
+        wanted = [
+            _reward_key(_contact(specs[index].get("recipient")), (specs[index].get("value") or {}).get("denomination"))
+            for index in packed.indexes
+        ]
+        found = [_reward_key(_contact(reward.recipient.model_dump()), reward.value.denomination) for reward in rewards]
+        if found == wanted:
+            return list(rewards)
+        # Rewards came back in another order: match by recipient and value
+        pool: Dict[Tuple[str, str], List[RewardModel]] = defaultdict(list)
+        for key, reward in zip(found, rewards):
+            pool[key].append(reward)
+        return [pool[key].pop(0) if pool.get(key) else None for key in wanted]
+
+    def _send(self, specs: List[Dict], packed: PackedOrderModel) -> List[PackedRewardModel]:
+        def result(index: int, **fields) -> PackedRewardModel:
+            return PackedRewardModel(
+                index=index,
+                external_id=specs[index].get("external_id"),
+                order_external_id=packed.external_id,
+                **fields,
+            )
+
+        try:
+            order = self.client._create(path="/orders", model_cls=OrderModel, data=packed.body, list_key="order")
+        except Exception as error:
+            return [result(index, error=str(error)) for index in packed.indexes]
+        rewards = self._match(specs, packed, order)
+        return [
+            result(index, order_id=order.id, reward=reward,
+                   error=None if reward is not None else "no matching reward in the created order")
+            for index, reward in zip(packed.indexes, rewards)
+        ]
+
+    def submit(self, specs: List[Dict]) -> List[PackedRewardModel]:
+        """
+        Pack the specs and create the orders concurrently.
+
+        A failed order does not stop the others; each of its specs gets the error.
+
+        Returns:
+            List[PackedRewardModel]: One result per input spec, in input order.
+        """
+        specs = list(specs)
+        packed = self.pack(specs)
+        results: List[Optional[PackedRewardModel]] = [None] * len(specs)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(packed)))) as executor:
+            for batch in executor.map(lambda order: self._send(specs, order), packed):
+                for item in batch:
+                    results[item.index] = item
+        return results
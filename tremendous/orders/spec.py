@@ -0,0 +1,297 @@
+import json
+import re
+from pydantic import BaseModel
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tremendous.catalog import CatalogChangeModel
+    from tremendous.client import TremendousClient
+    from tremendous.products import ProductModel
+
+ORDER_SPEC_FIELDS = {
+    "payment_funding_source_id", "recipient", "value", "campaign_id", "products", "external_id",
+    "deliver_at", "custom_fields", "language", "delivery_method", "meta_data",
+}
+DELIVERY_METHODS = {"EMAIL", "LINK", "PHONE"}
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+CURRENCY_PATTERN = re.compile(r"^[A-Z]{3}$")
+# Custom field scopes whose values are set through the custom fields of an order spec
+ORDER_FIELD_SCOPES = {"REWARD", "ORDER"}
+
+def strip_nulls(value):
+    """
+    Recursively drop ``None`` values from dicts (and dicts nested in lists).
+    """
+    if isinstance(value, dict):
+        return {key: strip_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [strip_nulls(item) for item in value]
+    return value
+
+def build_order_payload(
+        payment_funding_source_id: str,
+        recipient: Dict,
+        value: Dict,
+        campaign_id: Optional[str] = None,
+        products: Optional[List[str]] = None,
+        external_id: Optional[str] = None,
+        deliver_at: Optional[str] = None,
+        custom_fields: Optional[List[Dict[str, str]]] = None,
+        language: str = "en",
+        delivery_method: Optional[Dict] = None,
+        meta_data: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    Build the ``POST /orders`` request body from ``Orders.create`` arguments.
+
+    ``None`` fields are left out, and a single custom field dict is wrapped in a list.
+    """
+    if isinstance(custom_fields, dict):
+        custom_fields = [custom_fields]
+    return strip_nulls({
+        "external_id": external_id,
+        "payment": {
+            "funding_source_id": payment_funding_source_id
+        },
+        "reward": {
+            "campaign_id": campaign_id,
+            "products": products,
+            "recipient": recipient,
+            "value": value,
+            "deliver_at": deliver_at,
+            "custom_fields": custom_fields,
+            "language": language,
+            "delivery": delivery_method,
+            "meta_data": meta_data
+        },
+    })
+
+class CompiledOrderModel(BaseModel):
+    """
+    An order spec that passed validation, serialized once and ready to send.
+
+    Attributes:
+        external_id (str): The external ID of the order, if any.
+        payload (Dict): The request body.
+        body (bytes): The request body encoded as compact JSON.
+    """
+    external_id: Optional[str] = None
+    payload: Dict
+    body: bytes
+
+class OrderSpecError(ValueError):
+    """
+    Raised when an order spec fails client-side validation.
+
+    Attributes:
+        index (int): Position of the spec in the batch, if compiled as part of one.
+        errors (List[str]): Every problem found with the spec.
+    """
+
+    def __init__(self, errors: List[str], index: Optional[int] = None):
+        self.errors = errors
+        self.index = index
+        prefix = f"order spec {index}: " if index is not None else "order spec: "
+        super().__init__(prefix + "; ".join(errors))
+
+class OrderSpecValidator:
+    """
+    Validates and pre-compiles order specs against cached account metadata.
+
+    Products, campaigns, funding sources and custom fields are fetched once by ``refresh``
+    and kept in hash indexes, so each spec is checked locally in constant time and encoded to
+    JSON exactly once. Specs are dicts of keyword arguments as passed to ``Orders.create``.
+
+    Args:
+        client (TremendousClient): The client used to fetch metadata.
+        catalogs (List[Tuple[str, str]], optional): ``(country, currency)`` pairs whose product
+            catalogs are loaded. Defaults to ``[("US", "USD")]``.
+
+    ```python
+    validator = OrderSpecValidator(tremendous).refresh()
+    compiled, rejected = validator.compile_many(order_specs)
+    for error in rejected:
+        print(error)
+    for order in compiled:
+        tremendous.Orders.submit(order)
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", catalogs: Optional[List[Tuple[str, str]]] = None):
+        self.client = client
+        self.catalogs = catalogs or [("US", "USD")]
+        self.products: Dict[str, Tuple[set, list]] = {}
+        self._catalog_products: Dict[str, Dict[str, "ProductModel"]] = {}
+        self.campaigns: set = set()
+        self.funding_sources: Dict[str, Optional[str]] = {}
+        self.fields: set = set()
+        self.required_fields: set = set()
+        self.loaded = False
+
+    def refresh(self) -> "OrderSpecValidator":
+        """
+        (Re)load products, campaigns, funding sources and fields from the API.
+        """
+        self._catalog_products = {
+            f"{country}/{currency}": {
+                product.id: product for product in self.client.Products.list(country=country, currency=currency)
+            }
+            for country, currency in self.catalogs
+        }
+        self.products = {}
+        for catalog in self._catalog_products.values():
+            for product_id in catalog:
+                self._index_product(product_id)
+        self.campaigns = {campaign.id for campaign in self.client.Campaigns.list()}
+        self.funding_sources = {source.id: source.status for source in self.client.FundingSources.list()}
+        fields = self.client.Fields.list()
+        self.fields = {field.id for field in fields}
+        # Fields of other scopes (e.g. recipients) are not set by order specs
+        self.required_fields = {
+            field.id for field in fields
+            if field.required and (not field.scope or field.scope.upper() in ORDER_FIELD_SCOPES)
+        }
+        self.loaded = True
+        return self
+
+    def _index_product(self, product_id: str) -> None:
+        versions = [catalog[product_id] for catalog in self._catalog_products.values() if product_id in catalog]
+        if not versions:
+            self.products.pop(product_id, None)
+            return
+        currencies, skus = set(), []
+        for product in versions:
+            currencies.update(product.currency_codes)
+            skus.extend((sku.min, sku.max) for sku in product.skus)
+        self.products[product_id] = (currencies, skus)
+
+    def apply_catalog_changes(self, changes: List["CatalogChangeModel"]) -> None:
+        """
+        Update the product index from ``CatalogWatcher`` changes instead of a full ``refresh``.
+
+        Changes of catalogs this validator does not load are ignored.
+        """
+        affected = set()
+        for change in changes:
+            catalog = self._catalog_products.get(change.catalog)
+            if catalog is None:
+                continue
+            if change.product is None:
+                catalog.pop(change.product_id, None)
+            else:
+                catalog[change.product_id] = change.product
+            affected.add(change.product_id)
+        for product_id in affected:
+            self._index_product(product_id)
+
+    def _check_products(self, products: List[str], denomination: float, currency: Optional[str], errors: List[str]) -> None:
+        for product_id in products:
+            if product_id not in self.products:
+                errors.append(f"unknown product {product_id}")
+                continue
+            currencies, skus = self.products[product_id]
+            if currency and currencies and currency not in currencies:
+                errors.append(f"product {product_id} does not support {currency}")
+            ranges = [(low, high) for low, high in skus if low is not None or high is not None]
+            if ranges and not any(
+                    (low is None or denomination >= low) and (high is None or denomination <= high)
+                    for low, high in ranges):
+                errors.append(f"value {denomination} is outside the SKU ranges of product {product_id}")
+
+    def validate(self, spec: Dict) -> List[str]:
+        """
+        Check an order spec against the cached metadata.
+
+        Args:
+            spec (Dict): Keyword arguments for ``Orders.create``.
+
+        Returns:
+            List[str]: Every problem found; empty when the spec is valid.
+        """
+        if not self.loaded:
+            self.refresh()
+        errors = [f"unknown order spec field {key}" for key in spec if key not in ORDER_SPEC_FIELDS]
+
+        funding_source_id = spec.get("payment_funding_source_id")
+        if not funding_source_id:
+            errors.append("payment_funding_source_id is required")
+        elif funding_source_id not in self.funding_sources:
+            errors.append(f"unknown funding source {funding_source_id}")
+        elif self.funding_sources[funding_source_id] not in (None, "active"):
+            errors.append(f"funding source {funding_source_id} is {self.funding_sources[funding_source_id]}")
+
+        delivery = spec.get("delivery_method") or {}
+        method = (delivery.get("method") or "EMAIL").upper()
+        if method not in DELIVERY_METHODS:
+            errors.append(f"unknown delivery method {method}")
+
+        recipient = spec.get("recipient") or {}
+        email, phone = recipient.get("email"), recipient.get("phone")
+        if not recipient.get("name"):
+            errors.append("recipient name is required")
+        if email and not EMAIL_PATTERN.match(email):
+            errors.append(f"invalid recipient email {email}")
+        if method == "EMAIL" and not email:
+            errors.append("recipient email is required for EMAIL delivery")
+        if method == "PHONE" and not phone:
+            errors.append("recipient phone is required for PHONE delivery")
+
+        value = spec.get("value") or {}
+        denomination = value.get("denomination")
+        currency = value.get("currency_code")
+        if not isinstance(denomination, (int, float)) or isinstance(denomination, bool) or denomination <= 0:
+            errors.append(f"invalid value denomination {denomination!r}")
+            denomination = None
+        if currency is not None and not CURRENCY_PATTERN.match(currency):
+            errors.append(f"invalid currency code {currency!r}")
+
+        campaign_id = spec.get("campaign_id")
+        products = spec.get("products")
+        if not campaign_id and not products:
+            errors.append("either campaign_id or products is required")
+        if campaign_id and campaign_id not in self.campaigns:
+            errors.append(f"unknown campaign {campaign_id}")
+        if products and denomination is not None:
+            self._check_products(products, denomination, currency, errors)
+
+        custom_fields = spec.get("custom_fields") or []
+        if isinstance(custom_fields, dict):
+            custom_fields = [custom_fields]
+        field_ids = {field.get("id") for field in custom_fields}
+        for field_id in field_ids - self.fields:
+            errors.append(f"unknown custom field {field_id}")
+        for field_id in self.required_fields - field_ids:
+            errors.append(f"required custom field {field_id} is missing")
+
+        return errors
+
+    def compile(self, spec: Dict, index: Optional[int] = None) -> CompiledOrderModel:
+        """
+        Validate an order spec and encode its request body.
+
+        Raises:
+            OrderSpecError: If the spec is invalid.
+        """
+        errors = self.validate(spec)
+        if errors:
+            raise OrderSpecError(errors, index=index)
+        payload = build_order_payload(**spec)
+        return CompiledOrderModel(
+            external_id=spec.get("external_id"),
+            payload=payload,
+            body=json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+        )
+
+    def compile_many(self, specs: Iterable[Dict]) -> Tuple[List[CompiledOrderModel], List[OrderSpecError]]:
+        """
+        Compile a batch of order specs, collecting rejections instead of raising.
+
+        Returns:
+            Tuple[List[CompiledOrderModel], List[OrderSpecError]]: The compiled orders and the rejected specs.
+        """
+        compiled, rejected = [], []
+        for index, spec in enumerate(specs):
+            try:
+                compiled.append(self.compile(spec, index=index))
+            except OrderSpecError as error:
+                rejected.append(error)
+        return compiled, rejected
@@ -0,0 +1,9 @@
+from .pagination import (
+    paginate
+)
+from .page_size import (
+    PageSizeController
+)
+from .windows import (
+    TimeWindowWalker
+)
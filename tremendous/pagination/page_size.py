@@ -0,0 +1,151 @@
+import json
+import threading
+from typing import Dict, Optional, Sequence
+
+DEFAULT_PAGE_SIZES = (10, 25, 50, 100, 200, 500)
+# Largest ``limit`` the list endpoints honor; larger requests get pages of this size
+MAX_PAGE_SIZE = 500
+
+
+class _EndpointStats:
+
+    def __init__(self):
+        self.throughput: Dict[int, float] = {}
+        self.bytes_per_record: Optional[float] = None
+        self.pages = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "throughput": {str(size): value for size, value in self.throughput.items()},
+            "bytes_per_record": self.bytes_per_record,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "_EndpointStats":
+        stats = cls()
+        stats.throughput = {int(size): value for size, value in data.get("throughput", {}).items()}
+        stats.bytes_per_record = data.get("bytes_per_record")
+        return stats
+
+class PageSizeController:
+    """
+    Picks the page size that maximizes records per second for each list endpoint.
+
+    Every page fetched through ``paginate(..., controller=...)`` reports its latency,
+    record count and approximate payload size. The controller keeps a moving average of
+    the throughput of each page size per endpoint, climbs to larger sizes while they keep
+    paying off, and never picks a size whose page would exceed ``memory_budget`` bytes.
+    Learned results can be saved and loaded so later runs start from the best size.
+
+    Args:
+        sizes (Sequence[int], optional): Candidate page sizes, smallest first.
+        initial (int, optional): Page size tried first for an unknown endpoint.
+        memory_budget (int, optional): Maximum approximate payload size of one page, in bytes.
+        smoothing (float, optional): Weight of the newest measurement in the moving averages.
+        explore_every (int, optional): Re-measure a neighbouring size every this many pages.
+
+    ```python
+    controller = PageSizeController()
+    for order in paginate(tremendous.Orders.list, controller=controller):
+        ...
+    controller.save("page_sizes.json")
+    ```
+    """
+
+    def __init__(
+            self,
+            sizes: Sequence[int] = DEFAULT_PAGE_SIZES,
+            initial: int = 100,
+            memory_budget: int = 32 * 1024 * 1024,
+            smoothing: float = 0.3,
+            explore_every: int = 50):
+        self.sizes = sorted(sizes)
+        self.initial = initial
+        self.memory_budget = memory_budget
+        self.smoothing = smoothing
+        self.explore_every = explore_every
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _allowed(self, stats: _EndpointStats) -> list:
+        if not stats.bytes_per_record:
+            return self.sizes
+        allowed = [size for size in self.sizes if size * stats.bytes_per_record <= self.memory_budget]
+        return allowed or self.sizes[:1]
+
+    def page_size(self, endpoint: str) -> int:
+        """
+        The page size to request next from ``endpoint``.
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, _EndpointStats())
+            allowed = self._allowed(stats)
+            tried = {size: value for size, value in stats.throughput.items() if size in allowed}
+            if not tried:
+                return min(allowed, key=lambda size: abs(size - self.initial))
+            best = max(tried, key=tried.get)
+            position = allowed.index(best)
+            larger = allowed[position + 1] if position + 1 < len(allowed) else None
+            if larger is not None and larger not in tried:
+                return larger
+            if self.explore_every and stats.pages and stats.pages % self.explore_every == 0:
+                neighbours = [allowed[i] for i in (position - 1, position + 1) if 0 <= i < len(allowed)]
+                return neighbours[(stats.pages // self.explore_every) % len(neighbours)] if neighbours else best
+            return best
+
+    def record(self, endpoint: str, page_size: int, records: int, seconds: float, payload_bytes: Optional[int] = None) -> None:
+        """
+        Report a fetched page.
+
+        The last page of a listing is usually short only because the listing ended, so it
+        should not be reported; ``paginate`` leaves it out.
+
+        Args:
+            endpoint (str): The endpoint the page came from.
+            page_size (int): The ``limit`` that was requested.
+            records (int): The number of records returned.
+            seconds (float): Time taken to fetch and parse the page.
+            payload_bytes (int, optional): Approximate size of the page.
+        """
+        # A short page that is not the last one is measured by the records it returned, so
+        # a size the server caps below what was requested does not look faster than it is
+        if not records or seconds <= 0:
+            return
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, _EndpointStats())
+            stats.pages += 1
+            throughput = records / seconds
+            previous = stats.throughput.get(page_size)
+            stats.throughput[page_size] = throughput if previous is None else (
+                self.smoothing * throughput + (1 - self.smoothing) * previous
+            )
+            if payload_bytes and records:
+                per_record = payload_bytes / records
+                stats.bytes_per_record = per_record if stats.bytes_per_record is None else (
+                    self.smoothing * per_record + (1 - self.smoothing) * stats.bytes_per_record
+                )
+
+    def best(self, endpoint: str) -> Optional[int]:
+        """
+        The page size with the best measured throughput for ``endpoint``, if any was measured.
+        """
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if not stats or not stats.throughput:
+                return None
+            tried = {size: value for size, value in stats.throughput.items() if size in self._allowed(stats)}
+            return max(tried, key=tried.get) if tried else None
+
+    def save(self, path: str) -> None:
+        with self._lock:
+            data = {endpoint: stats.to_dict() for endpoint, stats in self._endpoints.items()}
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    def load(self, path: str) -> "PageSizeController":
+        with open(path) as file:
+            data = json.load(file)
+        with self._lock:
+            for endpoint, stats in data.items():
+                self._endpoints[endpoint] = _EndpointStats.from_dict(stats)
+        return self
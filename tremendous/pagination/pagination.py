@@ -0,0 +1,67 @@
+import inspect
+import time
+from typing import Any, Callable, Iterator, List, Optional, TYPE_CHECKING
+
+from tremendous.pagination.page_size import MAX_PAGE_SIZE
+
+if TYPE_CHECKING:
+    from tremendous.pagination.page_size import PageSizeController
+
+
+def _accepts_limit(list_method: Callable) -> bool:
+    try:
+        return "limit" in inspect.signature(list_method).parameters
+    except (TypeError, ValueError):
+        return False
+
+def _endpoint(list_method: Callable) -> str:
+    return getattr(list_method, "__qualname__", repr(list_method))
+
+def paginate(
+        list_method: Callable[..., List[Any]],
+        page_size: Optional[int] = None,
+        controller: Optional["PageSizeController"] = None,
+        **filters) -> Iterator[Any]:
+    """
+    Iterate over every record of an offset-paginated list endpoint.
+
+    Args:
+        list_method (Callable): A resource list method that accepts ``offset`` (and ``limit``
+            when ``page_size`` is given), e.g. ``client.Orders.list``.
+        page_size (int, optional): The ``limit`` to request per page, at most ``MAX_PAGE_SIZE``.
+            Endpoints without a ``limit`` parameter (such as ``Topups.list``) should leave this as None.
+        controller (PageSizeController, optional): Picks the page size of every request
+            from measured throughput instead of a fixed ``page_size``. Ignored for endpoints
+            without a ``limit`` parameter.
+        **filters: Additional keyword arguments passed to every call of ``list_method``.
+
+    Yields:
+        The models returned by ``list_method``, page after page.
+
+    ```python
+    for order in paginate(tremendous.Orders.list, page_size=100, campaign_id="CAMPAIGN_ID"):
+        print(order.id)
+    ```
+    """
+    if controller is not None and not _accepts_limit(list_method):
+        controller = None
+    endpoint = _endpoint(list_method) if controller is not None else None
+    offset = 0
+    while True:
+        kwargs = dict(filters, offset=offset)
+        limit = controller.page_size(endpoint) if controller is not None else page_size
+        if limit is not None:
+            # The server caps larger pages, which would otherwise look like the last one
+            limit = min(limit, MAX_PAGE_SIZE)
+            kwargs["limit"] = limit
+        started = time.perf_counter()
+        page = list_method(**kwargs)
+        last = not page or (limit is not None and len(page) < limit)
+        if controller is not None and not last:
+            # Approximate the payload from one record instead of re-serializing the page
+            sample = page[0].model_dump_json() if hasattr(page[0], "model_dump_json") else ""
+            controller.record(endpoint, limit, len(page), time.perf_counter() - started, len(sample) * len(page))
+        yield from page
+        offset += len(page)
+        if last:
+            return
@@ -0,0 +1,206 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+Window = Tuple[datetime, datetime]
+
+TICK = timedelta(microseconds=1)
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """
+    A timezone-aware datetime from an ISO 8601 string or datetime; naive values are taken as UTC.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def format_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+def _merge(windows: List[Window]) -> List[Window]:
+    merged: List[Window] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1] + TICK:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def _gaps(start: datetime, end: datetime, done: List[Window]) -> List[Window]:
+    gaps = []
+    cursor = start
+    for done_start, done_end in _merge(done):
+        if done_end < cursor or done_start > end:
+            continue
+        if done_start > cursor:
+            gaps.append((cursor, done_start - TICK))
+        cursor = max(cursor, done_end + TICK)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+def _split(window: Window, parts: int) -> List[Window]:
+    start, end = window
+    step = (end - start) / parts
+    bounds = [start + step * index for index in range(parts)] + [end + TICK]
+    return [(bounds[index], bounds[index + 1] - TICK) for index in range(parts) if bounds[index + 1] - TICK >= bounds[index]]
+
+class TimeWindowWalker:
+    """
+    Walks a ``created_at`` range of a list endpoint in time windows instead of deep offsets.
+
+    Offsets shift while new records arrive and get slow deep into a collection. The walker
+    instead splits ``[start, end]`` into windows queried with ``created_at_gte`` and
+    ``created_at_lte``, and reads each window with offsets of at most ``max_pages`` pages.
+    When a window holds more than that, the records newer than the oldest one seen are
+    kept and the rest of the window is split in two, so windows adapt to how dense the
+    data is. Windows are read in parallel, so records come out grouped by window rather
+    than in creation order.
+
+    With a ``checkpoint`` file, finished time ranges are recorded once their records have
+    been yielded, and a restarted walk only reads what is left. Records of a window that
+    was interrupted may be yielded again after a restart.
+
+    Args:
+        list_method (Callable): A list method that accepts ``offset``, ``limit``,
+            ``created_at_gte`` and ``created_at_lte``, e.g. ``client.Orders.list``.
+        start (Union[str, datetime]): Oldest creation time to include.
+        end (Union[str, datetime], optional): Newest creation time to include. Defaults to now.
+        page_size (int, optional): The ``limit`` of every request.
+        max_pages (int, optional): Pages read from a window before it is split.
+        workers (int, optional): Windows read concurrently.
+        checkpoint (str, optional): JSON file that finished time ranges are recorded in.
+        min_window (float, optional): Windows shorter than this many seconds are never split.
+        **filters: Additional keyword arguments passed to every call, e.g. ``campaign_id``.
+
+    ```python
+    walker = TimeWindowWalker(tremendous.Orders.list, "2024-01-01T00:00:00Z", checkpoint="orders-scan.json")
+    for order in walker:
+        process(order)
+    ```
+    """
+
+    def __init__(
+            self,
+            list_method: Callable[..., List[Any]],
+            start: Union[str, datetime],
+            end: Optional[Union[str, datetime]] = None,
+            page_size: int = 100,
+            max_pages: int = 4,
+            workers: int = 4,
+            checkpoint: Optional[str] = None,
+            min_window: float = 1.0,
+            **filters):
+        self.list_method = list_method
+        self.start = parse_timestamp(start)
+        self.end = parse_timestamp(end) if end is not None else datetime.now(timezone.utc)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.min_window = timedelta(seconds=min_window)
+        self.filters = filters
+        self.done: List[Window] = self._load()
+        self.requests = 0
+        self.splits = 0
+
+    def _load(self) -> List[Window]:
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return []
+        with open(self.checkpoint) as file:
+            data = json.load(file)
+        return [(parse_timestamp(start), parse_timestamp(end)) for start, end in data["done"]]
+
+    def _save(self) -> None:
+        self.done = _merge(self.done)
+        if self.checkpoint is None:
+            return
+        temporary = f"{self.checkpoint}.tmp"
+        with open(temporary, "w") as file:
+            json.dump({"done": [[format_timestamp(start), format_timestamp(end)] for start, end in self.done]}, file)
+        os.replace(temporary, self.checkpoint)
+
+    def _read(self, window: Window) -> Tuple[List[Any], Optional[Window], List[Window], int]:
+        """
+        Read one window: its records, the finished part of it, and the windows left to read.
+        """
+        start, end = window
+        records: List[Any] = []
+        seen = set()
+        offset = 0
+        requests = 0
+        while True:
+            page = self.list_method(
+                offset=offset,
+                limit=self.page_size,
+                created_at_gte=format_timestamp(start),
+                created_at_lte=format_timestamp(end),
+                **self.filters,
+            )
+            requests += 1
+            # Only an empty page ends the window: a short one may just mean the server caps ``limit``
+            if not page:
+                return records, window, [], requests
+            offset += len(page)
+            for record in page:
+                # A record can move between pages of one window while it is read
+                key = getattr(record, "id", None) or record.model_dump_json()
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record)
+            if requests >= self.max_pages and end - start > self.min_window:
+                break
+        # Records are newest first: everything newer than the oldest record is complete
+        oldest = min(parse_timestamp(record.created_at) for record in records)
+        complete = [record for record in records if parse_timestamp(record.created_at) > oldest]
+        rest = (start, min(oldest, end))
+        finished = (oldest + TICK, end) if oldest < end else None
+        return complete, finished, _split(rest, 2), requests
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.walk()
+
+    def walk(self) -> Iterator[Any]:
+        """
+        Yield every record in the range, reading windows in parallel.
+        """
+        pending = [
+            part
+            for gap in _gaps(self.start, self.end, self.done)
+            for part in _split(gap, max(1, self.workers))
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._read, window): window for window in pending}
+            while futures:
+                completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    futures.pop(future)
+                    records, finished, rest, requests = future.result()
+                    self.requests += requests
+                    if rest:
+                        self.splits += 1
+                    for window in rest:
+                        futures[executor.submit(self._read, window)] = window
+                    # Windows do not overlap, so records are only deduplicated within each window
+                    yield from records
+                    if finished is not None:
+                        self.done.append(finished)
+                        self._save()
+
+    def progress(self) -> float:
+        """
+        Fraction of the time range that is finished.
+        """
+        total = (self.end - self.start).total_seconds()
+        if total <= 0:
+            return 1.0
+        covered = sum(
+            (min(end, self.end) - max(start, self.start)).total_seconds()
+            for start, end in _merge(self.done)
+            if end >= self.start and start <= self.end
+        )
+        return min(1.0, covered / total)
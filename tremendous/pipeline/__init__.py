@@ -0,0 +1,4 @@
+from .pipeline import (
+    ParsePipeline,
+    parse_page
+)
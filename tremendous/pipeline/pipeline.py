@@ -0,0 +1,164 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type, TYPE_CHECKING
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+def parse_page(
+        body: bytes,
+        model_cls: Type[BaseModel],
+        list_key: str,
+        transform: Optional[Callable[[BaseModel], Any]] = None) -> List[Any]:
+    """
+    Decode, validate and transform one raw list response.
+
+    Runs inside the worker processes, so ``model_cls`` and ``transform`` must be
+    importable module-level objects.
+    """
+    items = json.loads(body)[list_key]
+    models = _adapter(model_cls).validate_python(items)
+    if transform is None:
+        return models
+    return [transform(model) for model in models]
+
+class ParsePipeline:
+    """
+    Moves JSON decoding, model validation and transforms off the fetching process.
+
+    Pages are fetched as raw bytes by a small pool of threads and handed to a process pool,
+    which decodes, validates and transforms them in parallel; only the results come back.
+    At most ``max_pending`` pages are fetched or parsed at any time, so fetchers wait for
+    the workers (and the consumer) instead of buffering the whole export in memory.
+
+    Args:
+        client (TremendousClient): The client used to fetch pages.
+        processes (int, optional): Worker processes. Defaults to the number of CPUs.
+        max_pending (int, optional): Pages in flight at once. Defaults to twice ``processes``.
+        fetchers (int, optional): Threads fetching pages concurrently.
+
+    ```python
+    def to_row(order):
+        return (order.id, order.status, order.payment.total if order.payment else None)
+
+    with ParsePipeline(tremendous) as pipeline:
+        for row in pipeline.iterate("/orders", OrderModel, "orders", page_size=500, transform=to_row):
+            writer.writerow(row)
+    ```
+    """
+
+    def __init__(
+            self,
+            client: "TremendousClient",
+            processes: Optional[int] = None,
+            max_pending: Optional[int] = None,
+            fetchers: int = 4):
+        self.client = client
+        self.processes = processes or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.processes
+        self.fetchers = fetchers
+        self._workers: Optional[Executor] = None
+        self._fetch_pool: Optional[Executor] = None
+
+    def __enter__(self) -> "ParsePipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._workers is None:
+            self._workers = ProcessPoolExecutor(max_workers=self.processes)
+            self._fetch_pool = ThreadPoolExecutor(max_workers=self.fetchers)
+
+    def close(self) -> None:
+        if self._workers is not None:
+            self._fetch_pool.shutdown()
+            self._workers.shutdown()
+            self._workers = self._fetch_pool = None
+
+    def _fetch(self, path: str, params: Dict) -> bytes:
+        return self.client._request("GET", path, params=params).content
+
+    def parse(
+            self,
+            bodies: Iterable[bytes],
+            model_cls: Type[BaseModel],
+            list_key: str,
+            transform: Optional[Callable[[BaseModel], Any]] = None) -> Iterator[Any]:
+        """
+        Parse already downloaded response bodies in the worker processes, in order.
+        """
+        self.start()
+        pending = deque()
+        for body in bodies:
+            if len(pending) >= self.max_pending:
+                yield from pending.popleft().result()
+            pending.append(self._workers.submit(parse_page, body, model_cls, list_key, transform))
+        while pending:
+            yield from pending.popleft().result()
+
+    def iterate(
+            self,
+            path: str,
+            model_cls: Type[BaseModel],
+            list_key: str,
+            params: Optional[Dict] = None,
+            page_size: int = 100,
+            transform: Optional[Callable[[BaseModel], Any]] = None) -> Iterator[Any]:
+        """
+        Fetch and parse every page of an offset-paginated list endpoint.
+
+        Args:
+            path (str): The list endpoint, e.g. ``"/orders"``.
+            model_cls (Type[BaseModel]): The model each item is validated into.
+            list_key (str): The key of the list in the response JSON.
+            params (Dict, optional): Additional query parameters, e.g. ``{"campaign_id": "..."}``.
+            page_size (int, optional): The ``limit`` requested per page.
+            transform (Callable, optional): Applied to every model in the worker process.
+
+        Yields:
+            Models (or transformed results) in the order the API returns them.
+        """
+        self.start()
+        params = dict(params or {})
+        pending = deque()
+        offset = 0
+        exhausted = False
+
+        def fetch_page(page_offset: int, limit: int):
+            body = self._fetch(path, dict(params, offset=page_offset, limit=limit))
+            return self._workers.submit(parse_page, body, model_cls, list_key, transform)
+
+        while True:
+            while not exhausted and len(pending) < self.max_pending:
+                pending.append((offset, self._fetch_pool.submit(fetch_page, offset, page_size)))
+                offset += page_size
+            if not pending:
+                return
+            page_offset, future = pending.popleft()
+            results = future.result().result()
+            yield from results
+            if not results:
+                # Pages already requested past the end are empty too; drain them
+                exhausted = True
+            elif len(results) < page_size and not exhausted:
+                # Either the last page or a server that caps ``limit`` below ``page_size``:
+                # continue right after this page at the size the server returned, and drop
+                # the pages requested at offsets that assumed the larger size
+                page_size = len(results)
+                offset = page_offset + page_size
+                for _, stale in pending:
+                    stale.cancel()
+                pending.clear()
@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from tremendous.client import TremendousClient
+from tremendous.rate_limit import TokenBucket
+
+
+class ClientPool:
+    """
+    A pool of clients for many organizations sharing one connection pool.
+
+    Every client added to the pool sends its requests through the same ``HTTPAdapter``
+    (and therefore the same keep-alive connections), while keeping its own sessions, API key
+    and rate-limit budget, so cookies or headers set for one organization never leak into
+    another's requests. Fan-out calls run concurrently across organizations.
+
+    Args:
+        sandbox (bool, optional): Whether the clients use the sandbox environment.
+        rate (float, optional): Requests per second allowed for each API key. None disables limiting.
+        burst (float, optional): Burst size of each API key's budget. Defaults to ``rate``.
+        max_workers (int, optional): Concurrency of fan-out calls, also used as the connection pool size.
+
+    ```python
+    pool = ClientPool(sandbox=True, rate=5)
+    for organization_id, api_key in sub_accounts.items():
+        pool.add(organization_id, api_key)
+
+    funding_sources = pool.fan_out(lambda client: client.FundingSources.list())
+    ```
+    """
+
+    def __init__(
+            self,
+            sandbox: bool = False,
+            rate: Optional[float] = None,
+            burst: Optional[float] = None,
+            max_workers: int = 16):
+        self.sandbox = sandbox
+        self.rate = rate
+        self.burst = burst
+        self.max_workers = max_workers
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self._clients: Dict[str, TremendousClient] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, api_key: str, rate: Optional[float] = None) -> TremendousClient:
+        """
+        Add a client for an organization.
+
+        Args:
+            key (str): The key the client is stored under, e.g. the organization ID.
+            api_key (str): The organization's API key.
+            rate (float, optional): Overrides the pool's per-key rate for this organization.
+
+        Returns:
+            TremendousClient: The pooled client.
+        """
+        rate = rate if rate is not None else self.rate
+        client = TremendousClient(
+            api_key=api_key,
+            sandbox=self.sandbox,
+            adapter=self.adapter,
+            rate_limiter=TokenBucket(rate, self.burst) if rate else None,
+        )
+        with self._lock:
+            self._clients[key] = client
+        return client
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._clients.pop(key, None)
+
+    def get(self, key: str) -> TremendousClient:
+        return self._clients[key]
+
+    def __getitem__(self, key: str) -> TremendousClient:
+        return self._clients[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._clients)
+
+    def fan_out(
+            self,
+            fn: Callable[[TremendousClient], Any],
+            keys: Optional[Iterable[str]] = None,
+            return_exceptions: bool = False) -> Dict[str, Any]:
+        """
+        Call ``fn`` with every pooled client concurrently.
+
+        Args:
+            fn (Callable): Called with each client, e.g. ``lambda client: client.FundingSources.list()``.
+            keys (Iterable[str], optional): Restrict the call to these keys. Defaults to every client.
+            return_exceptions (bool, optional): Store exceptions in the result instead of raising the first one.
+
+        Returns:
+            Dict[str, Any]: The result of ``fn`` for each key.
+        """
+        keys = list(keys) if keys is not None else self.keys()
+        results: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {key: executor.submit(fn, self._clients[key]) for key in keys}
+            for key, future in futures.items():
+                error = future.exception()
+                if error is not None and not return_exceptions:
+                    raise error
+                results[key] = error if error is not None else future.result()
+        return results
+
+    def close(self) -> None:
+        """
+        Close the shared connections.
+        """
+        self.adapter.close()
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,7 @@
+from .rate_limit import (
+    TokenBucket
+)
+from .scheduler import (
+    PriorityScheduler,
+    LaneStatsModel
+)
@@ -0,0 +1,203 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pydantic import BaseModel
+from typing import Dict, Iterator, Optional
+
+_current_lane: contextvars.ContextVar = contextvars.ContextVar("tremendous_lane", default=None)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+class LaneStatsModel(BaseModel):
+    """
+    Queue-wait statistics of one priority lane.
+
+    Attributes:
+        requests (int): Requests admitted through the lane.
+        waiting (int): Requests currently queued in the lane.
+        total_wait (float): Seconds spent queued, summed over all requests.
+        max_wait (float): Longest time a request spent queued, in seconds.
+        p50_wait (float): Median queue wait of recent requests, in seconds.
+        p95_wait (float): 95th percentile queue wait of recent requests, in seconds.
+    """
+    requests: int = 0
+    waiting: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    p50_wait: float = 0.0
+    p95_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+class _Lane:
+
+    def __init__(self, name: str, share: float, rate: float, burst: float):
+        self.name = name
+        self.rate = rate * share
+        self.capacity = max(1.0, burst * share)
+        self.tokens = self.capacity
+        self.queue: deque = deque()
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent: deque = deque(maxlen=1000)
+
+class _LaneLimiter:
+
+    def __init__(self, scheduler: "PriorityScheduler", lane: str):
+        self.scheduler = scheduler
+        self.lane = lane
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        return self.scheduler.acquire(tokens, lane=self.lane)
+
+class PriorityScheduler:
+    """
+    Rate limiter with priority lanes for traffic sharing one API key.
+
+    All lanes draw from one token bucket of ``rate`` requests per second. Whenever a token
+    frees up it goes to the highest-priority lane with queued requests and share left, so
+    interactive calls overtake queued batch calls. Each lane can additionally be capped to a share of the
+    rate, so batch traffic never consumes the whole budget.
+
+    The lane of a request is taken from the ``lane`` context manager if one is active, then
+    from the limiter the client was created with (see ``limiter``), and defaults to the
+    first lane.
+
+    Args:
+        rate (float): Requests per second for all lanes together.
+        burst (float, optional): Burst size. Defaults to ``rate``.
+        shares (Dict[str, float], optional): Lanes in priority order, each with the fraction
+            of ``rate`` it may use. Defaults to ``{"interactive": 1.0, "batch": 0.5}``.
+
+    ```python
+    scheduler = PriorityScheduler(rate=20, shares={"interactive": 1.0, "batch": 0.6})
+    web = TremendousClient(api_key, rate_limiter=scheduler.limiter("interactive"))
+    payouts = TremendousClient(api_key, rate_limiter=scheduler.limiter("batch"))
+
+    print(scheduler.stats()["interactive"].p95_wait)
+    ```
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, shares: Optional[Dict[str, float]] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        shares = shares or {INTERACTIVE: 1.0, BATCH: 0.5}
+        if any(share <= 0 for share in shares.values()):
+            raise ValueError("lane shares must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lanes: Dict[str, _Lane] = {
+            name: _Lane(name, share, rate, self.capacity)
+            for name, share in shares.items()
+        }
+        self.default_lane = next(iter(self._lanes))
+        self._condition = threading.Condition()
+
+    def limiter(self, lane: str) -> _LaneLimiter:
+        """
+        A rate limiter for a client whose requests go through ``lane`` by default.
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"unknown lane {lane}")
+        return _LaneLimiter(self, lane)
+
+    @contextmanager
+    def lane(self, lane: str) -> Iterator[None]:
+        """
+        Send the requests made inside the block (in this thread or task) through ``lane``.
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"unknown lane {lane}")
+        token = _current_lane.set(lane)
+        try:
+            yield
+        finally:
+            _current_lane.reset(token)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        for lane in self._lanes.values():
+            lane.tokens = min(lane.capacity, lane.tokens + elapsed * lane.rate)
+
+    def _next(self, tokens: float) -> Optional[_Lane]:
+        if self._tokens < tokens:
+            return None
+        for lane in self._lanes.values():
+            # A lane that has used up its own share does not hold back the lanes below it
+            if lane.queue and lane.tokens >= tokens:
+                return lane
+        return None
+
+    def _delay(self, tokens: float) -> float:
+        delays = [
+            max((tokens - self._tokens) / self.rate, (tokens - lane.tokens) / lane.rate)
+            for lane in self._lanes.values()
+            if lane.queue
+        ]
+        return max(min(delays), 0.001) if delays else 0.001
+
+    def acquire(self, tokens: float = 1.0, lane: Optional[str] = None) -> float:
+        """
+        Wait for a request slot in a lane.
+
+        Returns:
+            float: Seconds spent queued.
+        """
+        name = _current_lane.get() or lane or self.default_lane
+        queue_lane = self._lanes[name]
+        ticket = object()
+        started = time.monotonic()
+        with self._condition:
+            queue_lane.queue.append(ticket)
+            try:
+                while True:
+                    self._refill()
+                    ready = self._next(tokens)
+                    if ready is queue_lane and queue_lane.queue[0] is ticket:
+                        queue_lane.queue.popleft()
+                        self._tokens -= tokens
+                        queue_lane.tokens -= tokens
+                        waited = time.monotonic() - started
+                        queue_lane.requests += 1
+                        queue_lane.total_wait += waited
+                        queue_lane.max_wait = max(queue_lane.max_wait, waited)
+                        queue_lane.recent.append(waited)
+                        self._condition.notify_all()
+                        return waited
+                    if ready is not None:
+                        self._condition.notify_all()
+                    self._condition.wait(self._delay(tokens))
+            finally:
+                # An interrupted wait must not leave its ticket blocking the lane
+                if ticket in queue_lane.queue:
+                    queue_lane.queue.remove(ticket)
+                    self._condition.notify_all()
+
+    def stats(self) -> Dict[str, LaneStatsModel]:
+        """
+        Queue-wait statistics per lane.
+        """
+        with self._condition:
+            result = {}
+            for name, lane in self._lanes.items():
+                recent = sorted(lane.recent)
+                result[name] = LaneStatsModel(
+                    requests=lane.requests,
+                    waiting=len(lane.queue),
+                    total_wait=lane.total_wait,
+                    max_wait=lane.max_wait,
+                    p50_wait=recent[len(recent) // 2] if recent else 0.0,
+                    p95_wait=recent[int(len(recent) * 0.95)] if recent else 0.0,
+                )
+            return result
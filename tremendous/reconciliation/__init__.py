@@ -0,0 +1,5 @@
+from .reconciliation import (
+    ReconciliationIndex,
+    ReconciliationReportModel,
+    MismatchModel
+)
@@ -0,0 +1,231 @@
+from collections import defaultdict
+from pydantic import BaseModel
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+from tremendous.balance_transactions.balance_transaction import BalanceTransactionModel
+from tremendous.invoices.invoices import InvoiceModel
+from tremendous.orders.order import OrderModel
+from tremendous.pagination import paginate
+from tremendous.pagination.windows import parse_timestamp
+from tremendous.rewards.reward import RewardModel
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+UNCHARGED_ORDER_STATUSES = {"CANCELED", "FAILED", "PENDING APPROVAL", "REJECTED"}
+
+def _within(records: Iterable, created_at_gte: Optional[str], created_at_lte: Optional[str]) -> Iterable:
+    """
+    Records of a newest-first list created inside the window; stops paging once past its start.
+    """
+    gte = parse_timestamp(created_at_gte) if created_at_gte else None
+    lte = parse_timestamp(created_at_lte) if created_at_lte else None
+    for record in records:
+        if not record.created_at:
+            yield record
+            continue
+        created_at = parse_timestamp(record.created_at)
+        if gte is not None and created_at < gte:
+            return
+        if lte is None or created_at <= lte:
+            yield record
+
+class MismatchModel(BaseModel):
+    """
+    A single reconciliation finding.
+
+    Attributes:
+        kind (str): One of ``unpaid``, ``double_charged``, ``refunded``, ``refund_not_credited``,
+            ``duplicate_external_id``, ``orphan_reward`` or ``amount_mismatch``.
+        order_id (str): The order the finding is about, if any.
+        reward_id (str): The reward the finding is about, if any.
+        invoice_id (str): The invoice the order is billed on, if any.
+        external_id (str): The external ID of the order, if any.
+        detail (str): Human readable description.
+    """
+    kind: str
+    order_id: Optional[str] = None
+    reward_id: Optional[str] = None
+    invoice_id: Optional[str] = None
+    external_id: Optional[str] = None
+    detail: Optional[str] = None
+
+class ReconciliationReportModel(BaseModel):
+    orders: int = 0
+    rewards: int = 0
+    invoices: int = 0
+    balance_transactions: int = 0
+    mismatches: List[MismatchModel] = []
+
+    def by_kind(self, kind: str) -> List[MismatchModel]:
+        return [mismatch for mismatch in self.mismatches if mismatch.kind == kind]
+
+class ReconciliationIndex:
+    """
+    Hash indexes across invoices, orders, rewards and balance transactions.
+
+    Every record is indexed once by order ID, reward ID, invoice ID and external ID, so
+    reconciling the whole set is a single linear pass with constant-time lookups instead of
+    nested loops over the downloaded lists.
+
+    ```python
+    index = ReconciliationIndex.build(tremendous, created_at_gte="2026-09-01T00:00:00Z")
+    report = index.report()
+    for mismatch in report.by_kind("unpaid"):
+        print(mismatch.order_id, mismatch.detail)
+    ```
+    """
+
+    def __init__(self):
+        self.orders: Dict[str, OrderModel] = {}
+        self.rewards: Dict[str, RewardModel] = {}
+        self.invoices: Dict[str, InvoiceModel] = {}
+        self.orders_by_external_id: Dict[str, List[str]] = defaultdict(list)
+        self.rewards_by_order_id: Dict[str, Dict[str, RewardModel]] = defaultdict(dict)
+        self.invoice_by_order_id: Dict[str, str] = {}
+        self.invoice_by_reward_id: Dict[str, str] = {}
+        self.transactions_by_order_id: Dict[str, List[BalanceTransactionModel]] = defaultdict(list)
+        self.balance_transactions = 0
+
+    def add_orders(self, orders: Iterable[OrderModel]) -> "ReconciliationIndex":
+        for order in orders:
+            if order.id is None or order.id in self.orders:
+                continue
+            self.orders[order.id] = order
+            if order.external_id:
+                self.orders_by_external_id[order.external_id].append(order.id)
+            if order.invoice_id:
+                self.invoice_by_order_id.setdefault(order.id, order.invoice_id)
+            self.add_rewards(order.rewards or [])
+        return self
+
+    def add_rewards(self, rewards: Iterable[RewardModel]) -> "ReconciliationIndex":
+        for reward in rewards:
+            self.rewards[reward.id] = reward
+            self.rewards_by_order_id[reward.order_id][reward.id] = reward
+        return self
+
+    def add_invoices(self, invoices: Iterable[InvoiceModel]) -> "ReconciliationIndex":
+        for invoice in invoices:
+            self.invoices[invoice.id] = invoice
+            for order in invoice.orders or []:
+                if order.id:
+                    self.invoice_by_order_id[order.id] = invoice.id
+            for reward in invoice.rewards or []:
+                self.invoice_by_reward_id[reward.id] = invoice.id
+                self.invoice_by_order_id.setdefault(reward.order_id, invoice.id)
+            self.add_orders(invoice.orders or [])
+            self.add_rewards(invoice.rewards or [])
+        return self
+
+    def add_balance_transactions(self, transactions: Iterable[BalanceTransactionModel]) -> "ReconciliationIndex":
+        for transaction in transactions:
+            self.balance_transactions += 1
+            if transaction.order and transaction.order.id:
+                self.transactions_by_order_id[transaction.order.id].append(transaction)
+                self.add_orders([transaction.order])
+        return self
+
+    @classmethod
+    def build(
+            cls,
+            client: "TremendousClient",
+            created_at_gte: str = None,
+            created_at_lte: str = None,
+            page_size: int = 100) -> "ReconciliationIndex":
+        """
+        Download invoices, orders, rewards and balance transactions and index them.
+
+        Orders and balance transactions are filtered by the API. Invoices and rewards have
+        no date filter, so their newest-first lists are read only until the window starts.
+
+        Args:
+            client (TremendousClient): The client used to reach the API.
+            created_at_gte (str, optional): Only records created at or after this time.
+            created_at_lte (str, optional): Only records created at or before this time.
+            page_size (int, optional): Page size used for every list endpoint.
+        """
+        window = {"created_at_gte": created_at_gte, "created_at_lte": created_at_lte}
+        index = cls()
+        index.add_invoices(_within(paginate(client.Invoices.list, page_size=page_size), created_at_gte, created_at_lte))
+        index.add_orders(paginate(client.Orders.list, page_size=page_size, **window))
+        index.add_rewards(_within(paginate(client.Rewards.list, page_size=page_size), created_at_gte, created_at_lte))
+        index.add_balance_transactions(paginate(client.BalanceTransactions.list, page_size=page_size, **window))
+        return index
+
+    def order_for_external_id(self, external_id: str) -> Optional[OrderModel]:
+        order_ids = self.orders_by_external_id.get(external_id)
+        return self.orders[order_ids[0]] if order_ids else None
+
+    def invoice_for_reward(self, reward_id: str) -> Optional[InvoiceModel]:
+        invoice_id = self.invoice_by_reward_id.get(reward_id)
+        if invoice_id is None and reward_id in self.rewards:
+            invoice_id = self.invoice_by_order_id.get(self.rewards[reward_id].order_id)
+        return self.invoices.get(invoice_id) if invoice_id else None
+
+    def _check_order(self, order: OrderModel, mismatches: List[MismatchModel]) -> None:
+        invoice_id = self.invoice_by_order_id.get(order.id) or order.invoice_id
+        invoice = self.invoices.get(invoice_id) if invoice_id else None
+        transactions = self.transactions_by_order_id.get(order.id, [])
+        debits = [transaction for transaction in transactions if (transaction.amount or 0) < 0]
+        credits = [transaction for transaction in transactions if (transaction.amount or 0) > 0]
+
+        def finding(kind: str, detail: str) -> MismatchModel:
+            return MismatchModel(kind=kind, order_id=order.id, invoice_id=invoice_id, external_id=order.external_id, detail=detail)
+
+        if (order.status or "").upper() not in UNCHARGED_ORDER_STATUSES:
+            if invoice is not None and (invoice.status or "").upper() != "PAID" and not debits:
+                mismatches.append(finding("unpaid", f"invoice {invoice.id} is {invoice.status}"))
+            elif invoice is None and not debits:
+                mismatches.append(finding("unpaid", "no invoice and no balance debit"))
+        if len(debits) > 1:
+            mismatches.append(finding("double_charged", f"{len(debits)} balance debits"))
+        elif debits and invoice is not None and (invoice.status or "").upper() == "PAID":
+            mismatches.append(finding("double_charged", f"balance debit and paid invoice {invoice.id}"))
+
+        payment = order.payment
+        refund = payment.refund.total if payment and payment.refund else None
+        if refund:
+            mismatches.append(finding("refunded", f"refund of {refund}"))
+            if debits and not credits:
+                mismatches.append(finding("refund_not_credited", f"refund of {refund} has no balance credit"))
+
+        rewards = self.rewards_by_order_id.get(order.id)
+        if rewards and payment and payment.subtotal is not None:
+            value = sum(reward.value.denomination for reward in rewards.values())
+            if abs(value - payment.subtotal) > 0.005:
+                mismatches.append(finding("amount_mismatch", f"rewards total {value}, payment subtotal {payment.subtotal}"))
+
+    def report(self) -> ReconciliationReportModel:
+        """
+        Reconcile every indexed record in one linear pass.
+
+        Returns:
+            ReconciliationReportModel: Counts and mismatches found.
+        """
+        mismatches: List[MismatchModel] = []
+        for order in self.orders.values():
+            self._check_order(order, mismatches)
+        for external_id, order_ids in self.orders_by_external_id.items():
+            if len(order_ids) > 1:
+                mismatches.append(MismatchModel(
+                    kind="duplicate_external_id",
+                    order_id=order_ids[0],
+                    external_id=external_id,
+                    detail=f"orders {', '.join(order_ids)}",
+                ))
+        for reward in self.rewards.values():
+            if reward.order_id not in self.orders:
+                mismatches.append(MismatchModel(
+                    kind="orphan_reward",
+                    reward_id=reward.id,
+                    order_id=reward.order_id,
+                    invoice_id=self.invoice_by_reward_id.get(reward.id),
+                    detail="reward's order was not downloaded",
+                ))
+        return ReconciliationReportModel(
+            orders=len(self.orders),
+            rewards=len(self.rewards),
+            invoices=len(self.invoices),
+            balance_transactions=self.balance_transactions,
+            mismatches=mismatches,
+        )
@@ -0,0 +1,7 @@
+from .sync import (
+    ConfigSync,
+    SnapshotDiffModel,
+    SyncActionModel,
+    canonical_hash,
+    diff_hashes
+)
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel
+from typing import Any, Callable, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+# Resource name to the method listing it
+RESOURCES: Dict[str, Callable[["TremendousClient"], List[BaseModel]]] = {
+    "campaigns": lambda client: client.Campaigns.list(),
+    "members": lambda client: client.Members.list(),
+    "roles": lambda client: client.Roles.list(),
+    "fields": lambda client: client.Fields.list(),
+}
+
+# Fields that change on their own and are not part of an object's configuration
+VOLATILE_FIELDS = {
+    "members": {"last_login_at", "status"},
+}
+
+CAMPAIGN_FIELDS = ("name", "description", "products", "webpage_style", "email_style")
+
+def canonical_hash(data: Any) -> str:
+    """
+    Hash of the canonical JSON form of a model or JSON-like value (sorted keys, no nulls).
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json", exclude_none=True)
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+def _covers(current: Any, desired: Any) -> bool:
+    """
+    Whether ``current`` already holds ``desired``; nested dicts only need the keys ``desired`` gives.
+    """
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(_covers(current.get(key), value) for key, value in desired.items())
+    return canonical_hash(current) == canonical_hash(desired)
+
+def _merge(current: Any, desired: Any) -> Any:
+    if isinstance(desired, dict) and isinstance(current, dict):
+        return {**current, **{key: _merge(current.get(key), value) for key, value in desired.items()}}
+    return desired
+
+def _object_hash(resource: str, model: BaseModel) -> str:
+    return canonical_hash(model.model_dump(mode="json", exclude_none=True, exclude=VOLATILE_FIELDS.get(resource)))
+
+class SnapshotDiffModel(BaseModel):
+    """
+    Changes of one resource between two snapshots.
+
+    Attributes:
+        added (List[str]): IDs of new objects.
+        changed (List[str]): IDs of objects whose content changed.
+        removed (List[str]): IDs of objects that are gone.
+        unchanged (int): Number of identical objects.
+    """
+    added: List[str] = []
+    changed: List[str] = []
+    removed: List[str] = []
+    unchanged: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+class SyncActionModel(BaseModel):
+    """
+    A write needed to reach the desired state.
+
+    Attributes:
+        resource (str): ``"campaigns"`` or ``"members"``.
+        action (str): ``"create"`` or ``"update"``.
+        key (str): The campaign name or member email the action is for.
+        id (str): The ID of the updated object.
+        params (Dict): Keyword arguments of the ``create``/``update`` call.
+        result (Dict): The object returned by the API, once applied.
+        error (str): The error message, if applying failed.
+    """
+    resource: str
+    action: str
+    key: str
+    id: Optional[str] = None
+    params: Dict = {}
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+
+def diff_hashes(previous: Dict[str, str], current: Dict[str, str]) -> SnapshotDiffModel:
+    """
+    Compare two ``{id: hash}`` maps in linear time.
+    """
+    result = SnapshotDiffModel()
+    for object_id, digest in current.items():
+        old = previous.get(object_id)
+        if old is None:
+            result.added.append(object_id)
+        elif old != digest:
+            result.changed.append(object_id)
+        else:
+            result.unchanged += 1
+    result.removed = [object_id for object_id in previous if object_id not in current]
+    return result
+
+class ConfigSync:
+    """
+    Snapshot-and-diff synchronization of an organization's configuration.
+
+    A snapshot lists campaigns, members, roles and fields, and keeps each object's hash of
+    its canonical JSON, keyed by resource and ID. ``changes`` compares a fresh snapshot with
+    the one saved last time, and ``plan`` compares it with a desired state. Both are
+    dictionary lookups, so they take linear time in the number of objects. ``apply`` runs
+    only the writes that are needed, concurrently.
+
+    Desired campaigns are matched to existing ones by name and desired members by email.
+    Roles and fields cannot be written through the API, so they are only snapshotted and
+    diffed. Members are only created, never updated or removed.
+
+    Args:
+        client (TremendousClient): The client of the organization.
+        path (str, optional): JSON file the last snapshot is kept in.
+        workers (int, optional): Concurrent requests for snapshots and ``apply``.
+
+    ```python
+    sync = ConfigSync(tremendous, "snapshots/acme.json")
+    actions = sync.plan(campaigns=[{"name": "Referrals", "description": "...", "products": ["ABC"]}])
+    sync.apply(actions)
+    ```
+
+    To reconcile many organizations, run one ``ConfigSync`` per client of a ``ClientPool``
+    with ``pool.fan_out``.
+    """
+
+    def __init__(self, client: "TremendousClient", path: Optional[str] = None, workers: int = 8):
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self._lock = threading.Lock()
+        self.objects: Dict[str, Dict[str, BaseModel]] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.saved: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self.path is None or not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def save(self) -> None:
+        """
+        Keep the current snapshot as the baseline of the next ``changes`` call.
+        """
+        with self._lock:
+            self.saved = {resource: dict(hashes) for resource, hashes in self.hashes.items()}
+            snapshot = self.saved
+        if self.path is None:
+            return
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file, sort_keys=True, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+    def snapshot(self, resources: Iterable[str] = tuple(RESOURCES)) -> Dict[str, Dict[str, str]]:
+        """
+        List the resources concurrently and hash every object.
+
+        Returns:
+            Dict[str, Dict[str, str]]: Resource to ``{id: hash}``.
+        """
+        resources = list(resources)
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(resources)) or 1) as executor:
+            listed = dict(zip(resources, executor.map(lambda resource: RESOURCES[resource](self.client), resources)))
+        with self._lock:
+            for resource, models in listed.items():
+                self.objects[resource] = {model.id: model for model in models}
+                self.hashes[resource] = {model.id: _object_hash(resource, model) for model in models}
+            return {resource: self.hashes[resource] for resource in resources}
+
+    def changes(self, resources: Iterable[str] = tuple(RESOURCES)) -> Dict[str, SnapshotDiffModel]:
+        """
+        Take a snapshot and compare it with the saved one.
+        """
+        current = self.snapshot(resources)
+        return {resource: diff_hashes(self.saved.get(resource, {}), hashes) for resource, hashes in current.items()}
+
+    def plan(
+            self,
+            campaigns: Optional[List[Dict]] = None,
+            members: Optional[List[Dict]] = None) -> List[SyncActionModel]:
+        """
+        The minimal writes that bring the organization to a desired state.
+
+        Compares against the latest snapshot, taking one first if there is none.
+
+        Args:
+            campaigns (List[Dict], optional): Desired campaigns, each with a ``name`` and any
+                of ``description``, ``products``, ``webpage_style`` and ``email_style``.
+                Fields that are left out are kept as they are, as are the keys a style dict leaves out.
+            members (List[Dict], optional): Desired members, each with an ``email`` and a ``role``.
+
+        Returns:
+            List[SyncActionModel]: The actions ``apply`` should run.
+        """
+        needed = [resource for resource, desired in (("campaigns", campaigns), ("members", members)) if desired]
+        if any(resource not in self.objects for resource in needed):
+            self.snapshot(needed)
+        actions = []
+        if campaigns:
+            by_name = {model.name: model for model in self.objects["campaigns"].values()}
+            for desired in campaigns:
+                desired = {field: desired[field] for field in CAMPAIGN_FIELDS if desired.get(field) is not None}
+                existing = by_name.get(desired["name"])
+                if existing is None:
+                    actions.append(SyncActionModel(resource="campaigns", action="create", key=desired["name"], params=desired))
+                    continue
+                current = existing.model_dump(mode="json", exclude_none=True, include=set(CAMPAIGN_FIELDS))
+                if _covers(current, desired):
+                    continue
+                # The update endpoint replaces unspecified fields, so send the merged state
+                actions.append(SyncActionModel(
+                    resource="campaigns",
+                    action="update",
+                    key=desired["name"],
+                    id=existing.id,
+                    params=_merge(current, desired),
+                ))
+        if members:
+            emails = {(model.email or "").lower() for model in self.objects["members"].values()}
+            for desired in members:
+                if desired["email"].lower() not in emails:
+                    actions.append(SyncActionModel(
+                        resource="members",
+                        action="create",
+                        key=desired["email"],
+                        params={"email": desired["email"], "role": desired["role"]},
+                    ))
+        return actions
+
+    def _apply_one(self, action: SyncActionModel) -> SyncActionModel:
+        if action.resource == "campaigns" and action.action == "update":
+            call: Callable[..., BaseModel] = lambda: self.client.Campaigns.update(id=action.id, **action.params)
+        elif action.resource == "campaigns":
+            call = lambda: self.client.Campaigns.create(**{"description": None, "products": None, **action.params})
+        else:
+            call = lambda: self.client.Members.create(**action.params)
+        try:
+            result = call()
+        except Exception as error:
+            return action.model_copy(update={"error": str(error)})
+        with self._lock:
+            self.objects.setdefault(action.resource, {})[result.id] = result
+            self.hashes.setdefault(action.resource, {})[result.id] = _object_hash(action.resource, result)
+        return action.model_copy(update={"id": result.id, "result": result.model_dump(mode="json")})
+
+    def apply(self, actions: List[SyncActionModel]) -> List[SyncActionModel]:
+        """
+        Run planned actions concurrently.
+
+        Failures do not stop the other actions; they are reported in each action's ``error``.
+
+        Returns:
+            List[SyncActionModel]: The actions, in order, with their results or errors.
+        """
+        if not actions:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(actions))) as executor:
+            return list(executor.map(self._apply_one, actions))
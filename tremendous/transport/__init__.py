@@ -0,0 +1,12 @@
+from .transport import (
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+    request_key,
+    scrub_body,
+    SECRET_FIELDS
+)
+from .hedging import (
+    HedgingTransport,
+    HedgeStatsModel
+)
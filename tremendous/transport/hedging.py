@@ -0,0 +1,214 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pydantic import BaseModel
+from typing import Deque, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tremendous.circuit_breaker.circuit_breaker import endpoint_key
+
+class HedgeStatsModel(BaseModel):
+    """
+    Hedging statistics of one endpoint.
+
+    Attributes:
+        requests (int): Requests sent to the endpoint, not counting hedges.
+        hedged (int): Requests for which a hedge was sent.
+        hedge_wins (int): Hedges that answered before the original request.
+        skipped (int): Hedges not sent because the budget was used up.
+        threshold (float): Current hedging delay, in seconds, if enough latencies were observed.
+    """
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    skipped: int = 0
+    threshold: Optional[float] = None
+
+class _Endpoint:
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.sorted: Optional[list] = None
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.skipped = 0
+
+class HedgingTransport(HTTPAdapter):
+    """
+    Transport that hedges slow idempotent requests.
+
+    When a GET has not been answered within the endpoint's ``percentile`` latency (taken
+    from its recent requests), an identical second request is sent and whichever response
+    arrives first is returned. The slower response is discarded. Endpoints are grouped like
+    the circuit breaker groups them, so ``GET /rewards/{id}`` has one threshold for every reward.
+
+    Hedges are capped at ``budget`` times the number of requests (e.g. ``0.05`` allows at
+    most 5% extra load), so a slowdown of the whole API does not double the traffic.
+
+    Args:
+        percentile (float, optional): Latency percentile after which a hedge is sent.
+        budget (float, optional): Maximum hedges as a fraction of requests.
+        min_samples (int, optional): Latencies an endpoint needs before it is hedged.
+        window (int, optional): Recent latencies kept per endpoint.
+        min_delay (float, optional): Never hedge earlier than this many seconds.
+        methods (Iterable[str], optional): Methods that may be hedged; they must be idempotent.
+        inner (HTTPAdapter, optional): Transport the requests are sent through, e.g. a
+            ``RecordingTransport``. Defaults to a plain ``HTTPAdapter``.
+        max_workers (int, optional): Threads available for in-flight requests and hedges.
+            Defaults to twice the connection pool size, one primary and one hedge per connection.
+        **kwargs: Passed to ``HTTPAdapter``, e.g. ``pool_maxsize``. Unless given, the pool
+            (and the default ``max_workers``) is sized from the client's ``pool_maxsize``.
+
+    ```python
+    hedging = HedgingTransport(percentile=0.95, budget=0.05)
+    tremendous = TremendousClient(api_key="<your-api-key>", transport=hedging)
+    tremendous.Rewards.get("REWARD_ID")
+    print(hedging.stats())
+    ```
+    """
+
+    def __init__(
+            self,
+            percentile: float = 0.95,
+            budget: float = 0.05,
+            min_samples: int = 20,
+            window: int = 500,
+            min_delay: float = 0.05,
+            methods: Iterable[str] = ("GET", "HEAD"),
+            inner: Optional[HTTPAdapter] = None,
+            max_workers: Optional[int] = None,
+            **kwargs):
+        super().__init__(**kwargs)
+        self._fixed_pool = "pool_maxsize" in kwargs
+        self._fixed_workers = max_workers is not None
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.methods = {method.upper() for method in methods}
+        self.inner = inner
+        self._executor = self._new_executor(max_workers or 2 * self._pool_maxsize)
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedges = 0
+
+    @staticmethod
+    def _new_executor(max_workers: int) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tremendous-hedge")
+
+    def size_for(self, pool_maxsize: int) -> None:
+        """
+        Size the connection pool and the default ``max_workers`` for ``pool_maxsize``
+        concurrent requests. Called by the client the transport is given to.
+        """
+        if not self._fixed_pool and pool_maxsize != self._pool_maxsize:
+            self._pool_maxsize = pool_maxsize
+            self.init_poolmanager(self._pool_connections, pool_maxsize, block=self._pool_block)
+        if not self._fixed_workers:
+            executor, self._executor = self._executor, self._new_executor(2 * pool_maxsize)
+            executor.shutdown(wait=False)
+
+    def _send_once(self, request: requests.PreparedRequest, kwargs: Dict) -> requests.Response:
+        if self.inner is not None:
+            return self.inner.send(request, **kwargs)
+        return super().send(request, **kwargs)
+
+    def _timed(self, endpoint: _Endpoint, request: requests.PreparedRequest, kwargs: Dict) -> requests.Response:
+        started = time.monotonic()
+        response = self._send_once(request, kwargs)
+        with self._lock:
+            endpoint.latencies.append(time.monotonic() - started)
+            endpoint.sorted = None
+        return response
+
+    def _threshold(self, endpoint: _Endpoint) -> Optional[float]:
+        if len(endpoint.latencies) < self.min_samples:
+            return None
+        if endpoint.sorted is None:
+            endpoint.sorted = sorted(endpoint.latencies)
+        index = min(len(endpoint.sorted) - 1, int(self.percentile * len(endpoint.sorted)))
+        return max(self.min_delay, endpoint.sorted[index])
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method.upper() not in self.methods:
+            return self._send_once(request, kwargs)
+        key = endpoint_key(request.method, urlsplit(request.url).path)
+        with self._lock:
+            endpoint = self._endpoints.setdefault(key, _Endpoint(self.window))
+            endpoint.requests += 1
+            self._requests += 1
+            threshold = self._threshold(endpoint)
+            affordable = self._hedges + 1 <= self.budget * self._requests
+        if threshold is None or not affordable:
+            # No hedge can follow, so the primary runs on the calling thread
+            started = time.monotonic()
+            response = self._timed(endpoint, request, kwargs)
+            if threshold is not None and time.monotonic() - started > threshold:
+                with self._lock:
+                    endpoint.skipped += 1
+            return response
+
+        primary = self._executor.submit(self._timed, endpoint, request, kwargs)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+        with self._lock:
+            allowed = self._hedges + 1 <= self.budget * self._requests
+            if allowed:
+                self._hedges += 1
+                endpoint.hedged += 1
+            else:
+                endpoint.skipped += 1
+        if not allowed:
+            return primary.result()
+
+        hedge = self._executor.submit(self._timed, endpoint, request.copy(), kwargs)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        endpoint.hedge_wins += 1
+                for other in pending:
+                    other.add_done_callback(self._discard)
+                return future.result()
+        raise error
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        if future.exception() is None:
+            future.result().close()
+
+    def stats(self) -> Dict[str, HedgeStatsModel]:
+        """
+        Hedging statistics per endpoint.
+        """
+        with self._lock:
+            return {
+                key: HedgeStatsModel(
+                    requests=endpoint.requests,
+                    hedged=endpoint.hedged,
+                    hedge_wins=endpoint.hedge_wins,
+                    skipped=endpoint.skipped,
+                    threshold=self._threshold(endpoint),
+                )
+                for key, endpoint in self._endpoints.items()
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        if self.inner is not None:
+            self.inner.close()
+        super().close()
@@ -0,0 +1,286 @@
+import base64
+import datetime
+import gzip
+import hashlib
+import io
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import HTTPResponse
+
+from tremendous.compression.compression import CHUNK_SIZE, decompressor
+
+# Never written to a cassette
+REDACTED_HEADERS = {"authorization", "cookie", "set-cookie", "proxy-authorization"}
+# Describe the encoded body on the wire; cassettes keep the decoded body
+WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+# JSON fields whose values are replaced before a body is written to a cassette
+SECRET_FIELDS = frozenset({
+    "api_key", "private_key", "secret", "client_secret", "password", "token",
+    "access_token", "refresh_token", "signing_secret", "card_number", "cvv", "cvc",
+})
+SCRUBBED = "[REDACTED]"
+
+def _scrub(value, fields: frozenset) -> Tuple[object, bool]:
+    if isinstance(value, dict):
+        scrubbed, changed = {}, False
+        for name, item in value.items():
+            if name.lower() in fields and item not in (None, ""):
+                scrubbed[name], changed = SCRUBBED, True
+            else:
+                scrubbed[name], item_changed = _scrub(item, fields)
+                changed = changed or item_changed
+        return scrubbed, changed
+    if isinstance(value, list):
+        items = [_scrub(item, fields) for item in value]
+        return [item for item, _ in items], any(changed for _, changed in items)
+    return value, False
+
+def scrub_body(body, fields: frozenset = SECRET_FIELDS):
+    """
+    Replace the values of secret fields (matched case-insensitively, at any depth) in a JSON body.
+
+    Bodies that are not JSON, or contain no secret field, are returned unchanged.
+    """
+    if not body or not fields:
+        return body
+    try:
+        data = json.loads(body)
+    except (TypeError, ValueError):
+        return body
+    data, changed = _scrub(data, fields)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") if changed else body
+
+def _encode_body(body) -> Optional[Dict[str, str]]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        return {"text": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+def _decode_body(body: Optional[Dict[str, str]]) -> bytes:
+    if body is None:
+        return b""
+    if "text" in body:
+        return body["text"].encode("utf-8")
+    return base64.b64decode(body["base64"])
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(query=urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))))
+
+def request_key(method: str, url: str, body) -> Tuple[str, str, str]:
+    """
+    What a replayed request is matched on: method, URL with sorted query, and body hash.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return (method.upper(), _normalize_url(url), hashlib.sha256(body or b"").hexdigest()[:16])
+
+def read_cassette(path: str) -> Iterator[Dict]:
+    """
+    Iterate over the interactions recorded in a cassette.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+class RecordingTransport(HTTPAdapter):
+    """
+    Transport that sends requests normally and records every interaction to a cassette.
+
+    A cassette is a gzip-compressed file of JSON lines, one request/response pair per line,
+    with the response body decoded and the ``Authorization`` header and cookies left out.
+    The values of secret JSON fields (``SECRET_FIELDS``, e.g. a webhook's ``private_key``)
+    are replaced in request and response bodies before they are written. It records when each
+    request started (relative to the first one) and how long the response took.
+
+    Streamed responses are read here but handed on unread, with their original encoding,
+    so a client measuring compression still sees the bytes that came over the wire.
+
+    Args:
+        path (str): The cassette file. Appended to if it exists.
+        scrub_fields (Iterable[str], optional): JSON fields whose values are never recorded.
+            Pass the same fields to the ``ReplayTransport``.
+        **kwargs: Passed to ``HTTPAdapter``, e.g. ``pool_maxsize``.
+
+    ```python
+    recorder = RecordingTransport("batch-2026-10-19.cassette.gz")
+    tremendous = TremendousClient(api_key="<your-api-key>", transport=recorder)
+    run_batch(tremendous)
+    recorder.close()
+    ```
+    """
+
+    def __init__(self, path: str, scrub_fields: Iterable[str] = SECRET_FIELDS, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.scrub_fields = frozenset(field.lower() for field in scrub_fields)
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._started: Optional[float] = None
+        self.recorded = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        started = time.monotonic()
+        response = super().send(request, **kwargs)
+        content = self._buffer(response) if kwargs.get("stream") else response.content
+        elapsed = time.monotonic() - started
+        with self._lock:
+            if self._started is None:
+                self._started = started
+            record = {
+                "offset": round(started - self._started, 6),
+                "elapsed": round(elapsed, 6),
+                "method": request.method,
+                "url": request.url,
+                "request_headers": {
+                    name: value for name, value in request.headers.items() if name.lower() not in REDACTED_HEADERS
+                },
+                "request_body": _encode_body(scrub_body(request.body, self.scrub_fields)),
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in REDACTED_HEADERS | WIRE_HEADERS
+                },
+                "body": _encode_body(scrub_body(content, self.scrub_fields)),
+            }
+            if not self._file.closed:
+                self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                self.recorded += 1
+        return response
+
+    def _buffer(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed response off the wire and put an unread copy back as ``response.raw``.
+
+        Returns:
+            bytes: The decoded body.
+        """
+        raw = response.raw
+        try:
+            wire = b"".join(raw.stream(CHUNK_SIZE, decode_content=False))
+        finally:
+            raw.release_conn()
+        response.raw = HTTPResponse(
+            body=io.BytesIO(wire),
+            headers=raw.headers,
+            status=raw.status,
+            reason=raw.reason,
+            preload_content=False,
+            decode_content=raw.decode_content,
+        )
+        codec = decompressor(response.headers.get("Content-Encoding"))
+        return wire if codec is None else codec.decompress(wire) + codec.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        super().close()
+
+class ReplayTransport(HTTPAdapter):
+    """
+    Transport that answers requests from a cassette without touching the network.
+
+    Each request is matched on method, URL (query parameters in any order) and body to
+    the recorded interactions; identical requests get their recorded responses in order.
+    Responses are built as real ``requests.Response`` objects, so everything above the
+    transport (error mapping, caches, parsing in ``_fetch``/``_create``) runs as it did
+    when recording.
+
+    Args:
+        path (str): The cassette file.
+        speed (float, optional): Replay each response after its recorded latency divided
+            by ``speed``; ``1.0`` reproduces the original timing, ``10.0`` runs ten times
+            faster. None returns responses immediately. Only latency is replayed: requests are
+            answered when they are sent, not at their recorded ``offset``.
+        strict (bool, optional): Raise ``requests.ConnectionError`` for requests that were
+            not recorded. Otherwise fall back to the next unused interaction with the same
+            method and path, ignoring query and body.
+        scrub_fields (Iterable[str], optional): The fields scrubbed when recording; requests
+            are matched with these fields scrubbed too.
+
+    ```python
+    replay = ReplayTransport("batch-2026-10-19.cassette.gz", speed=None)
+    tremendous = TremendousClient(api_key="replay", transport=replay)
+    cProfile.run("run_batch(tremendous)")
+    ```
+    """
+
+    def __init__(
+            self,
+            path: str,
+            speed: Optional[float] = 1.0,
+            strict: bool = True,
+            scrub_fields: Iterable[str] = SECRET_FIELDS,
+            **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.scrub_fields = frozenset(field.lower() for field in scrub_fields)
+        self.speed = speed
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._by_request: Dict[Tuple[str, str, str], Deque[Dict]] = defaultdict(deque)
+        self._by_path: Dict[Tuple[str, str], Deque[Dict]] = defaultdict(deque)
+        self.interactions: List[Dict] = list(read_cassette(path))
+        for record in self.interactions:
+            record["used"] = False
+            self._by_request[request_key(record["method"], record["url"], _decode_body(record["request_body"]))].append(record)
+            self._by_path[(record["method"].upper(), urlsplit(record["url"]).path)].append(record)
+        self.replayed = 0
+
+    def _next(self, queue: Deque[Dict]) -> Optional[Dict]:
+        while queue:
+            record = queue.popleft()
+            if not record["used"]:
+                record["used"] = True
+                return record
+        return None
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        with self._lock:
+            key = request_key(request.method, request.url, scrub_body(request.body, self.scrub_fields))
+            record = self._next(self._by_request.get(key, deque()))
+            if record is None and not self.strict:
+                record = self._next(self._by_path.get((request.method.upper(), urlsplit(request.url).path), deque()))
+            if record is not None:
+                self.replayed += 1
+        if record is None:
+            raise requests.ConnectionError(f"no recorded response for {request.method} {request.url}", request=request)
+        if self.speed:
+            time.sleep(record["elapsed"] / self.speed)
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record.get("reason")
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response._content = _decode_body(record["body"])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(seconds=record["elapsed"])
+        return response
+
+    @property
+    def remaining(self) -> int:
+        """
+        Recorded interactions that have not been replayed yet.
+        """
+        return sum(1 for record in self.interactions if not record["used"])
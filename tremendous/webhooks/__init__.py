@@ -1,4 +1,13 @@
 from .webhook import (
     Webhooks,
     WebhookModel
-)
\ No newline at end of file
+)
+from .journal import (
+    EventJournal,
+    JournalConsumer,
+    simulated_events
+)
+from .loadgen import (
+    WebhookLoadGenerator,
+    LoadReportModel
+)
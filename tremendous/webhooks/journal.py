@@ -0,0 +1,338 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+HEADER = struct.Struct("<II")
+SEGMENT_SUFFIX = ".log"
+OFFSET_SUFFIX = ".offset"
+
+
+class _Segment:
+
+    def __init__(self, path: str, base_offset: int, size: int):
+        self.path = path
+        self.base_offset = base_offset
+        exists = os.path.exists(path)
+        self.file = open(path, "r+b" if exists else "w+b")
+        if not exists or os.path.getsize(path) < size:
+            self.file.truncate(max(size, os.path.getsize(path)))
+        self.size = os.path.getsize(path)
+        self.map = mmap.mmap(self.file.fileno(), self.size)
+        self.positions: List[int] = []
+        self.end = 0
+        self._scan()
+
+    def _scan(self) -> None:
+        position = 0
+        while position + HEADER.size <= self.size:
+            length, checksum = HEADER.unpack_from(self.map, position)
+            start = position + HEADER.size
+            if length == 0 or start + length > self.size:
+                break
+            if zlib.crc32(self.map[start:start + length]) != checksum:
+                # A torn write at the tail; everything after it is discarded
+                break
+            self.positions.append(position)
+            position = start + length
+        self.end = position
+
+    @property
+    def next_offset(self) -> int:
+        return self.base_offset + len(self.positions)
+
+    def fits(self, length: int) -> bool:
+        return self.end + HEADER.size + length <= self.size
+
+    def append(self, data: bytes) -> int:
+        position = self.end
+        self.map[position + HEADER.size:position + HEADER.size + len(data)] = data
+        HEADER.pack_into(self.map, position, len(data), zlib.crc32(data))
+        self.positions.append(position)
+        self.end = position + HEADER.size + len(data)
+        return self.base_offset + len(self.positions) - 1
+
+    def read(self, offset: int) -> bytes:
+        position = self.positions[offset - self.base_offset]
+        length, _ = HEADER.unpack_from(self.map, position)
+        start = position + HEADER.size
+        return bytes(self.map[start:start + length])
+
+    def flush(self) -> None:
+        self.map.flush()
+
+    def close(self) -> None:
+        self.map.close()
+        self.file.close()
+
+class EventJournal:
+    """
+    Append-only, segmented and memory-mapped journal of received webhook events.
+
+    The receiver only appends events to the journal and returns; any number of local
+    consumers then read at their own pace from their own committed offset, can replay
+    from any retained offset, and block while waiting for new events. Segments whose
+    events every consumer has committed can be compacted away.
+
+    Records are length-prefixed and checksummed, so a write torn by a crash is detected
+    and dropped when the journal is reopened.
+
+    Args:
+        directory (str): Directory holding the segment and consumer offset files.
+        segment_size (int, optional): Size of each memory-mapped segment, in bytes.
+        fsync (bool, optional): Flush the segment to disk after every append.
+
+    ```python
+    journal = EventJournal("/var/lib/webhooks")
+
+    # In the webhook receiver
+    journal.append(request.get_json())
+
+    # In each consumer
+    consumer = journal.consumer("order-status")
+    for offset, event in consumer.poll(max_events=100, timeout=5):
+        handle(event)
+    consumer.commit()
+    ```
+    """
+
+    def __init__(self, directory: str, segment_size: int = 64 * 1024 * 1024, fsync: bool = False):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._appended = threading.Condition(self._lock)
+        self._segments: List[_Segment] = []
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(SEGMENT_SUFFIX):
+                base_offset = int(name[:-len(SEGMENT_SUFFIX)])
+                self._segments.append(_Segment(os.path.join(directory, name), base_offset, segment_size))
+        if not self._segments:
+            self._roll(0)
+
+    def _roll(self, base_offset: int) -> _Segment:
+        path = os.path.join(self.directory, f"{base_offset:020d}{SEGMENT_SUFFIX}")
+        segment = _Segment(path, base_offset, self.segment_size)
+        self._segments.append(segment)
+        return segment
+
+    @property
+    def first_offset(self) -> int:
+        return self._segments[0].base_offset
+
+    @property
+    def next_offset(self) -> int:
+        return self._segments[-1].next_offset
+
+    def append(self, event: Union[Dict, bytes]) -> int:
+        """
+        Append an event.
+
+        Args:
+            event (Union[Dict, bytes]): The event as decoded JSON or as the raw request body.
+
+        Returns:
+            int: The offset of the event.
+
+        Raises:
+            ValueError: If the event is empty or larger than a segment.
+        """
+        data = event if isinstance(event, bytes) else json.dumps(event, separators=(",", ":")).encode("utf-8")
+        if not data:
+            # A zero length marks the end of a segment's records
+            raise ValueError("cannot journal an empty event")
+        with self._lock:
+            segment = self._segments[-1]
+            if not segment.fits(len(data)):
+                if segment.positions:
+                    segment.flush()
+                    segment = self._roll(segment.next_offset)
+                if not segment.fits(len(data)):
+                    raise ValueError("event is larger than the journal segment size")
+            offset = segment.append(data)
+            if self.fsync:
+                segment.flush()
+            self._appended.notify_all()
+        return offset
+
+    def _segment_for(self, offset: int) -> Optional[_Segment]:
+        for segment in reversed(self._segments):
+            if segment.base_offset <= offset:
+                return segment if offset < segment.next_offset else None
+        return None
+
+    def read(self, offset: int, max_events: int = 100) -> List[Tuple[int, Dict]]:
+        """
+        Read up to ``max_events`` events starting at ``offset``.
+
+        Raises:
+            ValueError: If ``offset`` was compacted away.
+        """
+        with self._lock:
+            if offset < self.first_offset:
+                raise ValueError(f"offset {offset} was compacted; the journal starts at {self.first_offset}")
+            raw = []
+            while len(raw) < max_events:
+                segment = self._segment_for(offset)
+                if segment is None:
+                    break
+                raw.append((offset, segment.read(offset)))
+                offset += 1
+        return [(event_offset, json.loads(data)) for event_offset, data in raw]
+
+    def wait(self, offset: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until an event at ``offset`` exists.
+
+        Returns:
+            bool: Whether the event exists (False on timeout).
+        """
+        with self._appended:
+            return self._appended.wait_for(lambda: self.next_offset > offset, timeout=timeout)
+
+    def consumer(self, name: str, start: str = "earliest") -> "JournalConsumer":
+        """
+        A named consumer with a persistent committed offset.
+
+        A new consumer is registered by committing its start offset right away, so
+        ``compact`` keeps its events before it commits anything itself.
+
+        Args:
+            name (str): The consumer name; its offset survives restarts.
+            start (str, optional): Where a new consumer starts, ``"earliest"`` or ``"latest"``.
+        """
+        return JournalConsumer(self, name, start)
+
+    def _offset_path(self, name: str) -> str:
+        return os.path.join(self.directory, name + OFFSET_SUFFIX)
+
+    def committed_offsets(self) -> Dict[str, int]:
+        offsets = {}
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(OFFSET_SUFFIX):
+                with open(os.path.join(self.directory, file_name)) as file:
+                    offsets[file_name[:-len(OFFSET_SUFFIX)]] = int(file.read().strip() or 0)
+        return offsets
+
+    def compact(self, before: Optional[int] = None) -> int:
+        """
+        Delete segments whose events are all before ``before``.
+
+        Args:
+            before (int, optional): Defaults to the lowest offset committed by any registered consumer.
+
+        Returns:
+            int: The number of deleted segments.
+        """
+        if before is None:
+            committed = self.committed_offsets()
+            if not committed:
+                return 0
+            before = min(committed.values())
+        removed = 0
+        with self._lock:
+            while len(self._segments) > 1 and self._segments[0].next_offset <= before:
+                segment = self._segments.pop(0)
+                segment.close()
+                os.remove(segment.path)
+                removed += 1
+        return removed
+
+    def flush(self) -> None:
+        with self._lock:
+            self._segments[-1].flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments:
+                segment.flush()
+                segment.close()
+            self._segments = []
+
+class JournalConsumer:
+    """
+    Reads an ``EventJournal`` at its own pace from a committed offset.
+    """
+
+    def __init__(self, journal: EventJournal, name: str, start: str = "earliest"):
+        self.journal = journal
+        self.name = name
+        path = journal._offset_path(name)
+        if os.path.exists(path):
+            with open(path) as file:
+                self.committed = int(file.read().strip() or 0)
+        else:
+            self.commit(journal.first_offset if start == "earliest" else journal.next_offset)
+        self.position = max(self.committed, journal.first_offset)
+
+    def poll(self, max_events: int = 100, timeout: Optional[float] = None) -> List[Tuple[int, Dict]]:
+        """
+        Read the next events after the current position, waiting up to ``timeout`` seconds for one.
+        """
+        if timeout is not None and not self.journal.wait(self.position, timeout):
+            return []
+        events = self.journal.read(self.position, max_events)
+        if events:
+            self.position = events[-1][0] + 1
+        return events
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict]]:
+        while True:
+            events = self.poll()
+            if not events:
+                return
+            yield from events
+
+    def commit(self, offset: Optional[int] = None) -> None:
+        """
+        Persist the offset of the next event to process (the current position by default).
+        """
+        self.committed = self.position if offset is None else offset
+        path = self.journal._offset_path(self.name)
+        with open(path + ".tmp", "w") as file:
+            file.write(str(self.committed))
+        os.replace(path + ".tmp", path)
+
+    def seek(self, offset: int) -> None:
+        """
+        Move the read position, e.g. to replay events from ``offset``.
+        """
+        self.position = max(offset, self.journal.first_offset)
+
+def simulated_events(client: "TremendousClient", webhook_id: str, count: int = 1000) -> Iterator[Dict]:
+    """
+    Generate synthetic webhook events, cycling through the event types of a webhook.
+
+    The event types come from ``Webhooks.list_events`` and the payloads mirror the shape
+    Tremendous delivers, so a journal and its consumers can be load-tested without
+    triggering ``Webhooks.test_webhook`` for every event.
+
+    Args:
+        client (TremendousClient): The client used to list the event types.
+        webhook_id (str): The ID of the webhook.
+        count (int, optional): The number of events to generate.
+    """
+    event_types = client.Webhooks.list_events(webhook_id).events
+    for index in range(count):
+        event = event_types[index % len(event_types)]
+        yield {
+            "event": event,
+            "uuid": str(uuid.uuid4()),
+            "created_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "payload": {
+                "resource": {
+                    "id": uuid.uuid4().hex[:12].upper(),
+                    "type": event.split(".")[0].lower(),
+                },
+                "meta": {"simulated": True},
+            },
+        }
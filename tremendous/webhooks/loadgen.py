@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tremendous.webhooks.journal import simulated_events
+
+if TYPE_CHECKING:
+    from tremendous.client import TremendousClient
+
+class LatencyModel(BaseModel):
+    count: int = 0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+
+    @classmethod
+    def of(cls, samples: List[float]) -> "LatencyModel":
+        if not samples:
+            return cls()
+        ordered = sorted(samples)
+
+        def at(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        return cls(count=len(ordered), p50=at(0.5), p95=at(0.95), p99=at(0.99), max=ordered[-1])
+
+class LoadReportModel(BaseModel):
+    """
+    Result of a webhook load test.
+
+    Attributes:
+        sent (int): Events sent successfully.
+        errors (int): Events whose request failed.
+        duration (float): Seconds from the first send to the last response or delivery.
+        throughput (float): Successfully sent events per second.
+        request_latency (LatencyModel): Time from the scheduled send until the simulate endpoint or
+            receiver answered, in seconds.
+        delivery_latency (LatencyModel): Time from the scheduled send until the receiver reported
+            the event, in seconds.
+        events (Dict[str, int]): Events sent per event type.
+    """
+    sent: int = 0
+    errors: int = 0
+    duration: float = 0.0
+    throughput: float = 0.0
+    request_latency: LatencyModel = LatencyModel()
+    delivery_latency: LatencyModel = LatencyModel()
+    events: Dict[str, int] = {}
+
+class WebhookLoadGenerator:
+    """
+    Generates webhook traffic at a controlled rate and concurrency.
+
+    Events cycle through every type returned by ``Webhooks.list_events``. They are either
+    triggered through the simulate endpoint (``Webhooks.test_webhook``), or, when ``target``
+    is given, posted directly to a local receiver as synthetic payloads. Sends are scheduled
+    open-loop at ``rate`` per second on an asyncio loop, with at most ``concurrency``
+    requests in flight. Latencies are measured from when each event was scheduled to be
+    sent, so time spent waiting for a free slot behind a slow receiver is counted instead
+    of hidden. Synthetic events go through a session of their own, so the client's API
+    credentials are never sent to the receiver.
+
+    To measure end-to-end delivery latency, the receiver calls ``delivered(event)`` for each
+    event it ingests; events are matched by ``uuid`` (synthetic payloads) or, for events
+    from the simulate endpoint, by event type in send order.
+
+    Args:
+        client (TremendousClient): The client used to list events and reach the simulate endpoint.
+        webhook_id (str): The webhook to simulate events for.
+        target (str, optional): URL of a local receiver to post synthetic events to instead.
+
+    ```python
+    generator = WebhookLoadGenerator(tremendous, "WEBHOOK_ID", target="http://localhost:8080/webhooks")
+    report = generator.run(total=10_000, rate=500, concurrency=64)
+    print(report.throughput, report.request_latency.p99)
+    ```
+    """
+
+    def __init__(self, client: "TremendousClient", webhook_id: str, target: Optional[str] = None):
+        self.client = client
+        self.webhook_id = webhook_id
+        self.target = target
+        self._lock = threading.Lock()
+        self._sent_at: Dict[str, float] = {}
+        self._sent_by_type: Dict[str, deque] = defaultdict(deque)
+        self._delivery_latencies: List[float] = []
+        self._last_delivery = 0.0
+        self._target_session: Optional[requests.Session] = None
+
+    def delivered(self, event: Dict, received_at: Optional[float] = None) -> None:
+        """
+        Report that the receiver ingested ``event`` (the decoded webhook body).
+        """
+        received_at = received_at or time.monotonic()
+        with self._lock:
+            sent_at = self._sent_at.pop(event.get("uuid"), None)
+            if sent_at is None:
+                queue = self._sent_by_type.get(event.get("event"))
+                sent_at = queue.popleft() if queue else None
+            if sent_at is not None:
+                self._delivery_latencies.append(received_at - sent_at)
+                self._last_delivery = max(self._last_delivery, received_at)
+
+    def _send(self, event: Dict) -> None:
+        if self.target is None:
+            response = self.client.Webhooks.test_webhook(self.webhook_id, event["event"])
+        else:
+            response = self._target_session.post(self.target, json=event)
+        response.raise_for_status()
+
+    async def run_async(self, total: int, rate: float, concurrency: int = 32, drain: float = 0.0) -> LoadReportModel:
+        """
+        Send ``total`` events at ``rate`` per second.
+
+        Args:
+            total (int): Events to send.
+            rate (float): Events started per second.
+            concurrency (int, optional): Maximum requests in flight.
+            drain (float, optional): Seconds to keep waiting for deliveries after the last send.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Deliveries of earlier runs must not count toward this report
+            self._sent_at.clear()
+            self._sent_by_type.clear()
+            self._delivery_latencies = []
+            self._last_delivery = 0.0
+        events = list(simulated_events(self.client, self.webhook_id, total))
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        counts: Dict[str, int] = defaultdict(int)
+        errors = 0
+
+        if self.target is not None:
+            self._target_session = requests.Session()
+            self._target_session.mount(self.target, HTTPAdapter(pool_maxsize=concurrency))
+
+        async def fire(event: Dict, scheduled: float, executor: ThreadPoolExecutor) -> None:
+            nonlocal errors
+            with self._lock:
+                if self.target is None:
+                    self._sent_by_type[event["event"]].append(scheduled)
+                else:
+                    self._sent_at[event["uuid"]] = scheduled
+            async with semaphore:
+                try:
+                    await loop.run_in_executor(executor, self._send, event)
+                except Exception:
+                    errors += 1
+                    return
+                latencies.append(time.monotonic() - scheduled)
+                counts[event["event"]] += 1
+
+        started = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                tasks = []
+                for index, event in enumerate(events):
+                    scheduled = started + index / rate
+                    delay = scheduled - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    tasks.append(asyncio.ensure_future(fire(event, scheduled, executor)))
+                await asyncio.gather(*tasks)
+        finally:
+            if self._target_session is not None:
+                self._target_session.close()
+        sent = time.monotonic()
+        if drain:
+            await asyncio.sleep(drain)
+        finished = max(sent, self._last_delivery)
+        duration = finished - started
+        return LoadReportModel(
+            sent=len(latencies),
+            errors=errors,
+            duration=duration,
+            throughput=len(latencies) / duration if duration > 0 else 0.0,
+            request_latency=LatencyModel.of(latencies),
+            delivery_latency=LatencyModel.of(self._delivery_latencies),
+            events=dict(counts),
+        )
+
+    def run(self, total: int, rate: float, concurrency: int = 32, drain: float = 0.0) -> LoadReportModel:
+        """
+        Blocking wrapper around ``run_async``.
+        """
+        return asyncio.run(self.run_async(total, rate, concurrency, drain))
@@ -1,4 +1,3 @@
-import requests
 from pydantic import BaseModel
 from typing import Optional, TYPE_CHECKING, List
 
@@ -81,7 +80,8 @@ class Webhooks:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.client.api_key}"
         }
-        response = requests.post(url, headers=headers, json=payload)
+        # Reuse the client's pooled connections instead of a new connection per event
+        response = self.client.session.post(url, headers=headers, json=payload)
         
         return response
 